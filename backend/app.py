@@ -1,11 +1,26 @@
+import logging
 import os
 from flask import Flask, session, request, jsonify, make_response
 from flask_cors import CORS
-from flask_session import Session
-from extensions import db, migrate
+from extensions import db
 from routes import register_blueprints
+from commands import register_commands
+from events import init_events
+from session_store import init_session_store
+from tokens import init_tokens
+from identity import init_identity_cache
+from hashing import DEFAULT_METHOD, init_password_hasher
+from rate_limit import init_rate_limiter
 from decorators import login_required
+from logging_config import configure_logging
+from metrics import init_metrics
+from query_budget import init_query_detector
+from db_profiles import engine_options
+from async_db import init_async_db
 from datetime import timedelta
+from sqlalchemy.engine import make_url
+
+logger = logging.getLogger(__name__)
 
 
 def create_app():
@@ -17,14 +32,76 @@ def create_app():
     """
     app = Flask(__name__)
 
+    # Logging: queued to a background writer; LOG_LEVELS takes "logger=LEVEL,..." overrides
+    app.config.update(
+        LOG_LEVEL=os.environ.get("LOG_LEVEL", "INFO"),
+        LOG_LEVELS=os.environ.get("LOG_LEVELS", ""),
+        LOG_FORMAT=os.environ.get("LOG_FORMAT", "json"),  # "json" or "text"
+        LOG_QUEUE_SIZE=int(os.environ.get("LOG_QUEUE_SIZE", 10000)),  # Records beyond this are dropped
+        LOG_DEBUG_SAMPLE_RATE=float(os.environ.get("LOG_DEBUG_SAMPLE_RATE", 1.0)),  # Share of DEBUG records kept
+    )
+    configure_logging(app)
+
     # Basic configuration
     app.config.update(
         SECRET_KEY="your-secret-key", # Change this in production
-        SESSION_TYPE="filesystem", # Consider using "redis" for production
         PERMANENT_SESSION_LIFETIME=timedelta(days=1),
+        SESSION_PERMANENT=True,
+        SESSION_REFRESH_EACH_REQUEST=False,  # Only write sessions that changed
+    )
+
+    # Session storage: "sql" (shared table) or "cachelib" behind an in-process LRU,
+    # or the legacy Flask-Session "filesystem" store
+    app.config.update(
+        SESSION_BACKEND=os.environ.get("SESSION_BACKEND", "sql"),
+        SESSION_TYPE="filesystem",  # Used by the "filesystem" backend only
         SESSION_FILE_DIR="./flask_session",  # Explicitly set session file location
-        SESSION_FILE_THRESHOLD=500  # Number of sessions stored in memory
+        SESSION_FILE_THRESHOLD=500,  # Number of sessions stored in memory
+        SESSION_LRU_SIZE=int(os.environ.get("SESSION_LRU_SIZE", 10000)),
+        SESSION_LRU_TTL=float(os.environ.get("SESSION_LRU_TTL", 5)),  # Seconds, bounds cross-worker staleness
+        SESSION_SWEEP_EVERY=int(os.environ.get("SESSION_SWEEP_EVERY", 100)),  # Writes between expiry sweeps
+        SESSION_SWEEP_BATCH_SIZE=int(os.environ.get("SESSION_SWEEP_BATCH_SIZE", 500)),
+    )
+
+    # Bearer access tokens; list TOKEN_SECRET_KEYS oldest first to rotate keys
+    token_keys = os.environ.get("TOKEN_SECRET_KEYS")
+    app.config.update(
+        TOKEN_SECRET_KEYS=token_keys.split(",") if token_keys else None,  # Defaults to SECRET_KEY
+        TOKEN_MAX_AGE=int(os.environ.get("TOKEN_MAX_AGE", app.config["PERMANENT_SESSION_LIFETIME"].total_seconds())),
+    )
+    init_tokens(app)
+
+    # Per-process cache of user id/name/email for session checks
+    app.config.update(
+        USER_CACHE_SIZE=int(os.environ.get("USER_CACHE_SIZE", 10000)),
+        USER_CACHE_TTL=float(os.environ.get("USER_CACHE_TTL", 60)),  # Seconds, bounds cross-worker staleness
+    )
+    init_identity_cache(app)
+
+    # Password hashing runs in a process pool; changing the method rehashes on next login
+    hash_workers = int(os.environ.get("PASSWORD_HASH_WORKERS", min(os.cpu_count() or 1, 4)))
+    app.config.update(
+        PASSWORD_HASH_METHOD=os.environ.get("PASSWORD_HASH_METHOD", DEFAULT_METHOD),
+        PASSWORD_HASH_WORKERS=hash_workers,  # 0 hashes on the request thread
+        PASSWORD_HASH_MAX_PENDING=int(os.environ.get("PASSWORD_HASH_MAX_PENDING", hash_workers * 4)),
+        PASSWORD_HASH_TIMEOUT=float(os.environ.get("PASSWORD_HASH_TIMEOUT", 10)),
     )
+    init_password_hasher(app)
+
+    # Admission control for the hashing endpoints: token buckets per client IP and email
+    # ("count/second|minute|hour", empty disables) plus a cap on concurrent requests;
+    # "memory" buckets are per worker, "cachelib" shares them (RATE_LIMIT_CACHELIB)
+    app.config.update(
+        RATE_LIMIT_ENABLED=os.environ.get("RATE_LIMIT_ENABLED", "1") == "1",
+        RATE_LIMIT_BACKEND=os.environ.get("RATE_LIMIT_BACKEND", "memory"),
+        RATE_LIMIT_CACHE_SIZE=int(os.environ.get("RATE_LIMIT_CACHE_SIZE", 100000)),  # Buckets kept per worker
+        RATE_LIMIT_FILE_DIR="./flask_ratelimit",  # cachelib fallback when RATE_LIMIT_CACHELIB is unset
+        RATE_LIMIT_LOGIN_IP=os.environ.get("RATE_LIMIT_LOGIN_IP", "60/minute"),
+        RATE_LIMIT_LOGIN_EMAIL=os.environ.get("RATE_LIMIT_LOGIN_EMAIL", "10/minute"),
+        RATE_LIMIT_REGISTER_IP=os.environ.get("RATE_LIMIT_REGISTER_IP", "10/minute"),
+        RATE_LIMIT_MAX_CONCURRENT=int(os.environ.get("RATE_LIMIT_MAX_CONCURRENT", max(hash_workers, 1) * 4)),
+    )
+    init_rate_limiter(app)
 
     # Cookie configuration for Docker environment
     app.config.update(
@@ -50,14 +127,9 @@ def create_app():
         }
     )
 
-    # Initialize the Flask session
-    Session(app)
+    # Initialize the server-side session store (sessions are permanent via SESSION_PERMANENT)
+    init_session_store(app)
 
-    # Ensure permanent sessions
-    @app.before_request
-    def make_session_permanent():
-        session.permanent = True
-    
     # Apply CORS headers to all responses
     @app.after_request
     def apply_cors_headers(response):
@@ -81,18 +153,50 @@ def create_app():
     database_url = os.environ.get('DATABASE_URL', f'sqlite:///{os.path.join(os.path.dirname(os.path.abspath(__file__)), "site.db")}')
     app.config['SQLALCHEMY_DATABASE_URI'] = database_url
     app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
-    print(f"Database URL: {database_url}")  # Debugging line
+    # Engine profile: "web" (pooled), "pgbouncer" (no client pool), "cli" or "default"
+    app.config['DB_PROFILE'] = os.environ.get('DB_PROFILE', 'web')
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = engine_options(app.config['DB_PROFILE'], database_url, os.environ)
+    logger.info("Database configured", extra={"database_url": make_url(database_url).render_as_string(hide_password=True)})
 
     # Initialize Flask extensions
-    db.init_app(app)
-    migrate.init_app(app, db)
+    db.init_app(app)  # Also applies the profile's SQLite PRAGMAs, see extensions.py
+
+    # Ticket change push channel (SSE); use "database" when running several workers
+    app.config.update(
+        TICKET_EVENTS_BACKEND=os.environ.get("TICKET_EVENTS_BACKEND", "local"),
+        TICKET_EVENTS_HEARTBEAT=float(os.environ.get("TICKET_EVENTS_HEARTBEAT", 15)),
+    )
+    init_events(app)
+
+    # Opt-in async ticket list/create/update views on an AsyncEngine (aiosqlite/asyncpg)
+    app.config["ASYNC_TICKETS"] = os.environ.get("ASYNC_TICKETS", "0") == "1"
+    init_async_db(app)
+
+    # Closed tickets unchanged for this long are moved to ticket_archive by `flask tickets archive`
+    app.config["TICKET_ARCHIVE_AFTER_DAYS"] = int(os.environ.get("TICKET_ARCHIVE_AFTER_DAYS", 90))
 
     # Register blueprints for modular route management
     register_blueprints(app)
 
-    # Debugging: Print all routes
-    for rule in app.url_map.iter_rules():
-        print(f"{rule.endpoint}: {rule.rule}")
+    # Request latency, status and DB time metrics; /api/metrics is off unless enabled,
+    # and then needs `Authorization: Bearer $METRICS_TOKEN`
+    app.config.update(
+        METRICS_ENABLED=os.environ.get("METRICS_ENABLED", "1") == "1",
+        METRICS_ENDPOINT_ENABLED=os.environ.get("METRICS_ENDPOINT_ENABLED", "0") == "1",
+        METRICS_TOKEN=os.environ.get("METRICS_TOKEN"),
+    )
+    init_metrics(app)
+
+    # Staging only: log repeated same-shape statements (suspected N+1) and over-budget requests
+    app.config.update(
+        QUERY_DETECTOR_ENABLED=os.environ.get("QUERY_DETECTOR_ENABLED", "0") == "1",
+        QUERY_REPEAT_THRESHOLD=int(os.environ.get("QUERY_REPEAT_THRESHOLD", 5)),
+        QUERY_BUDGET_PER_REQUEST=int(os.environ.get("QUERY_BUDGET_PER_REQUEST", 0)),  # 0 disables
+    )
+    init_query_detector(app)
+
+    # Register `flask tickets ...` maintenance commands
+    register_commands(app)
 
     @app.route('/')
     def home():
@@ -115,9 +219,7 @@ def create_app():
     # Debugging route to check session state
     @app.route('/api/debug/session', methods=['GET'])
     def debug_session():
-        print("Debug endpoint accessed")
-        print(f"Current session: {dict(session)}")
-        print(f"Request cookies: {dict(request.cookies)}")
+        logger.debug("Debug endpoint accessed")
         return jsonify({
             "session": dict(session),
             "cookies": dict(request.cookies),
@@ -139,18 +241,20 @@ def create_app():
         session.clear()  # Clear all session data
         response = make_response(jsonify({"message": "Session cleared"}))
         response.set_cookie('session', '', expires=0)  # Invalidate the session cookie
-        print("Session cleared manually.")  # Debugging log
+        logger.debug("Session cleared manually")
         return response
 
     return app
 
 
 if __name__ == '__main__':
+    from schema_version import ensure_schema
+
     app = create_app()
     with app.app_context():
-        # Ensure database tables are created
-        db.create_all()
-        print("Database and tables created.")  # Debugging line
+        # Create or migrate the schema only if it is behind the latest revision
+        logger.info("Database schema %s", ensure_schema())
 
-    # Start the Flask development server (listen on all interfaces for Docker)
-    app.run(host='0.0.0.0', debug=True)
+    # Start the Flask development server (listen on all interfaces for Docker).
+    # FLASK_DEBUG=0 skips the reloader, which imports the app a second time.
+    app.run(host='0.0.0.0', debug=os.environ.get('FLASK_DEBUG', '1') == '1')
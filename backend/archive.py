@@ -0,0 +1,114 @@
+"""
+Archival of closed tickets (`flask tickets archive`).
+
+Tickets in a closed status that haven't changed for a configurable age are
+moved from `ticket` to `ticket_archive` in batches, so the hot table and its
+indexes only hold live work. Each batch is one transaction: the rows are
+deleted from `ticket` with RETURNING and the archive rows are written from
+exactly what was deleted, so a failure at any point leaves every ticket in
+one table or the other, never both or neither.
+
+Core deletes bypass the session listeners, so this module does their work
+itself: archived tickets get tombstones (delta-sync clients drop them like
+deletions), leave `ticket_summary`, and are pushed to live SSE subscribers
+as delete events once their batch commits. Search index entries go with
+the rows.
+"""
+from collections import Counter
+from datetime import datetime
+from sqlalchemy import delete, insert, select
+from extensions import db
+from models import Ticket, TicketArchive, TicketTombstone
+from changes import reserve_change_seqs
+from events import encode_event, publish_events
+from summary import CLOSED_STATUSES, apply_summary_deltas, summary_key
+
+DEFAULT_ARCHIVE_AFTER_DAYS = 90
+DEFAULT_BATCH_SIZE = 500
+
+ARCHIVE_COLUMNS = (
+    "id", "name", "description", "created_at", "updated_at", "due_date", "status", "priority",
+    "author_id", "change_seq",
+)
+
+
+def archive_batch(connection, cutoff, statuses, batch_size):
+    """
+    Move one batch of archivable tickets, on `connection`'s transaction.
+
+    On Postgres the candidates are locked with SKIP LOCKED, so tickets being
+    edited right now are left for the next run instead of blocking it.
+
+    Args:
+        connection: A connection inside a transaction.
+        cutoff (datetime): Tickets last updated before this are archived.
+        statuses (tuple): The statuses that may be archived.
+        batch_size (int): The most tickets to move.
+
+    Returns:
+        list: The tombstone rows written, one per ticket moved.
+    """
+    table = Ticket.__table__
+    candidates = (
+        select(table.c.id)
+        .where(table.c.status.in_(statuses), table.c.updated_at < cutoff)
+        .order_by(table.c.id)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    )
+    rows = connection.execute(
+        delete(table)
+        .where(table.c.id.in_(candidates))
+        .returning(*(table.c[name] for name in ARCHIVE_COLUMNS))
+    ).mappings().all()
+    if not rows:
+        return []
+
+    now = datetime.utcnow()
+    connection.execute(insert(TicketArchive.__table__), [dict(row, archived_at=now) for row in rows])
+    seq = reserve_change_seqs(connection, len(rows))
+    tombstones = [
+        {"change_seq": seq + offset, "ticket_id": row["id"], "deleted_at": now}
+        for offset, row in enumerate(rows)
+    ]
+    connection.execute(insert(TicketTombstone.__table__), tombstones)
+    deltas = Counter()
+    for row in rows:
+        deltas[summary_key(row["status"], row["priority"], row["due_date"])] -= 1
+    apply_summary_deltas(connection, deltas)
+    return tombstones
+
+
+def archive_tickets(older_than, statuses=CLOSED_STATUSES, batch_size=DEFAULT_BATCH_SIZE, progress=None):
+    """
+    Archive closed tickets older than `older_than`, one committed batch at a time.
+
+    Must be called inside an application context. Age is measured from the
+    ticket's last update, so a reopened and re-closed ticket starts over.
+
+    Args:
+        older_than (timedelta): How long a ticket must be unchanged.
+        statuses (tuple): The statuses that may be archived.
+        batch_size (int): Tickets moved per transaction.
+        progress (callable): Called with the running total after every batch.
+
+    Returns:
+        int: The number of tickets archived.
+
+    Raises:
+        ValueError: If `batch_size` is less than 1.
+    """
+    if batch_size < 1:
+        raise ValueError("Batch size must be at least 1.")
+    cutoff = datetime.utcnow() - older_than
+    total = 0
+    while True:
+        with db.engine.begin() as connection:
+            tombstones = archive_batch(connection, cutoff, tuple(statuses), batch_size)
+        publish_events([encode_event(row["change_seq"], TicketTombstone(**row)) for row in tombstones])
+        moved = len(tombstones)
+        total += moved
+        if progress and moved:
+            progress(total)
+        if moved < batch_size:
+            return total
@@ -0,0 +1,104 @@
+"""
+Opt-in async database access (`ASYNC_TICKETS=1`).
+
+Async views run on one long-lived event loop in a background thread rather
+than on a fresh loop per request, so the `AsyncEngine` connection pool
+(asyncpg connections are bound to their loop) is shared by every request in
+the worker. The request thread waits on the loop; Flask's app and request
+contexts are carried over, so `request`, `g` and `current_app` work inside
+the coroutines as usual.
+
+Requires `aiosqlite` for SQLite or `asyncpg` for PostgreSQL.
+"""
+import asyncio
+import os
+import threading
+from flask import current_app
+from sqlalchemy.engine import make_url
+from db_profiles import engine_options, install_sqlite_pragmas
+
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+class LoopThread:
+    """An asyncio event loop running forever in a daemon thread."""
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self.loop.run_forever, name="async-db-loop", daemon=True)
+        self._thread.start()
+
+    def run(self, coroutine):
+        """
+        Run `coroutine` on the loop and block until it finishes.
+
+        The caller's context variables (Flask's app and request contexts)
+        are copied into the task.
+        """
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result()
+
+    def async_to_sync(self, func):
+        """Drop-in for `Flask.async_to_sync` that runs views on this loop."""
+        def run(*args, **kwargs):
+            return self.run(func(*args, **kwargs))
+        return run
+
+
+def async_database_url(database_url):
+    """
+    Swap the driver of a sync database URL for its async counterpart.
+
+    Raises:
+        ValueError: If the database has no supported async driver.
+    """
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for {backend}")
+    return url.set(drivername=ASYNC_DRIVERS[backend])
+
+
+def init_async_db(app):
+    """
+    Create the async engine, session factory and loop for `app`.
+
+    Does nothing unless `ASYNC_TICKETS` is set. Uses the same engine profile
+    (`DB_PROFILE`) as the sync engine.
+
+    Args:
+        app (Flask): The Flask application instance.
+    """
+    if not app.config["ASYNC_TICKETS"]:
+        return
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+    from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+    database_url = app.config["SQLALCHEMY_DATABASE_URI"]
+    options = engine_options(app.config["DB_PROFILE"], database_url, os.environ)
+    url = async_database_url(database_url)
+    if url.get_backend_name() == "postgresql" and app.config["DB_PROFILE"] == "pgbouncer":
+        # PgBouncer transaction pooling can't keep asyncpg's prepared statements
+        url = url.update_query_dict({"prepared_statement_cache_size": "0"})
+        options["connect_args"] = {"statement_cache_size": 0}
+    if url.get_backend_name() == "sqlite" and url.database not in (None, "", ":memory:"):
+        # aiosqlite defaults to NullPool: a new connection and thread per session
+        options.setdefault("poolclass", AsyncAdaptedQueuePool)
+
+    engine = create_async_engine(url, **options)
+    install_sqlite_pragmas(engine.sync_engine, app.config["DB_PROFILE"])
+
+    loop_thread = LoopThread()
+    app.extensions["async_db"] = {
+        "engine": engine,
+        "sessionmaker": async_sessionmaker(engine, expire_on_commit=False),
+        "loop": loop_thread,
+    }
+    app.async_to_sync = loop_thread.async_to_sync
+
+
+def async_session():
+    """Return a new `AsyncSession`, for use as `async with async_session() as session:`."""
+    return current_app.extensions["async_db"]["sessionmaker"]()
@@ -0,0 +1,7 @@
+"""
+Performance tooling for the Dash backend.
+
+Each module is a standalone script, run from the `backend/` directory with
+`python -m benchmarks.<name> --help`. Point `--database-url` at a scratch
+database: the scripts create tables and seed data.
+"""
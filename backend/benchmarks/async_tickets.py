@@ -0,0 +1,110 @@
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import threading
+import time
+
+from sqlalchemy import event
+
+
+def add_latency(app, latency):
+    """Delay every ticket statement by `latency` seconds, as a remote database would."""
+    from extensions import db
+
+    if app.config["ASYNC_TICKETS"]:
+        from sqlalchemy.util import await_only
+
+        engine = app.extensions["async_db"]["engine"].sync_engine
+
+        def delay(conn, cursor, statement, parameters, context, executemany):
+            # Yields to the event loop like a real network round trip
+            await_only(asyncio.sleep(latency))
+    else:
+        engine = db.engine
+
+        def delay(conn, cursor, statement, parameters, context, executemany):
+            time.sleep(latency)
+
+    event.listen(engine, "before_cursor_execute", delay)
+
+
+def run_mode(mode, database_url, threads, requests, latency):
+    """
+    Drive a list-heavy ticket workload with the sync or async views.
+
+    Each client logs in, then issues `requests` calls: every tenth creates a
+    ticket, the rest fetch a page of tickets.
+
+    Returns:
+        dict: Requests per second, p95 latency in ms and failed (5xx) requests.
+    """
+    os.environ["ASYNC_TICKETS"] = "1" if mode == "async" else "0"
+    os.environ["DATABASE_URL"] = database_url
+    from app import create_app
+    from extensions import db
+    from benchmarks.seed import seed
+
+    app = create_app()
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+        seed(threads, 2000)
+        add_latency(app, latency)
+
+    timings = []
+    failures = []
+
+    def client_loop(index):
+        client = app.test_client()
+        client.post("/api/users/login", json={"email": f"user{index}@example.com", "password": "Password123"})
+        for i in range(requests):
+            started = time.perf_counter()
+            if i % 10 == 0:
+                response = client.post("/api/tickets", json={
+                    "name": f"Load {index}-{i}", "description": "async benchmark", "author_id": index + 1,
+                })
+            else:
+                response = client.get("/api/tickets?limit=50")
+            timings.append(time.perf_counter() - started)
+            if response.status_code >= 500:
+                failures.append(response.status_code)
+
+    workers = [threading.Thread(target=client_loop, args=(i,)) for i in range(threads)]
+    started = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    wall = time.perf_counter() - started
+
+    with app.app_context():
+        db.engine.dispose()
+    return {
+        "requests_per_second": threads * requests / wall,
+        "p95_ms": statistics.quantiles(timings, n=20)[-1] * 1e3,
+        "failures": len(failures),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the sync and async ticket views under concurrent load.")
+    parser.add_argument("--database-url", help="Scratch database URL; defaults to a temporary SQLite file per mode.")
+    parser.add_argument("--threads", type=int, default=6, help="Concurrent clients (logins take two sync connections each).")
+    parser.add_argument("--requests", type=int, default=50, help="Requests per client.")
+    parser.add_argument("--latency-ms", type=float, default=5.0, help="Injected delay per SQL statement.")
+    options = parser.parse_args()
+    # Hash the seed password inline; the pool is not what is being measured
+    os.environ.setdefault("PASSWORD_HASH_WORKERS", "0")
+
+    with tempfile.TemporaryDirectory() as workdir:
+        for mode in ("sync", "async"):
+            database_url = options.database_url or f"sqlite:///{os.path.join(workdir, f'{mode}.db')}"
+            result = run_mode(mode, database_url, options.threads, options.requests, options.latency_ms / 1e3)
+            print(f"{mode:6s} {result['requests_per_second']:8,.0f} req/s  "
+                  f"p95 {result['p95_ms']:7.1f} ms  {result['failures']:5d} failed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+import argparse
+import json
+import os
+import sys
+from werkzeug.datastructures import MultiDict
+
+# Query-string arguments for the list requests the board issues most often.
+# Each is turned into SQL by the same builder the endpoint uses.
+HOT_QUERIES = {
+    "first page": {},
+    "next page": {"cursor": ("2024-01-05T00:00:00", 5000)},
+    "by status": {"status": "In Progress"},
+    "by priority": {"priority": "High"},
+    "by author": {"author_id": "3"},
+    "by status and author": {"status": "Blocked", "author_id": "3"},
+    "due date range": {"due_after": "2024-01-10", "due_before": "2024-01-12"},
+}
+
+
+def hot_statements():
+    """Yield `(name, statement)` for every hot ticket list query."""
+    from queries import encode_cursor, ticket_page_query
+    from datetime import datetime
+
+    for name, raw_args in HOT_QUERIES.items():
+        args = dict(raw_args)
+        if "cursor" in args:
+            created_at, ticket_id = args["cursor"]
+            args["cursor"] = encode_cursor(datetime.fromisoformat(created_at), ticket_id)
+        statement, _ = ticket_page_query(MultiDict(args))
+        yield name, statement
+
+
+def _driver_sql(statement, dialect):
+    compiled = statement.compile(dialect=dialect, compile_kwargs={"render_postcompile": True})
+    if compiled.positiontup is not None:
+        params = tuple(compiled.params[key] for key in compiled.positiontup)
+    else:
+        params = compiled.params
+    return str(compiled), params
+
+
+def sequential_scans(connection, statement):
+    """
+    Explain a statement and return the plan lines that scan `ticket` without an index.
+
+    Args:
+        connection: An open SQLAlchemy connection.
+        statement: The SQLAlchemy statement to explain.
+
+    Returns:
+        tuple: `(offending plan lines, full plan text)`.
+    """
+    dialect = connection.dialect
+    sql, params = _driver_sql(statement, dialect)
+
+    if dialect.name == "postgresql":
+        plan = connection.exec_driver_sql("EXPLAIN (FORMAT JSON) " + sql, params).scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        offending, stack = [], [plan[0]["Plan"]]
+        while stack:
+            node = stack.pop()
+            if node["Node Type"] == "Seq Scan" and node.get("Relation Name") == "ticket":
+                offending.append(f"Seq Scan on ticket (filter: {node.get('Filter', '-')})")
+            stack.extend(node.get("Plans", []))
+        return offending, json.dumps(plan, indent=2)
+
+    if dialect.name == "sqlite":
+        rows = connection.exec_driver_sql("EXPLAIN QUERY PLAN " + sql, params).fetchall()
+        details = [row[-1] for row in rows]
+        offending = [d for d in details if d.startswith("SCAN ticket") and "INDEX" not in d]
+        return offending, "\n".join(details)
+
+    raise SystemExit(f"Unsupported dialect for plan checks: {dialect.name}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Fail if any hot ticket list query plans a sequential scan on `ticket`."
+    )
+    parser.add_argument("--database-url", required=True, help="A scratch database; it will be seeded.")
+    parser.add_argument("--tickets", type=int, default=20000)
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--no-seed", action="store_true", help="Explain against the existing data.")
+    parser.add_argument("--verbose", action="store_true", help="Print every plan.")
+    options = parser.parse_args()
+
+    os.environ["DATABASE_URL"] = options.database_url
+    from app import create_app
+    from extensions import db
+    from models import Ticket
+    from benchmarks.seed import seed
+
+    app = create_app()
+    failures = 0
+    with app.app_context():
+        db.create_all()
+        if not options.no_seed:
+            if db.session.query(Ticket.id).first() is not None:
+                raise SystemExit("Refusing to seed a database that already has tickets (use --no-seed).")
+            seed(options.users, options.tickets)
+
+        with db.engine.connect() as connection:
+            connection.exec_driver_sql("ANALYZE")
+            for name, statement in hot_statements():
+                offending, plan = sequential_scans(connection, statement)
+                status = "FAIL" if offending else "ok"
+                print(f"[{status}] {name}")
+                for line in offending:
+                    print(f"       {line}")
+                if options.verbose or offending:
+                    print(plan)
+                failures += bool(offending)
+
+    if failures:
+        print(f"{failures} hot quer{'y' if failures == 1 else 'ies'} fell back to a sequential scan.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+import argparse
+import os
+import tempfile
+import threading
+import time
+
+from db_profiles import PROFILES
+
+
+def run_profile(profile, database_url, threads, requests, write_ratio):
+    """
+    Drive a mixed read/write ticket workload through one engine profile.
+
+    Each client logs in, then issues `requests` calls: a `write_ratio`
+    fraction create a ticket, the rest fetch a page of tickets.
+
+    Returns:
+        dict: Requests per second and the number of failed (5xx) requests.
+    """
+    os.environ["DB_PROFILE"] = profile
+    os.environ["DATABASE_URL"] = database_url
+    from app import create_app
+    from extensions import db
+    from benchmarks.seed import seed
+
+    app = create_app()
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+        seed(threads, 2000)
+
+    write_every = int(1 / write_ratio) if write_ratio else 0
+    failures = []
+
+    def client_loop(index):
+        client = app.test_client()
+        client.post("/api/users/login", json={"email": f"user{index}@example.com", "password": "Password123"})
+        for i in range(requests):
+            if write_every and i % write_every == 0:
+                response = client.post("/api/tickets", json={
+                    "name": f"Load {index}-{i}", "description": "db profile benchmark", "author_id": index + 1,
+                })
+            else:
+                response = client.get("/api/tickets?limit=50")
+            if response.status_code >= 500:
+                failures.append(response.status_code)
+
+    workers = [threading.Thread(target=client_loop, args=(i,)) for i in range(threads)]
+    started = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    wall = time.perf_counter() - started
+
+    with app.app_context():
+        db.engine.dispose()
+    return {"requests_per_second": threads * requests / wall, "failures": len(failures)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare engine profiles under concurrent load.")
+    parser.add_argument("--database-url", help="Scratch PostgreSQL URL; defaults to a temporary SQLite file per profile.")
+    parser.add_argument("--threads", type=int, default=8, help="Concurrent clients.")
+    parser.add_argument("--requests", type=int, default=200, help="Requests per client.")
+    parser.add_argument("--write-ratio", type=float, default=0.2, help="Share of requests that create a ticket.")
+    parser.add_argument("--profiles", nargs="+", default=list(PROFILES), choices=list(PROFILES))
+    options = parser.parse_args()
+    # Hash the seed password inline; the pool is not what is being measured
+    os.environ.setdefault("PASSWORD_HASH_WORKERS", "0")
+
+    with tempfile.TemporaryDirectory() as workdir:
+        for profile in options.profiles:
+            # A fresh SQLite file per profile: WAL mode persists in the file
+            database_url = options.database_url or f"sqlite:///{os.path.join(workdir, f'{profile}.db')}"
+            result = run_profile(profile, database_url, options.threads, options.requests, options.write_ratio)
+            print(f"{profile:10s} {result['requests_per_second']:8,.0f} req/s  {result['failures']:5d} failed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,270 @@
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter, defaultdict
+
+from benchmarks.login import percentile
+from benchmarks.seed import PRIORITIES, SEED_PASSWORD, STATUSES
+
+# Relative weights of each scenario in the request mix.
+DEFAULT_MIX = {
+    "list": 45,
+    "session": 20,
+    "create": 12,
+    "update": 12,
+    "delete": 6,
+    "login": 5,
+}
+
+EXPECTED_STATUS = {
+    "list": 200,
+    "session": 200,
+    "create": 201,
+    "update": 200,
+    "delete": 200,
+    "login": 200,
+}
+
+
+def parse_mix(raw):
+    """Parse `list=45,create=10,...`; scenarios left out are not run."""
+    mix = {}
+    for part in raw.split(","):
+        name, _, weight = part.partition("=")
+        if name not in DEFAULT_MIX:
+            raise argparse.ArgumentTypeError(f"Unknown scenario {name!r}; choose from {', '.join(DEFAULT_MIX)}.")
+        mix[name] = int(weight)
+    return mix
+
+
+class Client:
+    """One simulated user: a logged-in test client plus the tickets it created."""
+
+    def __init__(self, app, index, n_users, rng_seed, ticket_ids):
+        self.app = app
+        self.rng = random.Random(rng_seed + index)
+        self.email = f"user{index % n_users}@example.com"
+        self.author_id = index % n_users + 1
+        self.ticket_ids = ticket_ids
+        self.created = []
+        self.http = app.test_client()
+        response = self.http.post("/api/users/login", json={"email": self.email, "password": SEED_PASSWORD})
+        assert response.status_code == 200, response.status_code
+
+    def ticket_body(self):
+        return {
+            "name": f"Load ticket {self.rng.randrange(10**6)}",
+            "description": "Created by the load benchmark",
+            "status": self.rng.choice(STATUSES),
+            "priority": self.rng.choice(PRIORITIES),
+            "author_id": self.author_id,
+        }
+
+    def run(self, scenario):
+        """Issue one request for `scenario`; returns `(scenario, status)`."""
+        if scenario == "delete" and not self.created:
+            scenario = "create"
+        if scenario == "list":
+            status = self.rng.choice([None, None, "Pending", "In Progress"])
+            return scenario, self.http.get("/api/tickets", query_string={"limit": 50, "status": status}).status_code
+        if scenario == "session":
+            return scenario, self.http.get("/api/users/session").status_code
+        if scenario == "create":
+            response = self.http.post("/api/tickets", json=self.ticket_body())
+            if response.status_code == 201:
+                self.created.append(response.get_json()["id"])
+            return scenario, response.status_code
+        if scenario == "update":
+            ticket_id = self.rng.choice(self.ticket_ids)
+            changes = {"status": self.rng.choice(STATUSES), "priority": self.rng.choice(PRIORITIES)}
+            return scenario, self.http.put(f"/api/tickets/{ticket_id}", json=changes).status_code
+        if scenario == "delete":
+            ticket_id = self.created.pop(self.rng.randrange(len(self.created)))
+            return scenario, self.http.delete(f"/api/tickets/{ticket_id}").status_code
+        # A fresh client, so the login doesn't replace this client's session
+        response = self.app.test_client().post(
+            "/api/users/login", json={"email": self.email, "password": SEED_PASSWORD},
+        )
+        return scenario, response.status_code
+
+
+def summarize(latencies, statuses, scenario, seconds):
+    """Throughput, latency percentiles and errors for one scenario's samples."""
+    errors = sum(count for status, count in statuses.items() if status != EXPECTED_STATUS.get(scenario, status))
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "statuses": {str(status): count for status, count in sorted(statuses.items())},
+        "throughput_rps": len(latencies) / seconds,
+        "p50_ms": percentile(latencies, 0.50) * 1e3,
+        "p95_ms": percentile(latencies, 0.95) * 1e3,
+        "p99_ms": percentile(latencies, 0.99) * 1e3,
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(options, database_url):
+    """
+    Seed a database and drive the scenario mix against `create_app()`.
+
+    Every client thread picks scenarios by weight from its own seeded random
+    generator. Requests that start during the warmup are not recorded.
+
+    Returns:
+        dict: The run's configuration, overall and per-scenario results.
+    """
+    os.environ["DATABASE_URL"] = database_url
+    os.environ.setdefault("RATE_LIMIT_ENABLED", "0")  # Every client shares one IP
+    from sqlalchemy import select
+    from app import create_app
+    from extensions import db
+    from models import Ticket
+    from benchmarks.seed import seed
+
+    app = create_app()
+    with app.app_context():
+        if options.reseed:
+            db.drop_all()
+            db.create_all()
+            seed(options.users, options.tickets, rng_seed=options.seed)
+        ticket_ids = db.session.execute(select(Ticket.id)).scalars().all()
+        n_users = options.users
+    if not ticket_ids:
+        raise SystemExit("The database has no tickets; run with --reseed.")
+
+    scenarios, weights = zip(*options.mix.items())
+    samples = defaultdict(list)
+    statuses = defaultdict(Counter)
+    lock = threading.Lock()
+    clients = [Client(app, i, n_users, options.seed, ticket_ids) for i in range(options.threads)]
+
+    started = time.perf_counter()
+    measure_from = started + options.warmup
+    stop_at = measure_from + options.duration
+
+    def client_loop(client):
+        while True:
+            request_started = time.perf_counter()
+            if request_started >= stop_at:
+                return
+            scenario, status = client.run(client.rng.choices(scenarios, weights)[0])
+            elapsed = time.perf_counter() - request_started
+            if request_started >= measure_from:
+                with lock:
+                    samples[scenario].append(elapsed)
+                    statuses[scenario][status] += 1
+
+    workers = [threading.Thread(target=client_loop, args=(client,)) for client in clients]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    measured = time.perf_counter() - measure_from
+
+    with app.app_context():
+        db.engine.dispose()
+
+    all_latencies = [latency for values in samples.values() for latency in values]
+    all_statuses = Counter()
+    errors = 0
+    results = {}
+    for scenario in scenarios:
+        results[scenario] = summarize(samples[scenario], statuses[scenario], scenario, measured)
+        all_statuses.update(statuses[scenario])
+        errors += results[scenario]["errors"]
+    total = summarize(all_latencies, all_statuses, None, measured)
+    total["errors"] = errors
+
+    return {
+        "commit": git_commit(),
+        "config": {
+            "database": database_url.split(":", 1)[0],
+            "db_profile": app.config["DB_PROFILE"],
+            "async_tickets": app.config["ASYNC_TICKETS"],
+            "users": options.users,
+            "tickets": len(ticket_ids),
+            "threads": options.threads,
+            "duration_s": options.duration,
+            "warmup_s": options.warmup,
+            "seed": options.seed,
+            "mix": options.mix,
+        },
+        "measured_s": measured,
+        "total": total,
+        "scenarios": results,
+    }
+
+
+def compare(before_path, after_path):
+    """Print throughput and p95 changes between two saved runs."""
+    with open(before_path) as before_file, open(after_path) as after_file:
+        before, after = json.load(before_file), json.load(after_file)
+    print(f"{before['commit'] or before_path} -> {after['commit'] or after_path}")
+    rows = [("total", before["total"], after["total"])]
+    rows += [
+        (name, before["scenarios"][name], after["scenarios"][name])
+        for name in after["scenarios"] if name in before["scenarios"]
+    ]
+    for name, old, new in rows:
+        rps_change = (new["throughput_rps"] / old["throughput_rps"] - 1) * 100 if old["throughput_rps"] else 0.0
+        p95_change = (new["p95_ms"] / old["p95_ms"] - 1) * 100 if old["p95_ms"] else 0.0
+        print(f"{name:8s} {old['throughput_rps']:8.1f} -> {new['throughput_rps']:8.1f} req/s ({rps_change:+6.1f}%)  "
+              f"p95 {old['p95_ms']:7.1f} -> {new['p95_ms']:7.1f} ms ({p95_change:+6.1f}%)")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Run a seeded, concurrent read/write scenario mix against the API and report JSON results.",
+    )
+    parser.add_argument("--database-url", help="Scratch database URL; defaults to a temporary SQLite file.")
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--tickets", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=42, help="Seeds both the data and each client's request choices.")
+    parser.add_argument("--no-reseed", dest="reseed", action="store_false",
+                        help="Reuse the tickets already in --database-url instead of recreating them.")
+    parser.add_argument("--threads", type=int, default=6, help="Concurrent clients.")
+    parser.add_argument("--duration", type=float, default=20.0, help="Measured seconds.")
+    parser.add_argument("--warmup", type=float, default=3.0, help="Unrecorded seconds before measuring.")
+    parser.add_argument("--mix", type=parse_mix, default=DEFAULT_MIX,
+                        help="Scenario weights, e.g. list=45,session=20,create=12,update=12,delete=6,login=5.")
+    parser.add_argument("--output", help="Write the JSON results to this file instead of stdout.")
+    parser.add_argument("--compare", nargs=2, metavar=("BEFORE", "AFTER"),
+                        help="Compare two saved result files instead of running.")
+    options = parser.parse_args()
+
+    if options.compare:
+        compare(*options.compare)
+        return
+
+    with tempfile.TemporaryDirectory() as workdir:
+        database_url = options.database_url or f"sqlite:///{os.path.join(workdir, 'load.db')}"
+        if not options.database_url:
+            options.reseed = True
+        results = run(options, database_url)
+
+    if options.output:
+        with open(options.output, "w") as output:
+            json.dump(results, output, indent=2)
+        total = results["total"]
+        print(f"{total['throughput_rps']:.1f} req/s  p50 {total['p50_ms']:.1f} ms  p95 {total['p95_ms']:.1f} ms  "
+              f"p99 {total['p99_ms']:.1f} ms  {total['errors']} errors -> {options.output}", file=sys.stderr)
+    else:
+        print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+import argparse
+import os
+import tempfile
+import threading
+import time
+
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)] if ordered else 0.0
+
+
+def run(workers, database_url, threads, logins, method, admission=False):
+    """
+    Run a login burst with password hashing on `workers` pool processes (0 = inline).
+
+    `threads` clients log in `logins` times each while one extra client
+    polls `/api/users/session`, to show how much the burst slows down
+    requests that do no hashing at all.
+
+    Returns:
+        dict: Login throughput and latencies, rejected (429/503) count, and
+        session probe p95.
+    """
+    os.environ["DATABASE_URL"] = database_url
+    os.environ["PASSWORD_HASH_WORKERS"] = str(workers)
+    os.environ["PASSWORD_HASH_METHOD"] = method
+    # Every client shares one IP, so the per-IP limit only makes sense when asked for
+    os.environ["RATE_LIMIT_ENABLED"] = "1" if admission else "0"
+    from app import create_app
+    from extensions import db
+    from benchmarks.seed import seed
+
+    app = create_app()
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+        seed(threads, 0)
+
+    login_latencies, probe_latencies, rejected = [], [], []
+    done = threading.Event()
+
+    def login_loop(index):
+        client = app.test_client()
+        body = {"email": f"user{index}@example.com", "password": "Password123"}
+        for _ in range(logins):
+            started = time.perf_counter()
+            response = client.post("/api/users/login", json=body)
+            login_latencies.append(time.perf_counter() - started)
+            if response.status_code in (429, 503):
+                rejected.append(1)
+
+    def probe_loop():
+        client = app.test_client()
+        client.post("/api/users/login", json={"email": "user0@example.com", "password": "Password123"})
+        while not done.is_set():
+            started = time.perf_counter()
+            client.get("/api/users/session")
+            probe_latencies.append(time.perf_counter() - started)
+            time.sleep(0.005)
+
+    probe = threading.Thread(target=probe_loop)
+    probe.start()
+    time.sleep(0.2)  # let the probe log in before the burst starts
+    clients = [threading.Thread(target=login_loop, args=(i,)) for i in range(threads)]
+    wall_started = time.perf_counter()
+    for client in clients:
+        client.start()
+    for client in clients:
+        client.join()
+    wall = time.perf_counter() - wall_started
+    done.set()
+    probe.join()
+    app.extensions["password_hasher"].shutdown()
+
+    return {
+        "logins_per_second": len(login_latencies) / wall,
+        "login_p50_ms": percentile(login_latencies, 0.50) * 1e3,
+        "login_p95_ms": percentile(login_latencies, 0.95) * 1e3,
+        "rejected": len(rejected),
+        "probe_p95_ms": percentile(probe_latencies, 0.95) * 1e3,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure login throughput under concurrency.")
+    parser.add_argument("--threads", type=int, default=8, help="Concurrent login clients.")
+    parser.add_argument("--logins", type=int, default=10, help="Logins per client.")
+    parser.add_argument("--workers", type=int, nargs="+", default=[0, 2, 4], help="Pool sizes to compare (0 = inline).")
+    parser.add_argument("--method", default="scrypt:32768:8:1", help="PASSWORD_HASH_METHOD to use.")
+    parser.add_argument("--admission", action="store_true",
+                        help="Enable rate limiting and the concurrency cap on login (RATE_LIMIT_*).")
+    options = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        database_url = f"sqlite:///{os.path.join(workdir, 'bench.db')}"
+        for workers in options.workers:
+            result = run(workers, database_url, options.threads, options.logins, options.method, options.admission)
+            print(f"workers={workers:<2d} {result['logins_per_second']:7.1f} logins/s  "
+                  f"p50 {result['login_p50_ms']:7.1f} ms  p95 {result['login_p95_ms']:7.1f} ms  "
+                  f"rejected {result['rejected']:3d}  session probe p95 {result['probe_p95_ms']:6.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
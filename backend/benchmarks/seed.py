@@ -0,0 +1,87 @@
+import argparse
+import os
+import random
+from datetime import datetime, timedelta
+
+STATUSES = ["Pending", "In Progress", "Completed", "Blocked"]
+PRIORITIES = ["Low", "Medium", "High"]
+SEED_PASSWORD = "Password123"
+
+
+def seed(n_users, n_tickets, rng_seed=42, chunk_size=1000):
+    """
+    Seed users and tickets through the models layer.
+
+    Must be called inside an application context. All users share one
+    password (`SEED_PASSWORD`) so the hash is computed once. User `i` has
+    the email `user{i}@example.com`.
+
+    Args:
+        n_users (int): Number of users to create.
+        n_tickets (int): Number of tickets to create, spread across users.
+        rng_seed (int): Seed for the random generator, for reproducible data.
+        chunk_size (int): Rows added per flush/commit.
+
+    Returns:
+        list: The ids of the created users.
+    """
+    from extensions import db
+    from models import User, Ticket
+
+    rng = random.Random(rng_seed)
+    template = User(name="template", email="template@example.com")
+    template.set_password(SEED_PASSWORD)
+
+    users = []
+    for i in range(n_users):
+        user = User(name=f"User {i}", email=f"user{i}@example.com", password_hash=template.password_hash)
+        users.append(user)
+    db.session.add_all(users)
+    db.session.commit()
+    user_ids = [user.id for user in users]
+
+    start = datetime(2024, 1, 1)
+    for offset in range(0, n_tickets, chunk_size):
+        batch = []
+        for i in range(offset, min(offset + chunk_size, n_tickets)):
+            created_at = start + timedelta(minutes=i, seconds=rng.randint(0, 59))
+            due_date = created_at + timedelta(days=rng.randint(-10, 60)) if rng.random() < 0.7 else None
+            batch.append(Ticket(
+                name=f"Ticket {i}",
+                description=f"Seeded ticket {i} " + rng.choice(["bug", "feature", "chore", "support"]),
+                created_at=created_at,
+                due_date=due_date.replace(hour=0, minute=0, second=0) if due_date else None,
+                status=rng.choice(STATUSES),
+                priority=rng.choice(PRIORITIES),
+                author_id=rng.choice(user_ids) if user_ids else None,
+            ))
+        db.session.add_all(batch)
+        db.session.commit()
+
+    return user_ids
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Seed a scratch database with users and tickets.")
+    parser.add_argument("--database-url", required=True)
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--tickets", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--reset", action="store_true", help="Drop all tables first.")
+    options = parser.parse_args()
+
+    os.environ["DATABASE_URL"] = options.database_url
+    from app import create_app
+    from extensions import db
+
+    app = create_app()
+    with app.app_context():
+        if options.reset:
+            db.drop_all()
+        db.create_all()
+        seed(options.users, options.tickets, rng_seed=options.seed)
+    print(f"Seeded {options.users} users and {options.tickets} tickets.")
+
+
+if __name__ == "__main__":
+    main()
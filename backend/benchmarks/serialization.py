@@ -0,0 +1,99 @@
+import argparse
+import json
+import time
+from datetime import datetime, timedelta
+
+
+def legacy_serialize(ticket):
+    """The dict + strftime serializer the ticket routes used before msgspec."""
+    return {
+        "id": ticket.id,
+        "name": ticket.name,
+        "description": ticket.description,
+        "created_at": ticket.created_at.strftime("%Y-%m-%d %H:%M:%S") if ticket.created_at else None,
+        "due_date": ticket.due_date.strftime("%Y-%m-%d") if ticket.due_date else None,
+        "status": ticket.status,
+        "priority": ticket.priority,
+        "author_id": ticket.author_id,
+    }
+
+
+def make_tickets(count):
+    """Build transient Ticket instances; no database is needed."""
+    from models import Ticket
+
+    start = datetime(2024, 1, 1)
+    return [
+        Ticket(
+            id=i,
+            name=f"Ticket {i}",
+            description="A moderately sized description for a seeded ticket " * 3,
+            created_at=start + timedelta(minutes=i),
+            due_date=start + timedelta(days=i % 90) if i % 3 else None,
+            status="In Progress",
+            priority="Medium",
+            author_id=i % 50,
+        )
+        for i in range(count)
+    ]
+
+
+def best_of(repeat, fn):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare ticket serialization throughput.")
+    parser.add_argument("--tickets", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    options = parser.parse_args()
+
+    import msgspec
+    from app import create_app
+    from schemas import TicketCreate, TicketOut, encoder
+
+    app = create_app()
+    tickets = make_tickets(options.tickets)
+    bodies = [
+        json.dumps({"name": t.name, "description": t.description, "status": t.status,
+                    "priority": t.priority, "due_date": "2024-05-01"}).encode()
+        for t in tickets
+    ]
+    decoder = msgspec.json.Decoder(TicketCreate)
+
+    def legacy_encode():
+        # jsonify goes through the app's JSON provider, which is stdlib json.
+        app.json.dumps([legacy_serialize(t) for t in tickets])
+
+    def msgspec_encode():
+        encoder.encode([TicketOut.from_model(t) for t in tickets])
+
+    def legacy_decode():
+        for body in bodies:
+            data = json.loads(body)
+            if data.get("name"):
+                datetime.strptime(data["due_date"], "%Y-%m-%d")
+
+    def msgspec_decode():
+        for body in bodies:
+            decoder.decode(body)
+
+    with app.app_context():
+        results = {
+            "encode legacy (dict + strftime + json)": best_of(options.repeat, legacy_encode),
+            "encode msgspec (TicketOut)": best_of(options.repeat, msgspec_encode),
+            "decode legacy (json.loads + strptime)": best_of(options.repeat, legacy_decode),
+            "decode msgspec (TicketCreate)": best_of(options.repeat, msgspec_decode),
+        }
+
+    for name, seconds in results.items():
+        print(f"{name:42s} {options.tickets / seconds:12,.0f} tickets/s  ({seconds * 1000:.1f} ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+import argparse
+import os
+import tempfile
+import threading
+import time
+
+BACKENDS = ["filesystem", "sql", "cachelib"]
+
+
+def run_backend(backend, database_url, requests, threads, write_ratio):
+    """
+    Time authenticated requests against one session backend.
+
+    Each client logs in once, then issues `requests` calls to a route that
+    reads the session; a `write_ratio` fraction of them also modify it.
+
+    Returns:
+        dict: Requests per second and mean latency in microseconds.
+    """
+    os.environ["SESSION_BACKEND"] = backend
+    os.environ["DATABASE_URL"] = database_url
+    from flask import session
+    from app import create_app
+    from extensions import db
+    from benchmarks.seed import seed
+
+    app = create_app()
+
+    def session_probe():
+        session.get("user_id")
+        if session.get("writes_due", 0) > 0:
+            session["writes_due"] -= 1
+        return "ok"
+
+    def session_write():
+        session["writes_due"] = 1
+        return "ok"
+
+    app.add_url_rule("/bench/session", "bench_session", session_probe)
+    app.add_url_rule("/bench/session/write", "bench_session_write", session_write)
+
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+        seed(threads, 0)
+
+    write_every = int(1 / write_ratio) if write_ratio else 0
+
+    def client_loop(index, timings):
+        client = app.test_client()
+        response = client.post("/api/users/login", json={"email": f"user{index}@example.com", "password": "Password123"})
+        assert response.status_code == 200, response.get_json()
+        started = time.perf_counter()
+        for i in range(requests):
+            if write_every and i % write_every == 0:
+                client.get("/bench/session/write")
+            else:
+                client.get("/bench/session")
+        timings.append(time.perf_counter() - started)
+
+    timings = []
+    workers = [threading.Thread(target=client_loop, args=(i, timings)) for i in range(threads)]
+    wall_started = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    wall = time.perf_counter() - wall_started
+
+    total = requests * threads
+    return {"requests_per_second": total / wall, "mean_latency_us": sum(timings) / total * 1e6}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare session store throughput.")
+    parser.add_argument("--requests", type=int, default=2000, help="Requests per client.")
+    parser.add_argument("--threads", type=int, default=4, help="Concurrent clients.")
+    parser.add_argument("--write-ratio", type=float, default=0.05, help="Share of requests that modify the session.")
+    parser.add_argument("--backends", nargs="+", default=BACKENDS, choices=BACKENDS)
+    options = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        # The filesystem store writes to ./flask_session
+        os.chdir(workdir)
+        database_url = f"sqlite:///{os.path.join(workdir, 'bench.db')}"
+        for backend in options.backends:
+            result = run_backend(backend, database_url, options.requests, options.threads, options.write_ratio)
+            print(f"{backend:12s} {result['requests_per_second']:10,.0f} req/s  "
+                  f"{result['mean_latency_us']:8.0f} us/request")
+
+
+if __name__ == "__main__":
+    main()
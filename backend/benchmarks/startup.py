@@ -0,0 +1,60 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Runs in a fresh interpreter per sample so every measurement is a cold start.
+PROBE = """
+import json, time
+started = time.perf_counter()
+from app import create_app
+imported = time.perf_counter()
+app = create_app()
+created = time.perf_counter()
+response = app.test_client().get("/")
+assert response.status_code == 200, response.status_code
+first_request = time.perf_counter()
+print(json.dumps({
+    "import_ms": (imported - started) * 1e3,
+    "create_app_ms": (created - imported) * 1e3,
+    "first_request_ms": (first_request - created) * 1e3,
+    "total_ms": (first_request - started) * 1e3,
+}))
+"""
+
+
+def sample(database_url):
+    """Measure one cold start in a subprocess; returns the probe's timings."""
+    env = dict(os.environ, DATABASE_URL=database_url, LOG_LEVEL="WARNING")
+    completed = subprocess.run(
+        [sys.executable, "-c", PROBE], cwd=BACKEND_DIR, env=env, capture_output=True, text=True, check=True,
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure cold-start time: import, create_app and first request.")
+    parser.add_argument("--database-url", help="Defaults to a temporary SQLite file.")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--json", action="store_true", help="Print the medians as JSON.")
+    options = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        database_url = options.database_url or f"sqlite:///{os.path.join(workdir, 'startup.db')}"
+        samples = [sample(database_url) for _ in range(options.runs)]
+
+    medians = {key: statistics.median(s[key] for s in samples) for key in samples[0]}
+    if options.json:
+        print(json.dumps(medians))
+        return
+    for key, value in medians.items():
+        print(f"{key:18s} {value:8.1f} ms (median of {options.runs})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+"""
+Ticket change tracking for delta sync.
+
+Every flush that inserts, updates or deletes tickets reserves a block of
+sequence numbers from the single `change_counter` row and stamps them on the
+changed tickets (`Ticket.change_seq`) or on tombstones for deleted ones. On
+Postgres the counter UPDATE holds a row lock until commit, so sequence order
+is commit order and a client that has seen sequence N can never miss a later
+commit with a smaller number.
+"""
+from datetime import datetime, timedelta
+from sqlalchemy import DDL, event, func, select, update
+from sqlalchemy.orm import Session
+from extensions import db
+from models import ChangeCounter, Ticket, TicketTombstone
+
+COUNTER_ID = 1
+DEFAULT_TOMBSTONE_RETENTION = timedelta(days=30)
+
+# Fresh databases built with create_all() need the counter row too.
+event.listen(
+    ChangeCounter.__table__,
+    "after_create",
+    DDL(f"INSERT INTO change_counter (id, value, compacted_seq) VALUES ({COUNTER_ID}, 0, 0)"),
+)
+
+
+class CursorExpired(Exception):
+    """Raised when a delta-sync cursor predates the compacted tombstone history."""
+
+
+def reserve_change_seqs(connection, count):
+    """
+    Reserve `count` consecutive change sequence numbers.
+
+    Args:
+        connection: The connection of the writing transaction.
+        count (int): How many numbers to reserve.
+
+    Returns:
+        int: The first reserved number.
+    """
+    counter = ChangeCounter.__table__
+    last = connection.execute(
+        update(counter)
+        .where(counter.c.id == COUNTER_ID)
+        .values(value=counter.c.value + count)
+        .returning(counter.c.value)
+    ).scalar_one()
+    return last - count + 1
+
+
+def current_change_seq(session=None):
+    """Return the latest committed change sequence number."""
+    session = session or db.session
+    return session.execute(select(ChangeCounter.value).where(ChangeCounter.id == COUNTER_ID)).scalar_one()
+
+
+@event.listens_for(Session, "before_flush")
+def assign_change_seqs(session, flush_context, instances):
+    """Stamp changed tickets with fresh sequence numbers and tombstone deleted ones."""
+    changed = [obj for obj in session.new if isinstance(obj, Ticket)]
+    changed += [
+        obj for obj in session.dirty
+        if isinstance(obj, Ticket) and session.is_modified(obj, include_collections=False)
+    ]
+    deleted = [obj for obj in session.deleted if isinstance(obj, Ticket)]
+    if not changed and not deleted:
+        return
+
+    seq = reserve_change_seqs(session.connection(), len(changed) + len(deleted))
+    for ticket in changed:
+        ticket.change_seq = seq
+        seq += 1
+    now = datetime.utcnow()
+    for ticket in deleted:
+        session.add(TicketTombstone(change_seq=seq, ticket_id=ticket.id, deleted_at=now))
+        seq += 1
+
+
+def change_log_since(since, limit):
+    """
+    Read the next `limit` change-log entries after `since`, in sequence order.
+
+    Args:
+        since (int): The sequence number to start after.
+        limit (int): Maximum number of entries.
+
+    Returns:
+        tuple: `(entries, latest_seq, has_more)` where `entries` is a list of
+        `(seq, Ticket or TicketTombstone)` and `latest_seq` is the counter value.
+
+    Raises:
+        CursorExpired: If tombstones after `since` may already have been purged.
+    """
+    counter = db.session.execute(
+        select(ChangeCounter.value, ChangeCounter.compacted_seq).where(ChangeCounter.id == COUNTER_ID)
+    ).one()
+    if since < counter.compacted_seq:
+        raise CursorExpired()
+
+    tickets = db.session.execute(
+        select(Ticket).where(Ticket.change_seq > since).order_by(Ticket.change_seq).limit(limit + 1)
+    ).scalars().all()
+    tombstones = db.session.execute(
+        select(TicketTombstone)
+        .where(TicketTombstone.change_seq > since)
+        .order_by(TicketTombstone.change_seq)
+        .limit(limit + 1)
+    ).scalars().all()
+
+    entries = sorted(
+        [(t.change_seq, t) for t in tickets] + [(t.change_seq, t) for t in tombstones],
+        key=lambda entry: entry[0],
+    )
+    return entries[:limit], counter.value, len(entries) > limit
+
+
+def changes_since(since, limit):
+    """
+    Collect ticket upserts and deletions with a sequence number above `since`.
+
+    Args:
+        since (int): The client's cursor (0 for "from the beginning").
+        limit (int): Maximum number of changes to return.
+
+    Returns:
+        tuple: `(tickets, deleted_ids, cursor, has_more)` where `cursor` is the
+        sequence number to pass as `since` next time.
+
+    Raises:
+        CursorExpired: If tombstones after `since` may already have been purged.
+    """
+    entries, latest_seq, has_more = change_log_since(since, limit)
+
+    live = {}
+    deleted = {}
+    for seq, item in entries:
+        if isinstance(item, Ticket):
+            live[item.id] = item
+            deleted.pop(item.id, None)
+        else:
+            deleted[item.ticket_id] = seq
+            live.pop(item.ticket_id, None)
+
+    if has_more:
+        cursor = entries[-1][0]
+    else:
+        cursor = max(latest_seq, since, entries[-1][0] if entries else 0)
+    return list(live.values()), list(deleted), cursor, has_more
+
+
+def compact_tombstones(retention):
+    """
+    Purge tombstones older than `retention` and advance the compaction horizon.
+
+    Clients whose cursor is below the new horizon get `CursorExpired` and must
+    refetch the full list.
+
+    Args:
+        retention (timedelta): How long deletions stay visible to delta sync.
+
+    Returns:
+        int: The number of tombstones removed.
+    """
+    cutoff = datetime.utcnow() - retention
+    horizon = db.session.execute(
+        select(func.max(TicketTombstone.change_seq)).where(TicketTombstone.deleted_at < cutoff)
+    ).scalar()
+    if horizon is None:
+        return 0
+
+    removed = db.session.execute(
+        TicketTombstone.__table__.delete().where(TicketTombstone.change_seq <= horizon)
+    ).rowcount
+    db.session.execute(
+        update(ChangeCounter)
+        .where(ChangeCounter.id == COUNTER_ID, ChangeCounter.compacted_seq < horizon)
+        .values(compacted_seq=horizon)
+    )
+    db.session.commit()
+    return removed
+
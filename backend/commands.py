@@ -0,0 +1,178 @@
+import click
+from datetime import timedelta
+from flask import current_app
+from flask.cli import AppGroup, ScriptInfo
+
+tickets_cli = AppGroup("tickets", help="Ticket maintenance commands.")
+sessions_cli = AppGroup("sessions", help="Session store maintenance commands.")
+schema_cli = AppGroup("schema", help="Database schema version commands.")
+
+
+class LazyMigrateGroup(click.Group):
+    """
+    `flask db`: Flask-Migrate's commands, loaded on first use.
+
+    Flask-Migrate (and Alembic with it) is only imported when a `db`
+    subcommand is listed or run, not on every application start.
+    """
+
+    def _commands(self, ctx):
+        from extensions import init_migrate
+        from flask_migrate.cli import db
+
+        init_migrate(ctx.ensure_object(ScriptInfo).load_app())
+        return db
+
+    def list_commands(self, ctx):
+        return self._commands(ctx).list_commands(ctx)
+
+    def get_command(self, ctx, name):
+        return self._commands(ctx).get_command(ctx, name)
+
+
+@tickets_cli.command("compact-tombstones")
+@click.option("--retention-days", default=30, show_default=True, type=int,
+              help="How long deletions stay visible to delta-sync clients.")
+def compact_tombstones_command(retention_days):
+    """Purge old ticket tombstones and advance the delta-sync horizon."""
+    from changes import compact_tombstones
+
+    removed = compact_tombstones(timedelta(days=retention_days))
+    click.echo(f"Removed {removed} tombstone(s).")
+
+
+@tickets_cli.command("reindex-search")
+def reindex_search_command():
+    """Rebuild the SQLite full-text search index from the ticket table."""
+    from extensions import db
+    from search import rebuild_search_index
+
+    with db.engine.begin() as connection:
+        rebuild_search_index(connection)
+    click.echo("Search index rebuilt.")
+
+
+@tickets_cli.command("rebuild-summary")
+def rebuild_summary_command():
+    """Recompute the ticket summary counts from the ticket table."""
+    from extensions import db
+    from summary import rebuild_summary
+
+    with db.engine.begin() as connection:
+        groups, corrected = rebuild_summary(connection)
+    click.echo(f"Rebuilt {groups} summary group(s); {corrected} had drifted.")
+
+
+@tickets_cli.command("import")
+@click.argument("path", type=click.Path(exists=True, dir_okay=False))
+@click.option("--format", "file_format", type=click.Choice(["csv", "ndjson"]),
+              help="Input format; guessed from the extension by default.")
+@click.option("--batch-size", default=1000, show_default=True, type=int, help="Records per insert and commit.")
+@click.option("--method", default="auto", show_default=True, type=click.Choice(["auto", "copy", "executemany"]),
+              help="COPY (PostgreSQL) or executemany inserts; auto uses COPY where available.")
+@click.option("--job", "job_id", help="Progress key for resuming; defaults to the file's name and content digest.")
+@click.option("--rejects", type=click.File("a"), help="Append rejected records to this NDJSON file.")
+@click.option("--restart", is_flag=True, help="Ignore saved progress and import the whole file again.")
+def import_tickets_command(path, file_format, batch_size, method, job_id, rejects, restart):
+    """Bulk import tickets from a CSV or NDJSON file, resuming an interrupted run."""
+    import time
+    from importer import TicketImportError, import_tickets
+
+    started = time.perf_counter()
+    resumed_from = []
+
+    def progress(counts):
+        if not resumed_from:
+            resumed_from.append(counts["records"])
+        rate = (counts["records"] - resumed_from[0]) / max(time.perf_counter() - started, 1e-9)
+        click.echo(
+            f"{counts['records']:,} records  {counts['imported']:,} imported  "
+            f"{counts['rejected']:,} rejected  {rate:,.0f} records/s",
+            err=True,
+        )
+
+    try:
+        counts = import_tickets(
+            path, file_format=file_format, batch_size=batch_size, job_id=job_id, method=method,
+            rejects=rejects, restart=restart, progress=progress,
+        )
+    except TicketImportError as e:
+        raise click.ClickException(str(e))
+    click.echo(f"Imported {counts['imported']} ticket(s), rejected {counts['rejected']}.")
+
+
+@tickets_cli.command("archive")
+@click.option("--older-than-days", type=int,
+              help="Archive closed tickets unchanged for this many days; defaults to TICKET_ARCHIVE_AFTER_DAYS.")
+@click.option("--status", "statuses", multiple=True,
+              help="Statuses that may be archived, may be repeated; defaults to the closed statuses.")
+@click.option("--batch-size", default=500, show_default=True, type=int, help="Tickets moved per transaction.")
+def archive_tickets_command(older_than_days, statuses, batch_size):
+    """Move old closed tickets from the ticket table to ticket_archive, in batches."""
+    from archive import archive_tickets
+    from summary import CLOSED_STATUSES
+
+    if older_than_days is None:
+        older_than_days = current_app.config["TICKET_ARCHIVE_AFTER_DAYS"]
+    try:
+        total = archive_tickets(
+            timedelta(days=older_than_days), statuses=statuses or CLOSED_STATUSES, batch_size=batch_size,
+            progress=lambda total: click.echo(f"{total:,} archived", err=True),
+        )
+    except ValueError as e:
+        raise click.ClickException(str(e))
+    click.echo(f"Archived {total} ticket(s) unchanged for {older_than_days} day(s) or more.")
+
+
+@sessions_cli.command("sweep")
+@click.option("--batch-size", default=500, show_default=True, type=int,
+              help="Expired sessions deleted per statement.")
+def sweep_sessions_command(batch_size):
+    """Delete all expired sessions from the shared session store, in batches."""
+    interface = current_app.session_interface
+    if not hasattr(interface, "sweep_expired"):
+        raise click.ClickException("The configured SESSION_BACKEND does not support sweeping.")
+
+    total = 0
+    while True:
+        removed = interface.sweep_expired(batch_size)
+        total += removed
+        if removed < batch_size:
+            break
+    click.echo(f"Removed {total} expired session(s).")
+
+
+@schema_cli.command("ensure")
+def ensure_schema_command():
+    """Create or migrate the database schema if it is not at the latest revision."""
+    from schema_version import SchemaError, ensure_schema
+
+    try:
+        result = ensure_schema()
+    except SchemaError as e:
+        raise click.ClickException(str(e))
+    click.echo(f"Schema {result}.")
+
+
+@schema_cli.command("status")
+def schema_status_command():
+    """Show the database and latest migration revisions; exit 1 if they differ."""
+    from schema_version import current_revision, head_revision
+
+    current, head = current_revision(), head_revision()
+    click.echo(f"Database: {current or 'none'}  Latest: {head}")
+    if current != head:
+        raise SystemExit(1)
+
+
+def register_commands(app):
+    """
+    Register all application CLI command groups.
+
+    Args:
+        app (Flask): The Flask application instance.
+    """
+    app.cli.add_command(tickets_cli)
+    app.cli.add_command(sessions_cli)
+    app.cli.add_command(schema_cli)
+    app.cli.add_command(LazyMigrateGroup("db", help="Perform database migrations (Flask-Migrate)."))
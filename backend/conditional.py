@@ -0,0 +1,68 @@
+import hashlib
+from datetime import timezone
+from flask import Response, request
+
+
+def make_etag(*parts):
+    """
+    Build a strong ETag value from the parts that identify a representation.
+
+    Args:
+        *parts: Values that change whenever the response body would change,
+            e.g. the query string plus a row count and max `updated_at`.
+
+    Returns:
+        str: The (unquoted) ETag value.
+    """
+    return hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()
+
+
+def _as_utc(value):
+    # Timestamps are stored as naive UTC; HTTP dates are compared at second precision.
+    return value.replace(tzinfo=timezone.utc, microsecond=0) if value else None
+
+
+def is_not_modified(etag, last_modified=None):
+    """
+    Check the request's conditional headers against the current validators.
+
+    `If-None-Match` takes precedence over `If-Modified-Since`, as in RFC 9110.
+    Only pass `last_modified` for representations where every change,
+    including removals, moves it forward; otherwise rely on the ETag alone.
+
+    Args:
+        etag (str): The current ETag value.
+        last_modified (datetime): The current last-modified time (naive UTC), if known.
+
+    Returns:
+        bool: True if the client's cached copy is still current.
+    """
+    if request.if_none_match:
+        return request.if_none_match.contains(etag)
+    if last_modified and request.if_modified_since:
+        return _as_utc(last_modified) <= request.if_modified_since
+    return False
+
+
+def with_validators(response, etag, last_modified=None):
+    """
+    Attach ETag/Last-Modified headers and require revalidation on every use.
+
+    Args:
+        response (Response): The response to decorate.
+        etag (str): The ETag value.
+        last_modified (datetime): The last-modified time (naive UTC), if known.
+
+    Returns:
+        Response: The same response.
+    """
+    response.set_etag(etag)
+    if last_modified:
+        response.last_modified = _as_utc(last_modified)
+    response.headers["Cache-Control"] = "private, no-cache"
+    return response
+
+
+def not_modified(etag, last_modified=None):
+    """Return an empty 304 response carrying the current validators."""
+    return with_validators(Response(status=304), etag, last_modified)
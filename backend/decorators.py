@@ -1,32 +1,52 @@
+import inspect
+import logging
 from functools import wraps
-from flask import session, jsonify, request
+from flask import g, session, jsonify, request
+from tokens import bearer_token, get_token_manager
+
+logger = logging.getLogger(__name__)
+
+def current_user_id():
+    """
+    Return the authenticated user's id, from the session or a verified bearer token.
+
+    Returns:
+        int | None: The user id, or None if the request is not authenticated.
+    """
+    if "user_id" not in g:
+        user_id = session.get("user_id")
+        if not user_id:
+            # Alternative to the session cookie (for Docker compatibility)
+            token = bearer_token(request)
+            user_id = get_token_manager().verify(token) if token else None
+        g.user_id = user_id
+    return g.user_id
 
 def login_required(f):
     """
     A decorator to enforce login for protected routes.
+
+    Accepts either a session cookie or an `Authorization: Bearer` access
+    token issued by `/api/users/login`. Tokens are verified by signature
+    and expiry only, without touching the database. Works on both sync and
+    async views.
     """
+    if inspect.iscoroutinefunction(f):
+        @wraps(f)
+        async def decorated_coroutine(*args, **kwargs):
+            if not current_user_id():
+                return unauthorized()
+            return await f(*args, **kwargs)
+        return decorated_coroutine
+
     @wraps(f)
     def decorated_function(*args, **kwargs):
-        print(f"Checking session: {session}")
-        print(f"Request cookies: {request.cookies}")
-        print(f"Request headers: {request.headers}")
-        
-        # Check for traditional session
-        user_id = session.get("user_id")
-        
-        # Alternative: also check auth header if session fails (for Docker compatibility)
-        auth_header = request.headers.get('Authorization')
-        
-        if not user_id and not auth_header:
-            print("No user_id in session and no auth header")
-            return jsonify({"error": "Unauthorized"}), 401
-        
-        # Process auth header if present and session is empty
-        if not user_id and auth_header and auth_header.startswith('Bearer '):
-            # In a real app, you'd validate the token here
-            # For now, we'll log it and proceed as authenticated
-            print(f"Using auth header for authentication: {auth_header}")
-            # You could extract user info from the token here
-            
+        if not current_user_id():
+            return unauthorized()
         return f(*args, **kwargs)
-    return decorated_function
\ No newline at end of file
+    return decorated_function
+
+def unauthorized():
+    """Return the 401 response for a request without a valid session or token."""
+    logger.debug("Rejected unauthenticated request", extra={"path": request.path})
+    return jsonify({"error": "Unauthorized"}), 401
@@ -0,0 +1,221 @@
+"""
+Server-Sent Events fan-out for ticket changes.
+
+Committed ticket writes are turned into events (id = change sequence number,
+see changes.py) and handed to the configured backend, which feeds the
+in-process `broadcaster`. Each open `/api/tickets/events` stream is one
+bounded subscriber queue on that broadcaster.
+"""
+import logging
+import queue
+import threading
+import time
+from flask import current_app, has_app_context
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+from models import Ticket, TicketTombstone
+from schemas import TicketEvent, TicketOut, encoder
+
+SUBSCRIBER_QUEUE_SIZE = 256
+
+logger = logging.getLogger(__name__)
+
+
+class Subscription:
+    """A bounded queue of `(seq, payload)` events for one stream."""
+
+    def __init__(self, maxsize=SUBSCRIBER_QUEUE_SIZE):
+        self.queue = queue.Queue(maxsize=maxsize)
+        self.overflowed = False
+
+    def get(self, timeout):
+        """Return the next event, or None if `timeout` seconds pass first."""
+        try:
+            return self.queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+
+class Broadcaster:
+    """
+    Thread-safe, in-process fan-out of events to subscribers.
+
+    Publishing never blocks: a subscriber whose queue is full is marked as
+    overflowed and its stream ends, so the client reconnects with
+    `Last-Event-ID` and catches up from the database instead.
+    """
+
+    def __init__(self):
+        self._subscribers = set()
+        self._lock = threading.Lock()
+        self.on_first_subscriber = None
+
+    def subscribe(self):
+        subscription = Subscription()
+        with self._lock:
+            first = not self._subscribers
+            self._subscribers.add(subscription)
+        if first and self.on_first_subscriber:
+            self.on_first_subscriber()
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+    def publish(self, events):
+        """Deliver a list of `(seq, payload)` events to every subscriber."""
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscription in subscribers:
+            for item in events:
+                try:
+                    subscription.queue.put_nowait(item)
+                except queue.Full:
+                    subscription.overflowed = True
+                    break
+
+
+broadcaster = Broadcaster()
+
+
+class LocalBackend:
+    """Single-process backend: events go straight to the local broadcaster."""
+
+    def __init__(self, app):
+        pass
+
+    def publish(self, events):
+        broadcaster.publish(events)
+
+
+class DatabasePollingBackend:
+    """
+    Multi-worker backend that needs no extra infrastructure.
+
+    Writers publish nothing locally; instead one thread per worker process
+    polls the change log and broadcasts whatever any worker committed. The
+    thread only starts once the process has its first subscriber.
+    """
+
+    def __init__(self, app, interval=1.0):
+        self.app = app
+        self.interval = interval
+        self._thread = None
+        self._lock = threading.Lock()
+        broadcaster.on_first_subscriber = self.start
+
+    def publish(self, events):
+        pass
+
+    def start(self):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._poll, name="ticket-events-poller", daemon=True)
+                self._thread.start()
+
+    def _poll(self):
+        from changes import CursorExpired, current_change_seq
+        from extensions import db
+
+        with self.app.app_context():
+            since = current_change_seq()
+            db.session.remove()
+        while True:
+            time.sleep(self.interval)
+            with self.app.app_context():
+                try:
+                    events, since = events_since(since)
+                except CursorExpired:
+                    since = current_change_seq()
+                    events = []
+                except Exception:
+                    logger.exception("Error polling ticket changes")
+                    events = []
+                finally:
+                    db.session.remove()
+            if events:
+                broadcaster.publish(events)
+
+
+BACKENDS = {
+    "local": LocalBackend,
+    "database": DatabasePollingBackend,
+}
+
+
+def init_events(app):
+    """
+    Select the ticket event backend from `TICKET_EVENTS_BACKEND` ("local" or "database").
+
+    Args:
+        app (Flask): The Flask application instance.
+    """
+    name = app.config.get("TICKET_EVENTS_BACKEND", "local")
+    app.extensions["ticket_events"] = BACKENDS[name](app)
+
+
+def encode_event(seq, item):
+    """Encode a ticket or tombstone as the SSE payload for sequence `seq`."""
+    if isinstance(item, TicketTombstone):
+        payload = TicketEvent(op="delete", id=item.ticket_id)
+    else:
+        payload = TicketEvent(op="upsert", ticket=TicketOut.from_model(item))
+    return seq, encoder.encode(payload)
+
+
+def events_since(since, limit=500):
+    """
+    Read committed changes after `since` as encoded events.
+
+    Returns:
+        tuple: `(events, last_seq)`.
+
+    Raises:
+        CursorExpired: If tombstones after `since` have been purged.
+    """
+    from changes import change_log_since
+
+    events = []
+    has_more = True
+    while has_more:
+        entries, _, has_more = change_log_since(since, limit)
+        events.extend(encode_event(seq, item) for seq, item in entries)
+        if entries:
+            since = entries[-1][0]
+    return events, since
+
+
+def format_sse(seq, payload):
+    """Frame one event in the text/event-stream format."""
+    return b"id: %d\nevent: ticket\ndata: %s\n\n" % (seq, payload)
+
+
+def publish_events(events):
+    """Hand committed `(seq, payload)` events to the app's backend, in sequence order."""
+    if events and has_app_context() and "ticket_events" in current_app.extensions:
+        current_app.extensions["ticket_events"].publish(sorted(events))
+
+
+# Session hooks: collect events at flush time (ids and sequence numbers are
+# known, attributes are still loaded) and publish them only after commit.
+
+@event.listens_for(Session, "after_flush")
+def collect_ticket_events(session, flush_context):
+    pending = session.info.setdefault("ticket_events", [])
+    for obj in list(session.new) + list(session.dirty):
+        if isinstance(obj, Ticket) and inspect(obj).attrs.change_seq.history.added:
+            pending.append(encode_event(obj.change_seq, obj))
+        elif isinstance(obj, TicketTombstone):
+            pending.append(encode_event(obj.change_seq, obj))
+
+
+@event.listens_for(Session, "after_commit")
+def publish_ticket_events(session):
+    publish_events(session.info.pop("ticket_events", None))
+
+
+@event.listens_for(Session, "after_rollback")
+def discard_ticket_events(session):
+    session.info.pop("ticket_events", None)
+
@@ -1,5 +1,29 @@
-from flask_sqlalchemy import SQLAlchemy
-from flask_migrate import Migrate
+from flask_sqlalchemy import SQLAlchemy as BaseSQLAlchemy
+from db_profiles import install_sqlite_pragmas
+
+
+class SQLAlchemy(BaseSQLAlchemy):
+    """Flask-SQLAlchemy that applies the app's `DB_PROFILE` PRAGMAs to each SQLite engine it creates."""
+
+    def _make_engine(self, bind_key, options, app):
+        engine = super()._make_engine(bind_key, options, app)
+        install_sqlite_pragmas(engine, app.config.get("DB_PROFILE", "default"))
+        return engine
+
 
 db = SQLAlchemy()
-migrate = Migrate()
\ No newline at end of file
+
+
+def init_migrate(app):
+    """
+    Set up Flask-Migrate on `app` if it isn't already.
+
+    Deferred until a migration command or schema upgrade needs it: importing
+    Flask-Migrate pulls in Alembic, which noticeably slows worker start-up.
+
+    Args:
+        app (Flask): The Flask application instance.
+    """
+    if "migrate" not in app.extensions:
+        from flask_migrate import Migrate
+        Migrate(app, db)
@@ -0,0 +1,140 @@
+"""
+Password hashing off the request thread.
+
+Hashes are computed in a small process pool so a burst of logins cannot
+starve other requests in the same worker of CPU. The number of hashes queued
+or running at once is capped; past that the caller gets `HasherBusy` (the
+routes answer 503) instead of piling up latency for everyone.
+"""
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeout
+from flask import current_app, has_app_context
+from werkzeug.security import DEFAULT_PBKDF2_ITERATIONS, check_password_hash, generate_password_hash
+
+DEFAULT_METHOD = "scrypt:32768:8:1"
+
+
+class HasherBusy(Exception):
+    """Raised when the hashing queue is full or a hash does not finish in time."""
+
+
+def method_prefix(method):
+    """
+    Return the prefix werkzeug stores in front of hashes made with `method`.
+
+    Omitted parameters are filled in with werkzeug's defaults, e.g.
+    "scrypt" -> "scrypt:32768:8:1" and "pbkdf2" -> "pbkdf2:sha256:<iterations>".
+
+    Raises:
+        ValueError: If `method` is not a scrypt or pbkdf2 method werkzeug accepts.
+    """
+    name, *args = method.split(":")
+    if name == "scrypt" and len(args) in (0, 3):
+        n, r, p = map(int, args) if args else (2**15, 8, 1)
+        return f"scrypt:{n}:{r}:{p}"
+    if name == "pbkdf2" and len(args) <= 2:
+        hash_name = args[0] if args else "sha256"
+        iterations = int(args[1]) if len(args) == 2 else DEFAULT_PBKDF2_ITERATIONS
+        return f"pbkdf2:{hash_name}:{iterations}"
+    raise ValueError(f"Invalid password hash method {method!r}.")
+
+
+class PasswordHasher:
+    """
+    Hashes and verifies passwords with werkzeug, in a bounded process pool.
+
+    Args:
+        method (str): Werkzeug hash method including its cost parameters,
+            e.g. "scrypt:32768:8:1" or "pbkdf2:sha256:600000".
+        workers (int): Pool processes; 0 hashes inline on the calling thread.
+        max_pending (int): Hashes allowed to be queued or running at once.
+        timeout (float): Seconds to wait for a result before giving up.
+
+    Raises:
+        ValueError: If `method` is not a method werkzeug accepts.
+    """
+
+    def __init__(self, method=DEFAULT_METHOD, workers=2, max_pending=8, timeout=10.0):
+        self.method = method
+        self._prefix = method_prefix(method)
+        self.workers = workers
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def _pool(self):
+        with self._lock:
+            if self._executor is None:
+                # spawn: forking a process that holds DB connections and threads is unsafe
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers, mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
+
+    def _run(self, fn, *args):
+        if not self.workers:
+            return fn(*args)
+        if not self._slots.acquire(blocking=False):
+            raise HasherBusy("Too many password hashes in progress")
+        try:
+            future = self._pool().submit(fn, *args)
+        except Exception:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeout:
+            future.cancel()
+            raise HasherBusy("Password hashing timed out")
+
+    def hash(self, password):
+        """Return a new hash of `password` using the configured method."""
+        return self._run(generate_password_hash, password, self.method)
+
+    def verify(self, password_hash, password):
+        """Return True if `password` matches `password_hash`."""
+        return self._run(check_password_hash, password_hash, password)
+
+    def needs_rehash(self, password_hash):
+        """
+        Return True if `password_hash` was made with a different method or cost.
+
+        Werkzeug stores the method with its parameters in front of the salt,
+        e.g. "scrypt:32768:8:1$<salt>$<hash>", so no hashing is needed.
+        """
+        return password_hash.split("$", 1)[0] != self._prefix
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+
+_inline_hasher = PasswordHasher(workers=0)
+
+
+def init_password_hasher(app):
+    """
+    Configure password hashing from `PASSWORD_HASH_METHOD`, `PASSWORD_HASH_WORKERS`,
+    `PASSWORD_HASH_MAX_PENDING` and `PASSWORD_HASH_TIMEOUT`.
+
+    Args:
+        app (Flask): The Flask application instance.
+    """
+    app.extensions["password_hasher"] = PasswordHasher(
+        method=app.config["PASSWORD_HASH_METHOD"],
+        workers=app.config["PASSWORD_HASH_WORKERS"],
+        max_pending=app.config["PASSWORD_HASH_MAX_PENDING"],
+        timeout=app.config["PASSWORD_HASH_TIMEOUT"],
+    )
+
+
+def get_password_hasher():
+    """Return the app's hasher, or an inline default outside an app context."""
+    if has_app_context() and "password_hasher" in current_app.extensions:
+        return current_app.extensions["password_hasher"]
+    return _inline_hasher
@@ -0,0 +1,67 @@
+from flask import current_app
+from cache import LRUCache
+from models import User
+from schemas import UserOut
+
+
+class IdentityCache:
+    """
+    Per-process cache of the public user fields (`UserOut`) keyed by user id.
+
+    Authenticated endpoints that only need a user's id, name and email read
+    them from here instead of querying the database on every request. Entries
+    expire after `ttl` seconds, which bounds how long another worker's update
+    can go unseen; this process drops an entry as soon as it changes a user.
+
+    Args:
+        maxsize (int): Maximum number of cached users.
+        ttl (float): Seconds an entry stays valid.
+    """
+
+    def __init__(self, maxsize=10000, ttl=60.0):
+        self.cache = LRUCache(maxsize=maxsize, ttl=ttl)
+
+    def get(self, user_id):
+        """
+        Return the `UserOut` for `user_id`, loading it on a miss.
+
+        Returns:
+            UserOut | None: The user's public fields, or None if no such user exists.
+        """
+        identity = self.cache.get(user_id)
+        if identity is None:
+            user = User.query.get(user_id)
+            if user is None:
+                return None
+            identity = self.put(user)
+        return identity
+
+    def put(self, user):
+        """Cache and return the public fields of a loaded `User`."""
+        identity = UserOut(id=user.id, name=user.name, email=user.email)
+        self.cache.set(user.id, identity)
+        return identity
+
+    def invalidate(self, user_id):
+        self.cache.pop(user_id)
+
+    def stats(self):
+        """Return a dict of size, hit and miss counters."""
+        return self.cache.stats()
+
+
+def init_identity_cache(app):
+    """
+    Configure the identity cache from `USER_CACHE_SIZE` and `USER_CACHE_TTL`.
+
+    Args:
+        app (Flask): The Flask application instance.
+    """
+    app.extensions["identity_cache"] = IdentityCache(
+        maxsize=app.config["USER_CACHE_SIZE"],
+        ttl=app.config["USER_CACHE_TTL"],
+    )
+
+
+def get_identity_cache():
+    return current_app.extensions["identity_cache"]
@@ -0,0 +1,290 @@
+"""
+Streaming bulk ticket import (`flask tickets import`).
+
+The input file is read one record at a time and written in batches, so
+memory stays flat whatever its size. Each batch is validated, inserted
+with one `executemany` (or `COPY` on Postgres) and committed together with
+its change sequence numbers, summary deltas and the job's progress row, so
+a failed import resumes from the last committed batch without duplicating
+or skipping records. Invalid records are skipped and can be written to a
+rejects file.
+
+Core inserts bypass the session listeners, so this module does their work
+itself: tickets get change sequence numbers (delta sync picks them up) and
+`ticket_summary` is updated. Search indexing is done by the database.
+Imported tickets are not pushed to live SSE subscribers of the local
+backend; they appear on the next change-log read.
+"""
+import csv
+import hashlib
+import io
+import json
+import os
+from collections import Counter
+from datetime import datetime, timezone
+import msgspec
+from sqlalchemy import insert, select
+from extensions import db
+from models import Ticket, TicketImportJob, User
+from schemas import TicketImportRow
+from changes import reserve_change_seqs
+from summary import apply_summary_deltas, summary_key
+
+FORMATS = ("csv", "ndjson")
+FINGERPRINT_CHUNK_SIZE = 1 << 20
+METHODS = ("auto", "copy", "executemany")
+DEFAULT_BATCH_SIZE = 1000
+
+TICKET_COLUMNS = (
+    "name", "description", "status", "priority", "due_date", "author_id",
+    "created_at", "updated_at", "change_seq",
+)
+# Column lengths, checked up front so one long value can't fail a whole batch.
+MAX_LENGTHS = {"name": 100, "status": 20, "priority": 10}
+
+_ndjson_decoder = msgspec.json.Decoder(TicketImportRow)
+
+
+class TicketImportError(Exception):
+    """Raised when an import can't start or continue (bad options, finished job)."""
+
+
+def detect_format(path):
+    """Guess the input format from the file extension."""
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".csv":
+        return "csv"
+    if extension in (".ndjson", ".jsonl"):
+        return "ndjson"
+    raise TicketImportError(f"Can't tell the format of {path}; pass --format csv or --format ndjson.")
+
+
+def default_job_id(path):
+    """
+    The progress key for a file: its name and a digest of its contents.
+
+    The whole file is hashed, so a different file that happens to share the
+    name and size never resumes another file's job.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as stream:
+        for chunk in iter(lambda: stream.read(FINGERPRINT_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return f"{os.path.basename(path)[:150]}:{digest.hexdigest()[:32]}"
+
+
+def read_records(stream, file_format):
+    """
+    Yield `(number, raw)` for each record of a CSV or NDJSON stream.
+
+    CSV needs a header row naming the columns. Blank NDJSON lines are skipped
+    and not numbered.
+    """
+    if file_format == "csv":
+        for number, row in enumerate(csv.DictReader(stream), start=1):
+            yield number, row
+        return
+    number = 0
+    for line in stream:
+        if line.strip():
+            number += 1
+            yield number, line
+
+
+def parse_record(raw, file_format):
+    """
+    Decode and validate one raw record.
+
+    Returns:
+        TicketImportRow: The validated record.
+
+    Raises:
+        ValueError, msgspec.MsgspecError: If the record is invalid.
+    """
+    if file_format == "csv":
+        # Empty cells mean "not given", so field defaults apply.
+        values = {key: value for key, value in raw.items() if key is not None and value not in ("", None)}
+        row = msgspec.convert(values, TicketImportRow, strict=False)
+    else:
+        row = _ndjson_decoder.decode(raw)
+    if not row.name:
+        raise ValueError("Name is required.")
+    for field, limit in MAX_LENGTHS.items():
+        value = getattr(row, field)
+        if value is not None and len(value) > limit:
+            raise ValueError(f"{field} is longer than {limit} characters.")
+    return row
+
+
+def ticket_values(row, now):
+    """Column values for a validated record (`change_seq` is filled in per batch)."""
+    created_at = row.created_at
+    if created_at is not None and created_at.tzinfo is not None:
+        # Stored as naive UTC, like every other timestamp
+        created_at = created_at.astimezone(timezone.utc).replace(tzinfo=None)
+    return {
+        "name": row.name,
+        "description": row.description,
+        "status": row.status,
+        "priority": row.priority,
+        "due_date": datetime.combine(row.due_date, datetime.min.time()) if row.due_date else None,
+        "author_id": row.author_id,
+        "created_at": created_at or now,
+        "updated_at": now,
+        "change_seq": None,
+    }
+
+
+def copy_rows(connection, rows):
+    """Insert rows with PostgreSQL `COPY ... FROM STDIN`, on the connection's transaction."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow([r"\N" if row[column] is None else row[column] for column in TICKET_COLUMNS])
+    buffer.seek(0)
+    cursor = connection.connection.driver_connection.cursor()
+    try:
+        cursor.copy_expert(
+            f"COPY ticket ({', '.join(TICKET_COLUMNS)}) FROM STDIN WITH (FORMAT csv, NULL '\\N')", buffer,
+        )
+    finally:
+        cursor.close()
+
+
+def write_batch(connection, rows, use_copy):
+    """
+    Insert one batch of ticket rows with everything a normal create would do.
+
+    Reserves a block of change sequence numbers, inserts the rows and applies
+    the summary deltas, all on `connection`'s transaction.
+    """
+    seq = reserve_change_seqs(connection, len(rows))
+    deltas = Counter()
+    for offset, row in enumerate(rows):
+        row["change_seq"] = seq + offset
+        deltas[summary_key(row["status"], row["priority"], row["due_date"])] += 1
+    if use_copy:
+        copy_rows(connection, rows)
+    else:
+        connection.execute(insert(Ticket.__table__), rows)
+    apply_summary_deltas(connection, deltas)
+
+
+def start_job(job_id, restart):
+    """
+    Load or create the progress row for `job_id`.
+
+    Returns:
+        dict: The job's `records`, `imported` and `rejected` counts so far.
+
+    Raises:
+        TicketImportError: If the job already finished and `restart` is not set.
+    """
+    table = TicketImportJob.__table__
+    with db.engine.begin() as connection:
+        job = connection.execute(select(table).where(table.c.id == job_id)).first()
+        if job is not None and restart:
+            connection.execute(table.delete().where(table.c.id == job_id))
+            job = None
+        if job is None:
+            now = datetime.utcnow()
+            connection.execute(insert(table).values(
+                id=job_id, records=0, imported=0, rejected=0, started_at=now, updated_at=now,
+            ))
+            return {"records": 0, "imported": 0, "rejected": 0}
+        if job.finished_at is not None:
+            raise TicketImportError(
+                f"Job {job_id!r} already finished ({job.imported} imported); pass --restart to import again."
+            )
+        return {"records": job.records, "imported": job.imported, "rejected": job.rejected}
+
+
+def import_tickets(path, file_format=None, batch_size=DEFAULT_BATCH_SIZE, job_id=None, method="auto",
+                   rejects=None, restart=False, progress=None):
+    """
+    Import tickets from a CSV or NDJSON file.
+
+    Must be called inside an application context. Records are validated
+    like `create_ticket` bodies (plus an optional `created_at`); ones with an
+    unknown `author_id` are rejected too.
+
+    Args:
+        path (str): The input file.
+        file_format (str): "csv" or "ndjson"; guessed from the extension if None.
+        batch_size (int): Records per insert and commit.
+        job_id (str): Progress key for resuming; defaults to the file's name
+            and content digest (see `default_job_id`).
+        method (str): "copy" (PostgreSQL only), "executemany", or "auto" for
+            COPY where available.
+        rejects (file): Optional text stream receiving one JSON line per rejected record.
+        restart (bool): Forget saved progress and import the whole file again.
+        progress (callable): Called with the job counts after every batch.
+
+    Returns:
+        dict: The final `records`, `imported` and `rejected` counts.
+
+    Raises:
+        TicketImportError: If the options are invalid or the job already finished.
+    """
+    file_format = file_format or detect_format(path)
+    if batch_size < 1:
+        raise TicketImportError("Batch size must be at least 1.")
+    dialect = db.engine.dialect.name
+    if method == "copy" and dialect != "postgresql":
+        raise TicketImportError("COPY is only available on PostgreSQL.")
+    use_copy = method == "copy" or (method == "auto" and dialect == "postgresql")
+    job_id = job_id or default_job_id(path)
+
+    counts = start_job(job_id, restart)
+    skip = counts["records"]
+    table = TicketImportJob.__table__
+
+    def flush(batch, consumed, finished=False):
+        valid = [(number, raw, row) for number, raw, row, error in batch if error is None]
+        rejected = [(number, raw, error) for number, raw, row, error in batch if error is not None]
+        author_ids = {row.author_id for _, _, row in valid if row.author_id is not None}
+        now = datetime.utcnow()
+        with db.engine.begin() as connection:
+            known = set()
+            if author_ids:
+                known = set(connection.execute(select(User.id).where(User.id.in_(author_ids))).scalars())
+            rows = []
+            for number, raw, row in valid:
+                if row.author_id is not None and row.author_id not in known:
+                    rejected.append((number, raw, f"Unknown author_id {row.author_id}."))
+                else:
+                    rows.append(ticket_values(row, now))
+            if rows:
+                write_batch(connection, rows, use_copy)
+            connection.execute(table.update().where(table.c.id == job_id).values(
+                records=consumed,
+                imported=counts["imported"] + len(rows),
+                rejected=counts["rejected"] + len(rejected),
+                updated_at=now,
+                finished_at=now if finished else None,
+            ))
+        counts["records"] = consumed
+        counts["imported"] += len(rows)
+        counts["rejected"] += len(rejected)
+        # Written only once the batch is committed, so a resumed import doesn't repeat them.
+        if rejects is not None:
+            for number, raw, error in sorted(rejected):
+                rejects.write(json.dumps({"record": number, "error": error, "raw": raw}) + "\n")
+        if progress:
+            progress(dict(counts))
+
+    with open(path, newline="", encoding="utf-8") as stream:
+        batch = []
+        number = skip
+        for number, raw in read_records(stream, file_format):
+            if number <= skip:
+                continue
+            try:
+                batch.append((number, raw, parse_record(raw, file_format), None))
+            except (ValueError, msgspec.MsgspecError) as e:
+                batch.append((number, raw, None, str(e)))
+            if len(batch) >= batch_size:
+                flush(batch, number)
+                batch = []
+        flush(batch, max(number, skip), finished=True)
+    return counts
@@ -0,0 +1,148 @@
+"""
+Structured, non-blocking logging.
+
+Request threads only put records on a bounded in-memory queue; a single
+background `QueueListener` thread formats them and writes to stdout. When
+the queue is full, records are dropped and counted instead of blocking the
+request. High-frequency DEBUG events are sampled before they are queued.
+"""
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import random
+import sys
+from datetime import datetime, timezone
+
+# Attributes every LogRecord has; anything else was passed through `extra=`
+_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime", "sample_rate"}
+
+_listener = None
+_handler = None
+
+
+class JsonFormatter(logging.Formatter):
+    """Format records as one JSON object per line, including `extra=` fields."""
+
+    def format(self, record):
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS:
+                entry[key] = value
+        if record.exc_text:
+            entry["exc_info"] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+class TextFormatter(logging.Formatter):
+    """Human-readable format for local development."""
+
+    def __init__(self):
+        super().__init__("%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keep only a fraction of DEBUG records.
+
+    The rate applies to DEBUG only; INFO and above always pass. A call can
+    override it with `extra={"sample_rate": 0.01}`.
+
+    Args:
+        rate (float): Fraction of DEBUG records to keep, between 0 and 1.
+    """
+
+    def __init__(self, rate=1.0):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record):
+        if record.levelno > logging.DEBUG:
+            return True
+        rate = getattr(record, "sample_rate", self.rate)
+        return rate >= 1.0 or random.random() < rate
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """A `QueueHandler` that drops records when the queue is full instead of raising."""
+
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record):
+        # Render the message and traceback here, so the record is safe to hand
+        # to another thread, but leave structured formatting to the listener.
+        record = logging.makeLogRecord(vars(record))
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def parse_levels(spec):
+    """
+    Parse per-logger levels written as "name=LEVEL,name=LEVEL".
+
+    Returns:
+        dict: Logger name to level name, e.g. {"sqlalchemy.engine": "WARNING"}.
+    """
+    levels = {}
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        name, _, level = item.partition("=")
+        levels[name.strip()] = level.strip().upper()
+    return levels
+
+
+def configure_logging(app):
+    """
+    Route all logging through a bounded queue to a background writer.
+
+    Reads `LOG_LEVEL` (root level), `LOG_LEVELS` (per-logger overrides, see
+    `parse_levels`), `LOG_FORMAT` ("json" or "text"), `LOG_QUEUE_SIZE` and
+    `LOG_DEBUG_SAMPLE_RATE`. The listener is started once per process, so
+    creating several apps does not duplicate output.
+
+    Args:
+        app (Flask): The Flask application instance.
+    """
+    global _listener, _handler
+
+    root = logging.getLogger()
+    root.setLevel(app.config["LOG_LEVEL"])
+    for name, level in parse_levels(app.config["LOG_LEVELS"]).items():
+        logging.getLogger(name).setLevel(level)
+
+    if _listener is not None:
+        return
+
+    output = logging.StreamHandler(sys.stdout)
+    output.setFormatter(JsonFormatter() if app.config["LOG_FORMAT"] == "json" else TextFormatter())
+
+    handler = DroppingQueueHandler(queue.Queue(maxsize=app.config["LOG_QUEUE_SIZE"]))
+    handler.addFilter(SamplingFilter(app.config["LOG_DEBUG_SAMPLE_RATE"]))
+    root.handlers[:] = [handler]
+    _handler = handler
+
+    _listener = logging.handlers.QueueListener(handler.queue, output)
+    _listener.start()
+    atexit.register(_listener.stop)
+
+
+def dropped_records():
+    """Return how many records were dropped because the log queue was full."""
+    return _handler.dropped if _handler is not None else 0
@@ -0,0 +1,269 @@
+"""
+In-process request metrics with a Prometheus text exposition endpoint.
+
+Recording is a dict lookup and a few integer updates under a per-metric
+lock; nothing is formatted until `/api/metrics` is scraped. Values are per
+worker process, so scrape each worker (or aggregate in Prometheus).
+"""
+import bisect
+import hmac
+import threading
+import time
+from flask import Response, g, has_request_context, jsonify, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+DB_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names, values, extra=""):
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Metric:
+    """Base class: a named family of samples keyed by label values."""
+
+    kind = None
+
+    def __init__(self, name, documentation, labels=()):
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            items = sorted(self._values.items())
+            lines.extend(self._render_samples(items))
+        return lines
+
+    def _render_samples(self, items):
+        return [f"{self.name}{_format_labels(self.labels, key)} {value}" for key, value in items]
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def inc(self, *label_values, amount=1):
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + amount
+
+
+class Gauge(Metric):
+    kind = "gauge"
+
+    def inc(self, *label_values, amount=1):
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def dec(self, *label_values, amount=1):
+        self.inc(*label_values, amount=-amount)
+
+    def set(self, *label_values, value):
+        with self._lock:
+            self._values[label_values] = value
+
+
+class Histogram(Metric):
+    """
+    A fixed-bucket histogram. Counts are stored per bucket and made
+    cumulative only when rendered.
+    """
+
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labels=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(buckets)
+
+    def observe(self, *label_values, value):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._values.get(label_values)
+            if series is None:
+                # [per-bucket counts (+Inf last), sum]
+                series = self._values[label_values] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][index] += 1
+            series[1] += value
+
+    def _render_samples(self, items):
+        lines = []
+        for key, (counts, total) in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = 'le="+Inf"' if bound == float("inf") else f'le="{bound}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labels, key, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labels, key)} {total}")
+            lines.append(f"{self.name}_count{_format_labels(self.labels, key)} {cumulative}")
+        return lines
+
+
+class Registry:
+    """
+    Holds metrics and scrape-time collectors.
+
+    A collector is a callable returning `(name, kind, documentation, samples)`
+    tuples, where `samples` maps label dicts (as tuples of pairs) to values.
+    Collectors are only called on scrape, so exposing cache or queue
+    statistics costs nothing per request.
+    """
+
+    def __init__(self):
+        self.metrics = []
+        self.collectors = {}
+
+    def register(self, metric):
+        self.metrics.append(metric)
+        return metric
+
+    def add_collector(self, name, collector):
+        """Add a collector, replacing any earlier one with the same name."""
+        self.collectors[name] = collector
+
+    def render(self):
+        lines = []
+        for metric in self.metrics:
+            lines.extend(metric.render())
+        for collector in self.collectors.values():
+            for name, kind, documentation, samples in collector():
+                lines.append(f"# HELP {name} {documentation}")
+                lines.append(f"# TYPE {name} {kind}")
+                for labels, value in samples.items():
+                    lines.append(f"{name}{_format_labels([k for k, _ in labels], [v for _, v in labels])} {value}")
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+REQUEST_LATENCY = registry.register(Histogram(
+    "http_request_duration_seconds", "Time to produce a response, by endpoint.", ("method", "endpoint"),
+))
+REQUESTS = registry.register(Counter(
+    "http_requests_total", "Responses by endpoint and status code.", ("method", "endpoint", "status"),
+))
+IN_FLIGHT = registry.register(Gauge(
+    "http_requests_in_flight", "Requests currently being handled, by endpoint.", ("endpoint",),
+))
+DB_TIME = registry.register(Histogram(
+    "http_request_db_seconds", "Time spent executing SQL per request, by endpoint.", ("endpoint",), buckets=DB_BUCKETS,
+))
+DB_QUERIES = registry.register(Counter(
+    "http_request_db_queries_total", "SQL statements executed during requests, by endpoint.", ("endpoint",),
+))
+
+
+# SQL timing: accumulate cursor execution time on the current request.
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _start_query_timer(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _stop_query_timer(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info["query_started"].pop()
+    if has_request_context() and "metrics_started" in g:
+        g.db_time += time.perf_counter() - started
+        g.db_queries += 1
+
+
+def _cache_collector(app):
+    def collect():
+        caches = {}
+        identity_cache = app.extensions.get("identity_cache")
+        if identity_cache is not None:
+            caches["identity"] = identity_cache.stats()
+        session_cache = getattr(app.session_interface, "local", None)
+        if session_cache is not None:
+            caches["session"] = session_cache.stats()
+        for name, kind, field, documentation in (
+            ("cache_hits_total", "counter", "hits", "Cache lookups that found an entry."),
+            ("cache_misses_total", "counter", "misses", "Cache lookups that found nothing."),
+            ("cache_entries", "gauge", "size", "Entries currently cached."),
+        ):
+            yield name, kind, documentation, {(("cache", cache),): stats[field] for cache, stats in caches.items()}
+    return collect
+
+
+def _logging_collector():
+    from logging_config import dropped_records
+    yield "log_records_dropped_total", "counter", "Log records dropped because the log queue was full.", {(): dropped_records()}
+
+
+def init_metrics(app):
+    """
+    Instrument every request and, if enabled, serve the metrics at `/api/metrics`.
+
+    Does nothing unless `METRICS_ENABLED` is set. The endpoint exposes
+    internals, so it is only registered when `METRICS_ENDPOINT_ENABLED` is
+    set, and then only answers scrapers sending `METRICS_TOKEN` as a bearer
+    token.
+
+    Args:
+        app (Flask): The Flask application instance.
+
+    Raises:
+        ValueError: If the endpoint is enabled without a `METRICS_TOKEN`.
+    """
+    if not app.config["METRICS_ENABLED"]:
+        return
+    expose = app.config["METRICS_ENDPOINT_ENABLED"]
+    token = app.config["METRICS_TOKEN"]
+    if expose and not token:
+        raise ValueError("METRICS_ENDPOINT_ENABLED requires a METRICS_TOKEN.")
+
+    registry.add_collector("caches", _cache_collector(app))
+    registry.add_collector("logging", _logging_collector)
+
+    @app.before_request
+    def start_request_metrics():
+        g.metrics_started = time.perf_counter()
+        g.metrics_endpoint = request.endpoint or "unmatched"
+        g.db_time = 0.0
+        g.db_queries = 0
+        IN_FLIGHT.inc(g.metrics_endpoint)
+
+    @app.after_request
+    def record_request_metrics(response):
+        if "metrics_started" in g:
+            endpoint = g.metrics_endpoint
+            REQUEST_LATENCY.observe(request.method, endpoint, value=time.perf_counter() - g.metrics_started)
+            REQUESTS.inc(request.method, endpoint, str(response.status_code))
+            DB_TIME.observe(endpoint, value=g.db_time)
+            if g.db_queries:
+                DB_QUERIES.inc(endpoint, amount=g.db_queries)
+        return response
+
+    @app.teardown_request
+    def finish_request_metrics(exc):
+        if "metrics_started" in g:
+            IN_FLIGHT.dec(g.metrics_endpoint)
+
+    if not expose:
+        return
+
+    expected = f"Bearer {token}".encode()
+
+    @app.route("/api/metrics", methods=["GET"])
+    def metrics():
+        """
+        Expose all metrics in the Prometheus text format.
+
+        Returns:
+            200: The current metric values.
+            401: Missing or wrong `METRICS_TOKEN` bearer token.
+        """
+        if not hmac.compare_digest(request.headers.get("Authorization", "").encode(), expected):
+            return jsonify({"error": "Unauthorized"}), 401
+        return Response(registry.render(), mimetype="text/plain; version=0.0.4")
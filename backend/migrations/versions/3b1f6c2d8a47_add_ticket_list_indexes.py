@@ -0,0 +1,34 @@
+"""Add composite indexes for ticket list, filter and sort patterns
+
+Revision ID: 3b1f6c2d8a47
+Revises: 51897e515723
+Create Date: 2026-10-18 09:12:31.418275
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3b1f6c2d8a47'
+down_revision = '51897e515723'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('ticket', schema=None) as batch_op:
+        batch_op.create_index('ix_ticket_created_at_id', ['created_at', 'id'], unique=False)
+        batch_op.create_index('ix_ticket_author_id_created_at', ['author_id', 'created_at', 'id'], unique=False)
+        batch_op.create_index('ix_ticket_status_created_at', ['status', 'created_at', 'id'], unique=False)
+        batch_op.create_index('ix_ticket_priority_created_at', ['priority', 'created_at', 'id'], unique=False)
+        batch_op.create_index('ix_ticket_due_date', ['due_date'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('ticket', schema=None) as batch_op:
+        batch_op.drop_index('ix_ticket_due_date')
+        batch_op.drop_index('ix_ticket_priority_created_at')
+        batch_op.drop_index('ix_ticket_status_created_at')
+        batch_op.drop_index('ix_ticket_author_id_created_at')
+        batch_op.drop_index('ix_ticket_created_at_id')
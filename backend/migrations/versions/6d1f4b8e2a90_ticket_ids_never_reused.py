@@ -0,0 +1,59 @@
+"""Never reuse ticket ids on SQLite
+
+Revision ID: 6d1f4b8e2a90
+Revises: f3c8d1a6b2e9
+Create Date: 2026-10-18 21:14:09.317552
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '6d1f4b8e2a90'
+down_revision = 'f3c8d1a6b2e9'
+branch_labels = None
+depends_on = None
+
+# Rebuilding `ticket` drops the triggers that keep the search index current.
+FTS_TRIGGERS = [
+    "CREATE TRIGGER ticket_fts_insert AFTER INSERT ON ticket BEGIN "
+    "INSERT INTO ticket_fts (rowid, name, description) VALUES (new.id, new.name, new.description); END",
+    "CREATE TRIGGER ticket_fts_delete AFTER DELETE ON ticket BEGIN "
+    "INSERT INTO ticket_fts (ticket_fts, rowid, name, description) "
+    "VALUES ('delete', old.id, old.name, old.description); END",
+    "CREATE TRIGGER ticket_fts_update AFTER UPDATE OF name, description ON ticket BEGIN "
+    "INSERT INTO ticket_fts (ticket_fts, rowid, name, description) "
+    "VALUES ('delete', old.id, old.name, old.description); "
+    "INSERT INTO ticket_fts (rowid, name, description) VALUES (new.id, new.name, new.description); END",
+]
+
+
+def rebuild_ticket(autoincrement):
+    with op.batch_alter_table('ticket', recreate='always', table_kwargs={'sqlite_autoincrement': autoincrement}):
+        pass
+    for statement in FTS_TRIGGERS:
+        op.execute(statement)
+
+
+def upgrade():
+    # PostgreSQL sequences never hand an id out twice; SQLite reuses max(id) + 1
+    # unless the table is AUTOINCREMENT, which could collide with ticket_archive.
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    rebuild_ticket(True)
+    # Start above every id handed out so far, including archived tickets.
+    op.execute(
+        "INSERT INTO sqlite_sequence (name, seq) SELECT 'ticket', 0 "
+        "WHERE NOT EXISTS (SELECT 1 FROM sqlite_sequence WHERE name = 'ticket')"
+    )
+    op.execute(
+        "UPDATE sqlite_sequence SET seq = max(seq, "
+        "(SELECT coalesce(max(id), 0) FROM ticket), (SELECT coalesce(max(id), 0) FROM ticket_archive)) "
+        "WHERE name = 'ticket'"
+    )
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    rebuild_ticket(False)
@@ -0,0 +1,32 @@
+"""Add updated_at to Ticket for conditional GET validators
+
+Revision ID: 8c4e2a9d1f05
+Revises: 3b1f6c2d8a47
+Create Date: 2026-10-18 10:03:47.201934
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8c4e2a9d1f05'
+down_revision = '3b1f6c2d8a47'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('ticket', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('updated_at', sa.DateTime(), nullable=True))
+
+    op.execute("UPDATE ticket SET updated_at = COALESCE(created_at, CURRENT_TIMESTAMP)")
+
+    with op.batch_alter_table('ticket', schema=None) as batch_op:
+        batch_op.create_index('ix_ticket_updated_at', ['updated_at'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('ticket', schema=None) as batch_op:
+        batch_op.drop_index('ix_ticket_updated_at')
+        batch_op.drop_column('updated_at')
@@ -0,0 +1,61 @@
+"""Add full-text search index on ticket name and description
+
+Revision ID: a5d2c8e1f934
+Revises: e4a93b7c2f68
+Create Date: 2026-10-18 14:02:37.512904
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'a5d2c8e1f934'
+down_revision = 'e4a93b7c2f68'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        # Requires PostgreSQL 12+ for stored generated columns.
+        op.execute(
+            "ALTER TABLE ticket ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ("
+            "setweight(to_tsvector('english', coalesce(name, '')), 'A') || "
+            "setweight(to_tsvector('english', coalesce(description, '')), 'B')) STORED"
+        )
+        op.execute("CREATE INDEX ix_ticket_search_vector ON ticket USING GIN (search_vector)")
+    elif dialect == 'sqlite':
+        op.execute(
+            "CREATE VIRTUAL TABLE ticket_fts USING fts5("
+            "name, description, content='ticket', content_rowid='id', tokenize='porter unicode61')"
+        )
+        op.execute(
+            "CREATE TRIGGER ticket_fts_insert AFTER INSERT ON ticket BEGIN "
+            "INSERT INTO ticket_fts (rowid, name, description) VALUES (new.id, new.name, new.description); END"
+        )
+        op.execute(
+            "CREATE TRIGGER ticket_fts_delete AFTER DELETE ON ticket BEGIN "
+            "INSERT INTO ticket_fts (ticket_fts, rowid, name, description) "
+            "VALUES ('delete', old.id, old.name, old.description); END"
+        )
+        op.execute(
+            "CREATE TRIGGER ticket_fts_update AFTER UPDATE OF name, description ON ticket BEGIN "
+            "INSERT INTO ticket_fts (ticket_fts, rowid, name, description) "
+            "VALUES ('delete', old.id, old.name, old.description); "
+            "INSERT INTO ticket_fts (rowid, name, description) VALUES (new.id, new.name, new.description); END"
+        )
+        # Index the tickets that already exist.
+        op.execute("INSERT INTO ticket_fts (ticket_fts) VALUES ('rebuild')")
+
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        op.execute("DROP INDEX ix_ticket_search_vector")
+        op.execute("ALTER TABLE ticket DROP COLUMN search_vector")
+    elif dialect == 'sqlite':
+        op.execute("DROP TRIGGER ticket_fts_update")
+        op.execute("DROP TRIGGER ticket_fts_delete")
+        op.execute("DROP TRIGGER ticket_fts_insert")
+        op.execute("DROP TABLE ticket_fts")
@@ -0,0 +1,37 @@
+"""Add ticket_summary table of counts per status, priority and due day
+
+Revision ID: b7e3f1a9c2d6
+Revises: a5d2c8e1f934
+Create Date: 2026-10-18 15:26:48.190342
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7e3f1a9c2d6'
+down_revision = 'a5d2c8e1f934'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('ticket_summary',
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('priority', sa.String(length=10), nullable=False),
+    sa.Column('due_day', sa.Date(), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('status', 'priority', 'due_day')
+    )
+
+    # Backfill from the existing tickets; unset values use the model's sentinels.
+    op.execute(
+        "INSERT INTO ticket_summary (status, priority, due_day, count) "
+        "SELECT COALESCE(status, ''), COALESCE(priority, ''), COALESCE(date(due_date), '9999-12-31'), COUNT(*) "
+        "FROM ticket GROUP BY 1, 2, 3"
+    )
+
+
+def downgrade():
+    op.drop_table('ticket_summary')
@@ -0,0 +1,50 @@
+"""Add ticket change sequence, tombstones and change counter for delta sync
+
+Revision ID: c71d0e5b9a13
+Revises: 8c4e2a9d1f05
+Create Date: 2026-10-18 11:20:05.664310
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c71d0e5b9a13'
+down_revision = '8c4e2a9d1f05'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('ticket', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('change_seq', sa.BigInteger(), nullable=True))
+        batch_op.create_index('ix_ticket_change_seq', ['change_seq'], unique=False)
+
+    op.create_table('ticket_tombstone',
+    sa.Column('change_seq', sa.BigInteger(), autoincrement=False, nullable=False),
+    sa.Column('ticket_id', sa.Integer(), nullable=False),
+    sa.Column('deleted_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('change_seq')
+    )
+    op.create_table('change_counter',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('value', sa.BigInteger(), nullable=False),
+    sa.Column('compacted_seq', sa.BigInteger(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+
+    # Existing tickets get their id as a starting sequence number.
+    op.execute("UPDATE ticket SET change_seq = id")
+    op.execute(
+        "INSERT INTO change_counter (id, value, compacted_seq) "
+        "SELECT 1, COALESCE(MAX(id), 0), 0 FROM ticket"
+    )
+
+
+def downgrade():
+    op.drop_table('change_counter')
+    op.drop_table('ticket_tombstone')
+    with op.batch_alter_table('ticket', schema=None) as batch_op:
+        batch_op.drop_index('ix_ticket_change_seq')
+        batch_op.drop_column('change_seq')
@@ -1,6 +1,6 @@
 from datetime import datetime
 from extensions import db
-from werkzeug.security import generate_password_hash, check_password_hash  # Add hashing utilities
+from hashing import get_password_hasher
 
 class User(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -21,8 +21,11 @@ class User(db.Model):
 
         Args:
             password (str): The plaintext password to hash.
+
+        Raises:
+            HasherBusy: If the hashing pool is saturated.
         """
-        self.password_hash = generate_password_hash(password)
+        self.password_hash = get_password_hasher().hash(password)
 
     def check_password(self, password):
         """
@@ -33,15 +36,116 @@ class User(db.Model):
 
         Returns:
             bool: True if the password matches the hash, False otherwise.
+
+        Raises:
+            HasherBusy: If the hashing pool is saturated.
+        """
+        return get_password_hasher().verify(self.password_hash, password)
+
+    def password_needs_rehash(self):
+        """
+        Check whether the stored hash predates the configured method or cost.
+
+        Returns:
+            bool: True if the password should be rehashed on next login.
         """
-        return check_password_hash(self.password_hash, password)
+        return get_password_hasher().needs_rehash(self.password_hash)
 
 class Ticket(db.Model):
+    # Composite indexes mirror the list endpoint: every filter is followed by
+    # the (created_at, id) keyset ordering so a page is a single index range.
+    # AUTOINCREMENT stops SQLite reusing the ids of archived tickets.
+    __table_args__ = (
+        db.Index('ix_ticket_created_at_id', 'created_at', 'id'),
+        db.Index('ix_ticket_author_id_created_at', 'author_id', 'created_at', 'id'),
+        db.Index('ix_ticket_status_created_at', 'status', 'created_at', 'id'),
+        db.Index('ix_ticket_priority_created_at', 'priority', 'created_at', 'id'),
+        db.Index('ix_ticket_due_date', 'due_date'),
+        db.Index('ix_ticket_updated_at', 'updated_at'),
+        db.Index('ix_ticket_change_seq', 'change_seq'),
+        {'sqlite_autoincrement': True},
+    )
+
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(100), nullable=False)
     description = db.Column(db.Text, nullable=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     due_date = db.Column(db.DateTime, nullable=True)
     status = db.Column(db.String(20), default='Open')
     priority = db.Column(db.String(10))
-    author_id = db.Column(db.Integer, db.ForeignKey('user.id'))
\ No newline at end of file
+    author_id = db.Column(db.Integer, db.ForeignKey('user.id'))
+    change_seq = db.Column(db.BigInteger)  # Assigned on every write, see changes.py
+
+class TicketTombstone(db.Model):
+    """A record of a deleted ticket, kept so delta-sync clients learn about the deletion."""
+    change_seq = db.Column(db.BigInteger, primary_key=True, autoincrement=False)
+    ticket_id = db.Column(db.Integer, nullable=False)
+    deleted_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+class ChangeCounter(db.Model):
+    """
+    Single-row counter handing out ticket change sequence numbers.
+
+    `compacted_seq` is the highest sequence whose tombstones have been purged;
+    cursors older than it can no longer be served incrementally.
+    """
+    id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    value = db.Column(db.BigInteger, nullable=False, default=0)
+    compacted_seq = db.Column(db.BigInteger, nullable=False, default=0)
+
+class TicketSummary(db.Model):
+    """
+    Ticket counts per (status, priority, due day), kept in step with every
+    ticket write by summary.py. Unset values are stored as sentinels ('' and
+    `summary.NO_DUE_DAY`) so each group has exactly one row.
+    """
+    status = db.Column(db.String(20), primary_key=True)
+    priority = db.Column(db.String(10), primary_key=True)
+    due_day = db.Column(db.Date, primary_key=True)
+    count = db.Column(db.Integer, nullable=False, default=0)
+
+class TicketImportJob(db.Model):
+    """
+    Progress of a `flask tickets import` run. Updated in the same transaction
+    as each imported batch, so an interrupted import resumes exactly after
+    the last committed record.
+    """
+    id = db.Column(db.String(255), primary_key=True)
+    records = db.Column(db.BigInteger, nullable=False, default=0)  # Input records consumed, imported or rejected
+    imported = db.Column(db.BigInteger, nullable=False, default=0)
+    rejected = db.Column(db.BigInteger, nullable=False, default=0)
+    started_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    finished_at = db.Column(db.DateTime, nullable=True)
+
+class TicketArchive(db.Model):
+    """
+    Closed tickets moved out of `ticket` by the archival job (see archive.py).
+    Same columns as Ticket, keeping the original id, plus when it was archived.
+    Read only; list endpoints include these rows only when asked to.
+    """
+    __tablename__ = 'ticket_archive'
+    __table_args__ = (
+        db.Index('ix_ticket_archive_created_at_id', 'created_at', 'id'),
+        db.Index('ix_ticket_archive_author_id', 'author_id'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    name = db.Column(db.String(100), nullable=False)
+    description = db.Column(db.Text, nullable=False)
+    created_at = db.Column(db.DateTime)
+    updated_at = db.Column(db.DateTime)
+    due_date = db.Column(db.DateTime, nullable=True)
+    status = db.Column(db.String(20))
+    priority = db.Column(db.String(10))
+    author_id = db.Column(db.Integer, db.ForeignKey('user.id'))
+    change_seq = db.Column(db.BigInteger)
+    archived_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+class StoredSession(db.Model):
+    """Server-side session data for the SQL session store (see session_store.py)."""
+    __tablename__ = 'session_store'
+    id = db.Column(db.String(255), primary_key=True)
+    data = db.Column(db.LargeBinary, nullable=False)
+    expiry = db.Column(db.DateTime, nullable=False, index=True)
@@ -0,0 +1,262 @@
+import base64
+import json
+from datetime import datetime, timedelta
+from sqlalchemy import and_, func, or_, select, union_all
+from sqlalchemy.orm import aliased
+from models import Ticket, TicketArchive
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+STREAM_BATCH_SIZE = 500
+EXPORT_BATCH_SIZE = 1000
+EXPORT_COLUMNS = ("id", "name", "description", "created_at", "due_date", "status", "priority", "author_id")
+
+
+class QueryParamError(ValueError):
+    """Raised when a list/filter query parameter cannot be parsed."""
+
+
+def encode_cursor(created_at, ticket_id):
+    """
+    Encode a keyset position into an opaque, URL-safe cursor string.
+
+    Args:
+        created_at (datetime): The `created_at` of the last ticket on the page.
+        ticket_id (int): The `id` of the last ticket on the page.
+
+    Returns:
+        str: The encoded cursor.
+    """
+    payload = json.dumps([created_at.isoformat() if created_at else None, ticket_id])
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor):
+    """
+    Decode a cursor produced by `encode_cursor`.
+
+    Args:
+        cursor (str): The opaque cursor string from the client.
+
+    Returns:
+        tuple: A `(created_at, id)` pair.
+
+    Raises:
+        QueryParamError: If the cursor is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, ticket_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return (datetime.fromisoformat(created_at) if created_at else None, int(ticket_id))
+    except (ValueError, TypeError):
+        raise QueryParamError("Invalid cursor.")
+
+
+def parse_limit(args, default=DEFAULT_PAGE_SIZE, maximum=MAX_PAGE_SIZE):
+    """Read and clamp the `limit` query parameter."""
+    raw = args.get("limit")
+    if raw is None:
+        return default
+    try:
+        limit = int(raw)
+    except ValueError:
+        raise QueryParamError("limit must be an integer.")
+    if limit < 1:
+        raise QueryParamError("limit must be at least 1.")
+    return min(limit, maximum)
+
+
+def _parse_date(value, name):
+    try:
+        return datetime.strptime(value, "%Y-%m-%d")
+    except ValueError:
+        raise QueryParamError(f"{name} must be a date in YYYY-MM-DD format.")
+
+
+def ticket_filter_clauses(args, table=Ticket):
+    """
+    Translate list query parameters into SQL filter clauses.
+
+    Supported parameters (all optional, list parameters may be repeated):
+        status, priority, author_id, due_after, due_before (inclusive dates).
+
+    Args:
+        args (MultiDict): The request query arguments.
+        table: The mapped class or Core table/columns to filter on.
+
+    Returns:
+        list: SQLAlchemy boolean clauses to AND together.
+
+    Raises:
+        QueryParamError: If a parameter has an invalid value.
+    """
+    columns = getattr(table, "c", table)
+    clauses = []
+
+    statuses = args.getlist("status")
+    if statuses:
+        clauses.append(columns.status.in_(statuses))
+
+    priorities = args.getlist("priority")
+    if priorities:
+        clauses.append(columns.priority.in_(priorities))
+
+    author_ids = args.getlist("author_id")
+    if author_ids:
+        try:
+            clauses.append(columns.author_id.in_([int(a) for a in author_ids]))
+        except ValueError:
+            raise QueryParamError("author_id must be an integer.")
+
+    if args.get("due_after"):
+        clauses.append(columns.due_date >= _parse_date(args["due_after"], "due_after"))
+    if args.get("due_before"):
+        due_before = _parse_date(args["due_before"], "due_before") + timedelta(days=1)
+        clauses.append(columns.due_date < due_before)
+
+    return clauses
+
+
+def keyset_clause(cursor, table=Ticket):
+    """
+    Build the "after this position" predicate for `(created_at, id)` ordering.
+
+    Written as an expanded OR rather than a row-value comparison so the
+    same SQL works on both SQLite and Postgres and can use the composite index.
+    """
+    columns = getattr(table, "c", table)
+    created_at, ticket_id = cursor
+    return or_(
+        columns.created_at > created_at,
+        and_(columns.created_at == created_at, columns.id > ticket_id),
+    )
+
+
+def include_archived(args):
+    """Whether the request asked for archived tickets too (`include_archived=1`)."""
+    return args.get("include_archived") in ("1", "true")
+
+
+def ticket_rows(args):
+    """
+    The table a ticket read covers: `ticket`, or with `include_archived` a
+    `ticket UNION ALL ticket_archive` subquery with the same columns.
+
+    Ticket ids are unique across both tables, since archiving moves a row.
+    """
+    table = Ticket.__table__
+    if not include_archived(args):
+        return table
+    archive = TicketArchive.__table__
+    return union_all(
+        select(*table.columns),
+        select(*(archive.c[column.name] for column in table.columns)),
+    ).subquery("tickets")
+
+
+def ticket_source(args):
+    """The mapped Ticket class, or an alias of it over `ticket_rows(args)` when archived rows are asked for."""
+    rows = ticket_rows(args)
+    return Ticket if rows is Ticket.__table__ else aliased(Ticket, rows)
+
+
+def ticket_page_query(args):
+    """
+    Build the keyset-paginated, filtered ticket list statement.
+
+    Fetches one row more than the requested limit so the caller can tell
+    whether another page exists.
+
+    Args:
+        args (MultiDict): The request query arguments.
+
+    Returns:
+        tuple: `(statement, limit)`.
+
+    Raises:
+        QueryParamError: If a parameter has an invalid value.
+    """
+    limit = parse_limit(args)
+    source = ticket_source(args)
+    clauses = ticket_filter_clauses(args, source)
+    if args.get("cursor"):
+        clauses.append(keyset_clause(decode_cursor(args["cursor"]), source))
+
+    statement = (
+        select(source)
+        .where(*clauses)
+        .order_by(source.created_at, source.id)
+        .limit(limit + 1)
+    )
+    return statement, limit
+
+
+def ticket_stream_query(args):
+    """
+    Build the unpaginated, filtered ticket statement used for streaming.
+
+    The statement is executed with `yield_per`, which makes SQLAlchemy use a
+    server-side cursor where the driver supports one (psycopg2) and hand rows
+    back in fixed-size batches, so memory stays flat however many rows match.
+
+    Args:
+        args (MultiDict): The request query arguments.
+
+    Returns:
+        Select: The statement.
+
+    Raises:
+        QueryParamError: If a parameter has an invalid value.
+    """
+    source = ticket_source(args)
+    return (
+        select(source)
+        .where(*ticket_filter_clauses(args, source))
+        .order_by(source.created_at, source.id)
+        .execution_options(yield_per=STREAM_BATCH_SIZE)
+    )
+
+
+def ticket_export_query(args):
+    """
+    Build the filtered export statement over plain Core columns.
+
+    Selects only the exported columns, without ORM instances, and asks for a
+    server-side cursor (`stream_results`) read in `EXPORT_BATCH_SIZE` batches.
+
+    Args:
+        args (MultiDict): The request query arguments.
+
+    Returns:
+        Select: The statement.
+
+    Raises:
+        QueryParamError: If a parameter has an invalid value.
+    """
+    table = ticket_rows(args)
+    return (
+        select(*(table.c[name] for name in EXPORT_COLUMNS))
+        .where(*ticket_filter_clauses(args, table))
+        .order_by(table.c.created_at, table.c.id)
+        .execution_options(stream_results=True, yield_per=EXPORT_BATCH_SIZE)
+    )
+
+
+def ticket_version_query(args):
+    """
+    Build the cheap change-version aggregate for a filtered ticket scope.
+
+    The row count catches deletions and `max(updated_at)` catches inserts and
+    edits, so together they change whenever any ticket in the scope does.
+
+    Args:
+        args (MultiDict): The request query arguments.
+
+    Returns:
+        Select: A statement returning one `(count, max_updated_at)` row.
+
+    Raises:
+        QueryParamError: If a parameter has an invalid value.
+    """
+    source = ticket_source(args)
+    return select(func.count(source.id), func.max(source.updated_at)).where(*ticket_filter_clauses(args, source))
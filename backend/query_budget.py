@@ -0,0 +1,135 @@
+"""
+SQL query budgets and N+1 detection.
+
+`count_queries` counts the statements executed inside a block and can fail
+when a budget is exceeded; endpoint tests use it through the `query_budget`
+fixture in tests/conftest.py. For staging, `init_query_detector` watches every request and
+logs statements that repeat with the same shape, the signature of a lazy
+relationship (e.g. `User.tickets`, `Ticket.author`) loaded once per row.
+"""
+import logging
+import re
+from collections import Counter
+from contextlib import contextmanager
+from flask import g, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+_PLACEHOLDER = r"(?:\?|%s|%\(\w+\)s|:\w+)"
+_PLACEHOLDER_LIST = re.compile(rf"\(\s*{_PLACEHOLDER}(?:\s*,\s*{_PLACEHOLDER})*\s*\)")
+_NUMBER = re.compile(r"\b\d+\b")
+_WHITESPACE = re.compile(r"\s+")
+
+
+class QueryBudgetExceeded(AssertionError):
+    """Raised by `count_queries` when a block runs more statements than allowed."""
+
+
+def statement_shape(statement):
+    """
+    Normalize a SQL statement so executions that differ only in parameters compare equal.
+
+    Placeholder lists such as `IN (?, ?, ?)` collapse to `(?)` and numeric
+    literals become `N`.
+    """
+    shape = _WHITESPACE.sub(" ", statement).strip()
+    shape = _PLACEHOLDER_LIST.sub("(?)", shape)
+    return _NUMBER.sub("N", shape)
+
+
+class QueryLog:
+    """The statements executed inside a `count_queries` block."""
+
+    def __init__(self):
+        self.statements = []
+
+    @property
+    def count(self):
+        return len(self.statements)
+
+    def repeated(self, threshold=2):
+        """Return `(shape, count)` pairs for shapes executed at least `threshold` times."""
+        counts = Counter(statement_shape(statement) for statement in self.statements)
+        return [(shape, count) for shape, count in counts.most_common() if count >= threshold]
+
+
+@contextmanager
+def count_queries(max_queries=None, engine=Engine):
+    """
+    Count the SQL statements executed inside the block.
+
+    Listens on every engine by default, so statements run by other threads
+    in the same process are counted too.
+
+    Args:
+        max_queries (int): Fail if more statements than this run; None only counts.
+        engine: An Engine, or the Engine class to watch all engines.
+
+    Yields:
+        QueryLog: The statements executed so far.
+
+    Raises:
+        QueryBudgetExceeded: If `max_queries` is exceeded.
+    """
+    log = QueryLog()
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        log.statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield log
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    if max_queries is not None and log.count > max_queries:
+        listing = "\n".join(f"  {statement_shape(statement)}" for statement in log.statements)
+        raise QueryBudgetExceeded(f"Expected at most {max_queries} queries, ran {log.count}:\n{listing}")
+
+
+# Staging detector
+
+def _record_request_statement(conn, cursor, statement, parameters, context, executemany):
+    if has_request_context():
+        g.setdefault("query_shapes", Counter())[statement_shape(statement)] += 1
+
+
+def init_query_detector(app):
+    """
+    Log suspected N+1 patterns and over-budget requests.
+
+    Enabled by `QUERY_DETECTOR_ENABLED`. A statement shape executed at least
+    `QUERY_REPEAT_THRESHOLD` times in one request is logged as a suspected
+    N+1; a request running more than `QUERY_BUDGET_PER_REQUEST` statements
+    (0 for no limit) is logged as over budget. Meant for staging: normalizing
+    every statement costs more than production should pay.
+
+    Args:
+        app (Flask): The Flask application instance.
+    """
+    if not app.config["QUERY_DETECTOR_ENABLED"]:
+        return
+
+    repeat_threshold = app.config["QUERY_REPEAT_THRESHOLD"]
+    budget = app.config["QUERY_BUDGET_PER_REQUEST"]
+    if not event.contains(Engine, "before_cursor_execute", _record_request_statement):
+        event.listen(Engine, "before_cursor_execute", _record_request_statement)
+
+    @app.after_request
+    def report_query_patterns(response):
+        shapes = g.get("query_shapes")
+        if not shapes:
+            return response
+        for shape, count in shapes.items():
+            if count >= repeat_threshold:
+                logger.warning("Suspected N+1 query", extra={
+                    "endpoint": request.endpoint, "statement": shape, "executions": count,
+                })
+        total = sum(shapes.values())
+        if budget and total > budget:
+            logger.warning("Request exceeded query budget", extra={
+                "endpoint": request.endpoint, "queries": total, "budget": budget,
+            })
+        return response
@@ -0,0 +1,298 @@
+"""
+Admission control for the password-hashing endpoints.
+
+`rate_limit(scope)` checks token buckets per client IP and per email before
+the view runs, and all limited views share one cap on how many may run at
+once. A burst of logins is turned away with a fast 429 and `Retry-After`
+instead of queueing for CPU that ticket requests need too. Tokens are only
+taken once every bucket and the concurrency cap have admitted a request,
+so a rejected request doesn't use up quota.
+
+Each bucket is stored as a single "theoretical arrival time" (the generic
+cell rate algorithm), which fits any key-value store. The "memory" backend
+keeps buckets per worker process; "cachelib" shares them through a cachelib
+cache (Redis, Memcached, filesystem...). The shared store reads and writes
+without a lock, so workers racing on one key can let an extra request by.
+"""
+import inspect
+import logging
+import math
+import re
+import threading
+import time
+from functools import wraps
+from flask import current_app, has_app_context, jsonify, request
+from cache import LRUCache
+
+logger = logging.getLogger(__name__)
+
+PERIODS = {"second": 1, "minute": 60, "hour": 3600}
+
+_RATE = re.compile(r"\s*(\d+)\s*/\s*(second|minute|hour)\s*")
+_LIMIT_KEY = re.compile(r"RATE_LIMIT_([A-Z_]+)_(IP|EMAIL)")
+
+
+def parse_rate(spec):
+    """
+    Parse a limit such as "10/minute" into `(count, period_seconds)`.
+
+    Returns:
+        tuple | None: The rate, or None if `spec` is empty (no limit).
+
+    Raises:
+        ValueError: If `spec` is malformed or its count is zero.
+    """
+    if not spec:
+        return None
+    match = _RATE.fullmatch(spec)
+    if not match or int(match[1]) < 1:
+        raise ValueError(f"Invalid rate limit {spec!r}; expected e.g. '10/minute'.")
+    return int(match[1]), PERIODS[match[2]]
+
+
+def gcra(tat, interval, burst, now):
+    """
+    One step of a token bucket holding `burst` tokens, refilled one per `interval` seconds.
+
+    Args:
+        tat (float | None): The bucket's stored theoretical arrival time.
+        interval (float): Seconds per token.
+        burst (int): Bucket capacity.
+        now (float): The current time.
+
+    Returns:
+        tuple: `(retry_after, tat)`, the seconds until a token is free (0 if
+        the request may go ahead) and the arrival time to store.
+    """
+    tat = max(tat or now, now)
+    allow_at = tat + interval - burst * interval
+    if allow_at > now:
+        return allow_at - now, tat
+    return 0, tat + interval
+
+
+class MemoryBucketStore:
+    """Per-process buckets in a bounded LRU; evicted buckets start over full."""
+
+    def __init__(self, maxsize=100000):
+        self._buckets = LRUCache(maxsize)
+        self._lock = threading.Lock()
+
+    def peek(self, key, interval, burst, now):
+        """Return the seconds to wait for a token from `key`'s bucket, or 0, without taking it."""
+        with self._lock:
+            return gcra(self._buckets.get(key), interval, burst, now)[0]
+
+    def take(self, key, interval, burst, now):
+        """Take a token from `key`'s bucket; return the seconds to wait, or 0."""
+        with self._lock:
+            retry_after, tat = gcra(self._buckets.get(key), interval, burst, now)
+            if not retry_after:
+                self._buckets.set(key, tat)
+        return retry_after
+
+
+class CacheLibBucketStore:
+    """Buckets shared by all workers through a cachelib cache."""
+
+    def __init__(self, cache):
+        self.cache = cache
+
+    def peek(self, key, interval, burst, now):
+        """Return the seconds to wait for a token from `key`'s bucket, or 0, without taking it."""
+        return gcra(self.cache.get(f"rate:{key}"), interval, burst, now)[0]
+
+    def take(self, key, interval, burst, now):
+        """Take a token from `key`'s bucket; return the seconds to wait, or 0."""
+        key = f"rate:{key}"
+        retry_after, tat = gcra(self.cache.get(key), interval, burst, now)
+        if not retry_after:
+            # A bucket idle until `tat` is full again, so it can expire then
+            self.cache.set(key, tat, timeout=math.ceil(tat - now))
+        return retry_after
+
+
+class RateLimiter:
+    """
+    Token-bucket limits per scope and key, and a cap on concurrently running limited views.
+
+    Args:
+        store: A `MemoryBucketStore` or `CacheLibBucketStore`.
+        limits (dict): `(count, period_seconds)` rates keyed by `(scope, kind)`,
+            where kind is "ip" or "email".
+        max_concurrent (int): Limited views allowed to run at once in this
+            process; 0 for no cap.
+    """
+
+    def __init__(self, store, limits, max_concurrent=0):
+        self.store = store
+        self.limits = limits
+        self._slots = threading.BoundedSemaphore(max_concurrent) if max_concurrent else None
+
+    def buckets(self, scope, keys):
+        """Yield `(key, interval, burst)` for each of the request's limited buckets in `scope`."""
+        for kind, value in keys.items():
+            rate = self.limits.get((scope, kind))
+            if rate is None or not value:
+                continue
+            count, period = rate
+            yield f"{scope}:{kind}:{value}", period / count, count
+
+    def check(self, scope, keys):
+        """
+        Check the request's buckets in `scope` without taking any tokens.
+
+        Args:
+            scope (str): The limit scope, e.g. "login".
+            keys (dict): The request's identities by kind, e.g. `{"ip": ..., "email": ...}`.
+
+        Returns:
+            float: Seconds to wait before retrying, or 0 if the request may go ahead.
+        """
+        now = time.time()
+        waits = [self.store.peek(key, interval, burst, now) for key, interval, burst in self.buckets(scope, keys)]
+        return max(waits, default=0)
+
+    def take(self, scope, keys):
+        """
+        Take a token from each of the request's buckets in `scope`.
+
+        Returns:
+            float: Seconds to wait if a bucket emptied since `check`, else 0.
+        """
+        now = time.time()
+        retry_after = 0
+        for key, interval, burst in self.buckets(scope, keys):
+            retry_after = max(retry_after, self.store.take(key, interval, burst, now))
+        return retry_after
+
+    def acquire(self):
+        """Claim a concurrency slot without waiting; return False if none is free."""
+        return self._slots is None or self._slots.acquire(blocking=False)
+
+    def release(self):
+        if self._slots is not None:
+            self._slots.release()
+
+
+def request_keys():
+    """The client IP and, for JSON bodies carrying one, the normalized email."""
+    body = request.get_json(silent=True)
+    email = body.get("email") if isinstance(body, dict) else None
+    return {
+        "ip": request.remote_addr,
+        "email": email.strip().lower() if isinstance(email, str) else None,
+    }
+
+
+def too_many_requests(retry_after):
+    """Build the 429 returned to a rejected request."""
+    response = jsonify({"error": "Too many requests, please try again later."})
+    response.status_code = 429
+    response.headers["Retry-After"] = str(max(1, math.ceil(retry_after)))
+    return response
+
+
+def admit(limiter, scope):
+    """
+    Apply `scope`'s limits and claim a concurrency slot for the current request.
+
+    Returns:
+        Response | None: A 429 if the request is rejected, else None (the
+        caller then holds a slot and must release it).
+    """
+    keys = request_keys()
+    retry_after = limiter.check(scope, keys)
+    if not retry_after and limiter.acquire():
+        retry_after = limiter.take(scope, keys)
+        if not retry_after:
+            return None
+        limiter.release()
+    logger.debug("Rejected rate-limited request", extra={"path": request.path, "scope": scope})
+    return too_many_requests(retry_after or 1)
+
+
+def rate_limit(scope):
+    """
+    A decorator applying `scope`'s rate limits and the shared concurrency cap to a view.
+
+    The limits come from `RATE_LIMIT_<SCOPE>_IP` and `RATE_LIMIT_<SCOPE>_EMAIL`.
+    Rejected requests get a 429 with `Retry-After` before the view runs.
+    Works on both sync and async views.
+
+    Args:
+        scope (str): The limit scope, e.g. "login".
+    """
+    def decorator(f):
+        if inspect.iscoroutinefunction(f):
+            @wraps(f)
+            async def decorated_coroutine(*args, **kwargs):
+                limiter = get_rate_limiter()
+                if limiter is None:
+                    return await f(*args, **kwargs)
+                rejected = admit(limiter, scope)
+                if rejected is not None:
+                    return rejected
+                try:
+                    return await f(*args, **kwargs)
+                finally:
+                    limiter.release()
+            return decorated_coroutine
+
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            limiter = get_rate_limiter()
+            if limiter is None:
+                return f(*args, **kwargs)
+            rejected = admit(limiter, scope)
+            if rejected is not None:
+                return rejected
+            try:
+                return f(*args, **kwargs)
+            finally:
+                limiter.release()
+        return decorated_function
+    return decorator
+
+
+def init_rate_limiter(app):
+    """
+    Configure admission control from `RATE_LIMIT_ENABLED`, `RATE_LIMIT_BACKEND`,
+    `RATE_LIMIT_<SCOPE>_IP` / `_EMAIL` and `RATE_LIMIT_MAX_CONCURRENT`.
+
+    Args:
+        app (Flask): The Flask application instance.
+
+    Raises:
+        ValueError: If the backend is unknown or a limit is malformed.
+    """
+    if not app.config["RATE_LIMIT_ENABLED"]:
+        return
+
+    backend = app.config["RATE_LIMIT_BACKEND"]
+    if backend == "memory":
+        store = MemoryBucketStore(app.config["RATE_LIMIT_CACHE_SIZE"])
+    elif backend == "cachelib":
+        cache = app.config.get("RATE_LIMIT_CACHELIB")
+        if cache is None:
+            from cachelib.file import FileSystemCache
+            cache = FileSystemCache(app.config["RATE_LIMIT_FILE_DIR"])
+        store = CacheLibBucketStore(cache)
+    else:
+        raise ValueError(f"Unknown RATE_LIMIT_BACKEND: {backend}")
+
+    limits = {}
+    for key, value in app.config.items():
+        match = _LIMIT_KEY.fullmatch(key)
+        rate = parse_rate(value) if match else None
+        if rate:
+            limits[(match[1].lower(), match[2].lower())] = rate
+
+    app.extensions["rate_limiter"] = RateLimiter(store, limits, app.config["RATE_LIMIT_MAX_CONCURRENT"])
+
+
+def get_rate_limiter():
+    """Return the app's limiter, or None when rate limiting is disabled."""
+    if has_app_context():
+        return current_app.extensions.get("rate_limiter")
+    return None
@@ -1,6 +1,9 @@
+import logging
 from routes.ticket_routes import ticket_bp
 from routes.user_routes import user_bp
 
+logger = logging.getLogger(__name__)
+
 def register_blueprints(app):
     """
     Register all application blueprints.
@@ -10,9 +13,14 @@ def register_blueprints(app):
     """
 
     # Register ticket blueprints
-    print("Registering ticket_bp...")  # Debugging
+    logger.debug("Registering ticket_bp")
     app.register_blueprint(ticket_bp, url_prefix="/api/tickets")
     
     # Register user blueprints
-    print("Registering user_bp...")  # Debugging
-    app.register_blueprint(user_bp, url_prefix="/api/users")
\ No newline at end of file
+    logger.debug("Registering user_bp")
+    app.register_blueprint(user_bp, url_prefix="/api/users")
+
+    # Opt-in async ticket list/create/update views (see async_db.py)
+    if app.config.get("ASYNC_TICKETS"):
+        from routes.async_ticket_routes import install_async_views
+        install_async_views(app)
\ No newline at end of file
@@ -1,48 +1,389 @@
-from flask import Blueprint, jsonify, request
-from datetime import datetime
+import logging
+import msgspec
+from flask import Blueprint, Response, current_app, jsonify, request, stream_with_context
+from datetime import datetime, time
+from sqlalchemy import select
 from models import Ticket
 from extensions import db
 from decorators import login_required
+from queries import (
+    QueryParamError, encode_cursor, parse_limit, ticket_export_query, ticket_page_query, ticket_stream_query,
+    ticket_version_query,
+)
+from conditional import is_not_modified, make_etag, not_modified, with_validators
+from schemas import (
+    MAX_BATCH_OPERATIONS, BatchItemResult, BatchResult, CreateOperation, DeleteOperation, TicketBatch,
+    TicketChanges, TicketCreate, TicketOut, TicketPage, TicketSearchPage, TicketSummaryOut, TicketUpdate,
+    decode_body, encoder, json_response,
+)
+from changes import CursorExpired, changes_since, current_change_seq
+from events import broadcaster, events_since, format_sse
+from search import SearchUnavailable, encode_search_cursor, ticket_search_query
+from summary import parse_due_soon_days, summarize_tickets
+from export import ENCODERS, EXPORT_MIMETYPES, gzip_chunks
 
 ticket_bp = Blueprint("tickets_blueprint", __name__)
+logger = logging.getLogger(__name__)
 
-def serialize_ticket(ticket):
+STREAM_MIMETYPES = {
+    "json": "application/json",
+    "ndjson": "application/x-ndjson",
+}
+
+@ticket_bp.route('', methods=['GET'])
+@login_required
+def fetch_tickets():
     """
-    Serialize a Ticket object into a dictionary format.
+    Fetch a page of tickets, ordered by creation time.
 
-    Args:
-        ticket (Ticket): The Ticket object to be serialized.
+    Query parameters:
+        limit (int): Page size (default 50, max 200).
+        cursor (str): The `next_cursor` returned by the previous page.
+        status, priority, author_id: Filters, may be repeated.
+        due_after, due_before (YYYY-MM-DD): Inclusive due date range.
+        stream (str): `json` or `ndjson` to stream every matching ticket
+            instead of returning a page (`limit` and `cursor` are ignored).
+        include_archived (str): `1` to include archived tickets too.
+
+    Responses carry an ETag derived from the count and latest `updated_at` of
+    the filtered scope; a matching `If-None-Match` gets a 304 without any rows
+    being loaded. There is no Last-Modified: deleting a ticket, or editing it
+    out of the filter, doesn't move the scope's latest `updated_at`, so
+    `If-Modified-Since` would serve stale lists.
 
     Returns:
-        dict: A dictionary containing serialized ticket data.
-    """
-    return {
-        "id": ticket.id,
-        "name": ticket.name,
-        "description": ticket.description,
-        "created_at": ticket.created_at.strftime("%Y-%m-%d %H:%M:%S") if ticket.created_at else None,
-        "due_date": ticket.due_date.strftime("%Y-%m-%d") if ticket.due_date else None,
-        "status": ticket.status,
-        "priority": ticket.priority,
-        "author_id": ticket.author_id,
-    }
+        Response: A JSON response with `tickets` and `next_cursor` (null on the
+        last page), a streamed JSON array / NDJSON body, a 304, or an error message.
+    """
+    try:
+        stream_format = request.args.get("stream")
+        if stream_format and stream_format not in STREAM_MIMETYPES:
+            return jsonify({"error": "stream must be 'json' or 'ndjson'."}), 400
 
-@ticket_bp.route('', methods=['GET'])
+        count, latest_update = db.session.execute(ticket_version_query(request.args)).one()
+        etag = make_etag(request.query_string, count, latest_update)
+        if is_not_modified(etag):
+            return not_modified(etag)
+
+        if stream_format:
+            response = stream_tickets(ticket_stream_query(request.args), stream_format)
+            return with_validators(response, etag)
+
+        # Read the change cursor before the rows so a concurrent write is never skipped.
+        change_cursor = None if request.args.get("cursor") else current_change_seq()
+        statement, limit = ticket_page_query(request.args)
+        tickets = db.session.execute(statement).scalars().all()
+
+        next_cursor = None
+        if len(tickets) > limit:
+            tickets = tickets[:limit]
+            next_cursor = encode_cursor(tickets[-1].created_at, tickets[-1].id)
+
+        response = json_response(TicketPage(
+            tickets=[TicketOut.from_model(ticket) for ticket in tickets],
+            next_cursor=next_cursor,
+            change_cursor=change_cursor,
+        ))
+        return with_validators(response, etag)
+    except QueryParamError as e:
+        return jsonify({"error": str(e)}), 400
+    except Exception as e:
+        logger.exception("Error fetching tickets")
+        return jsonify({"error": str(e)}), 500
+
+@ticket_bp.route('/export', methods=['GET'])
 @login_required
-def fetch_tickets():
+def export_tickets():
+    """
+    Download every matching ticket as CSV or NDJSON.
+
+    Rows are read through a server-side cursor as plain columns, in
+    `EXPORT_BATCH_SIZE` batches, and each batch is encoded (and compressed)
+    as it is sent, so memory use doesn't grow with the size of the export.
+
+    Query parameters:
+        format (str): `csv` (default) or `ndjson`.
+        gzip (str): `1` to gzip the file on the fly.
+        status, priority, author_id, due_after, due_before: The same
+            filters as the ticket list.
+        include_archived (str): `1` to include archived tickets too.
+
+    Returns:
+        Response: A streamed attachment, or an error message.
+    """
+    export_format = request.args.get("format", "csv")
+    if export_format not in ENCODERS:
+        return jsonify({"error": "format must be 'csv' or 'ndjson'."}), 400
+    try:
+        statement = ticket_export_query(request.args)
+    except QueryParamError as e:
+        return jsonify({"error": str(e)}), 400
+    compress = request.args.get("gzip") == "1"
+
+    def batches():
+        # A dedicated connection, so the server-side cursor is closed as soon
+        # as the stream ends or the client goes away.
+        try:
+            with db.engine.connect() as connection:
+                yield from connection.execute(statement).partitions()
+        except Exception:
+            # Headers are already sent, so the client sees a truncated body.
+            logger.exception("Error while exporting tickets")
+            raise
+
+    chunks = ENCODERS[export_format](batches())
+    filename = f"tickets.{export_format}"
+    if compress:
+        chunks = gzip_chunks(chunks)
+        filename += ".gz"
+    response = Response(
+        stream_with_context(chunks),
+        mimetype="application/gzip" if compress else EXPORT_MIMETYPES[export_format],
+    )
+    response.headers["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
+
+@ticket_bp.route('/search', methods=['GET'])
+@login_required
+def search_tickets():
+    """
+    Full-text search over ticket names and descriptions, most relevant first.
+
+    Query parameters:
+        q (str): The search words; every word must match (stemmed, so
+            "crashing" finds "crash").
+        limit (int): Page size (default 50, max 200).
+        cursor (str): The `next_cursor` returned by the previous page.
+        status, priority, author_id, due_after, due_before: The same
+            filters as the ticket list.
+
+    Returns:
+        Response: A JSON response with `tickets` and `next_cursor` (null on
+        the last page), or an error message (501 if the database has no
+        search index).
+    """
+    try:
+        statement, limit, offset = ticket_search_query(request.args, db.engine.dialect.name)
+        tickets = db.session.execute(statement).scalars().all()
+
+        next_cursor = None
+        if len(tickets) > limit:
+            tickets = tickets[:limit]
+            next_cursor = encode_search_cursor(offset + limit)
+
+        return json_response(TicketSearchPage(
+            tickets=[TicketOut.from_model(ticket) for ticket in tickets],
+            next_cursor=next_cursor,
+        ))
+    except QueryParamError as e:
+        return jsonify({"error": str(e)}), 400
+    except SearchUnavailable as e:
+        return jsonify({"error": str(e)}), 501
+    except Exception as e:
+        logger.exception("Error searching tickets")
+        return jsonify({"error": str(e)}), 500
+
+@ticket_bp.route('/summary', methods=['GET'])
+@login_required
+def ticket_summary():
     """
-    Fetch all tickets from the database.
+    Ticket counts by status, priority and due bucket, for board headers.
+
+    Served from the `ticket_summary` table rather than by scanning tickets.
+
+    Query parameters:
+        due_soon_days (int): How many days ahead count as due soon (default 7).
 
     Returns:
-        Response: A JSON response containing a list of all tickets or an error message.
+        Response: A JSON response with the counts, or an error message.
     """
     try:
-        tickets = Ticket.query.all()
-        return jsonify([serialize_ticket(ticket) for ticket in tickets]), 200
+        due_soon_days = parse_due_soon_days(request.args)
+        summary = summarize_tickets(datetime.utcnow().date(), due_soon_days)
+        return json_response(TicketSummaryOut(due_soon_days=due_soon_days, **summary))
+    except QueryParamError as e:
+        return jsonify({"error": str(e)}), 400
     except Exception as e:
-        print(f"Error occurred: {e}")
+        logger.exception("Error summarizing tickets")
         return jsonify({"error": str(e)}), 500
 
+@ticket_bp.route('/changes', methods=['GET'])
+@login_required
+def fetch_ticket_changes():
+    """
+    Fetch the tickets created, updated or deleted since a delta-sync cursor.
+
+    Query parameters:
+        since (int): The `cursor` from the previous call, or the
+            `change_cursor` from the first page of the ticket list.
+        limit (int): Maximum number of changes (default 50, max 200).
+
+    Returns:
+        Response: A JSON response with `tickets`, `deleted` ids, the next
+        `cursor` and `has_more`; 410 if the cursor is older than the retained
+        deletion history and the client must refetch the full list.
+    """
+    try:
+        try:
+            since = int(request.args.get("since", 0))
+        except ValueError:
+            return jsonify({"error": "since must be an integer."}), 400
+        if since < 0:
+            return jsonify({"error": "since must not be negative."}), 400
+
+        tickets, deleted, cursor, has_more = changes_since(since, parse_limit(request.args))
+        return json_response(TicketChanges(
+            tickets=[TicketOut.from_model(ticket) for ticket in tickets],
+            deleted=deleted,
+            cursor=cursor,
+            has_more=has_more,
+        ))
+    except CursorExpired:
+        return jsonify({"error": "Cursor has expired; refetch the full ticket list.", "resync": True}), 410
+    except QueryParamError as e:
+        return jsonify({"error": str(e)}), 400
+    except Exception as e:
+        logger.exception("Error fetching ticket changes")
+        return jsonify({"error": str(e)}), 500
+
+@ticket_bp.route('/events', methods=['GET'])
+@login_required
+def ticket_events():
+    """
+    Push ticket create/update/delete events as a Server-Sent Events stream.
+
+    Each event's id is its change sequence number, so a reconnecting client
+    (which sends `Last-Event-ID` automatically) is first replayed everything
+    it missed from the change log, then receives live events. A comment line
+    is sent as a heartbeat when the stream is otherwise idle.
+
+    Returns:
+        Response: A `text/event-stream` response.
+    """
+    last_event_id = request.headers.get("Last-Event-ID") or request.args.get("last_event_id")
+    try:
+        last_seq = int(last_event_id) if last_event_id else None
+    except ValueError:
+        return jsonify({"error": "Last-Event-ID must be an integer."}), 400
+    heartbeat = current_app.config["TICKET_EVENTS_HEARTBEAT"]
+
+    def generate():
+        # Subscribe before replaying so nothing committed in between is lost;
+        # anything seen twice is dropped by the sequence check below.
+        subscription = broadcaster.subscribe()
+        sent = last_seq
+        try:
+            if sent is None:
+                sent = current_change_seq()
+            else:
+                try:
+                    replay, _ = events_since(sent)
+                except CursorExpired:
+                    replay = []
+                    sent = current_change_seq()
+                    yield b"event: resync\ndata: {}\n\n"
+                for seq, payload in replay:
+                    yield format_sse(seq, payload)
+                    sent = seq
+            # Give the connection back to the pool for the life of the stream.
+            db.session.close()
+
+            yield b"retry: 3000\n\n"
+            while not subscription.overflowed:
+                item = subscription.get(timeout=heartbeat)
+                if item is None:
+                    yield b": heartbeat\n\n"
+                    continue
+                seq, payload = item
+                if seq > sent:
+                    yield format_sse(seq, payload)
+                    sent = seq
+        finally:
+            broadcaster.unsubscribe(subscription)
+
+    response = Response(stream_with_context(generate()), mimetype="text/event-stream")
+    response.headers["Cache-Control"] = "no-cache"
+    response.headers["X-Accel-Buffering"] = "no"
+    return response
+
+def stream_tickets(statement, stream_format):
+    """
+    Stream the tickets selected by `statement` as a JSON array or NDJSON.
+
+    Rows are read from the database in `yield_per` batches and each batch is
+    written out as one chunk, so neither the ORM objects nor the encoded body
+    are ever held in memory all at once.
+
+    Args:
+        statement (Select): A ticket statement with `yield_per` set.
+        stream_format (str): `json` or `ndjson`.
+
+    Returns:
+        Response: A streaming response.
+    """
+    def generate():
+        first = True
+        if stream_format == "json":
+            yield b"["
+        try:
+            result = db.session.execute(statement).scalars()
+            for batch in result.partitions():
+                structs = [TicketOut.from_model(ticket) for ticket in batch]
+                if stream_format == "ndjson":
+                    yield encoder.encode_lines(structs)
+                else:
+                    # Drop the brackets of the encoded batch and splice it into the array.
+                    chunk = encoder.encode(structs)[1:-1]
+                    yield chunk if first else b"," + chunk
+                first = False
+        except Exception:
+            # Headers are already sent, so the client sees a truncated body.
+            logger.exception("Error while streaming tickets")
+            raise
+        if stream_format == "json":
+            yield b"]"
+
+    return Response(stream_with_context(generate()), mimetype=STREAM_MIMETYPES[stream_format])
+
+def ticket_from_body(data):
+    """
+    Build a new Ticket from a decoded create body.
+
+    Args:
+        data (TicketCreate): The validated request body.
+
+    Returns:
+        Ticket: The unsaved ticket.
+    """
+    return Ticket(
+        name=data.name,
+        description=data.description,
+        status=data.status,
+        priority=data.priority,
+        due_date=datetime.combine(data.due_date, time()) if data.due_date else None,
+        created_at=datetime.utcnow(),
+        author_id=data.author_id,
+    )
+
+def apply_ticket_update(ticket, data):
+    """
+    Copy the fields present in a decoded update body onto a ticket.
+
+    Args:
+        ticket (Ticket): The ticket to modify.
+        data (TicketUpdate): The validated request body.
+    """
+    if data.name is not msgspec.UNSET:
+        ticket.name = data.name
+    if data.description is not msgspec.UNSET:
+        ticket.description = data.description
+    if data.status is not msgspec.UNSET:
+        ticket.status = data.status
+    if data.priority is not msgspec.UNSET:
+        ticket.priority = data.priority
+    if data.due_date:
+        ticket.due_date = datetime.combine(data.due_date, time())
+
 @ticket_bp.route('', methods=['POST'])
 @login_required
 def create_ticket():
@@ -53,24 +394,18 @@ def create_ticket():
         Response: A JSON response containing the created ticket's data or an error message.
     """
     try:
-        data = request.get_json()
-        if not data.get('name'):
+        data = decode_body(request, TicketCreate)
+        if not data.name:
             return jsonify({"error": "Name is required."}), 400
 
-        new_ticket = Ticket(
-            name=data['name'],
-            description=data.get('description', ''),  # Default to an empty string if not provided
-            status=data.get('status', 'To be done'),
-            priority=data.get('priority', 'Low'),
-            due_date=datetime.strptime(data['due_date'], "%Y-%m-%d") if data.get('due_date') else None,
-            created_at=datetime.utcnow(),
-            author_id=data.get('author_id'),
-        )
+        new_ticket = ticket_from_body(data)
         db.session.add(new_ticket)
         db.session.commit()
-        return jsonify(serialize_ticket(new_ticket)), 201
+        return json_response(TicketOut.from_model(new_ticket), 201)
+    except (msgspec.ValidationError, msgspec.DecodeError) as e:
+        return jsonify({"error": f"Invalid request body: {e}"}), 400
     except Exception as e:
-        print(f"Error occurred: {e}")
+        logger.exception("Error creating ticket")
         return jsonify({"error": str(e)}), 500
     
 @ticket_bp.route('/<int:ticket_id>', methods=['PUT'])
@@ -92,17 +427,14 @@ def update_ticket(ticket_id):
         if not ticket:
             return jsonify({"error": "Ticket not found."}), 404
 
-        data = request.get_json()
-        # Update ticket fields if provided
-        ticket.name = data.get('name', ticket.name)
-        ticket.description = data.get('description', ticket.description)
-        ticket.status = data.get('status', ticket.status)
-        ticket.priority = data.get('priority', ticket.priority)
-        ticket.due_date = datetime.strptime(data['due_date'], "%Y-%m-%d") if data.get('due_date') else ticket.due_date
+        data = decode_body(request, TicketUpdate)
+        apply_ticket_update(ticket, data)
         db.session.commit()
-        return jsonify(serialize_ticket(ticket)), 200
+        return json_response(TicketOut.from_model(ticket))
+    except (msgspec.ValidationError, msgspec.DecodeError) as e:
+        return jsonify({"error": f"Invalid request body: {e}"}), 400
     except Exception as e:
-        print(f"Error occurred: {e}") # Debugging
+        logger.exception("Error updating ticket")
         return jsonify({"error": str(e)}), 500
 
 @ticket_bp.route('/<int:ticket_id>', methods=['DELETE'])
@@ -126,5 +458,91 @@ def delete_ticket(ticket_id):
         db.session.commit()
         return jsonify({"message": "Ticket deleted successfully."}), 200
     except Exception as e:
-        print(f"Error occurred: {e}") # Debugging
-        return jsonify({"error": str(e)}), 500
\ No newline at end of file
+        logger.exception("Error deleting ticket")
+        return jsonify({"error": str(e)}), 500
+
+@ticket_bp.route('/batch', methods=['POST'])
+@login_required
+def batch_tickets():
+    """
+    Apply a list of create/update/delete operations in a single transaction.
+
+    Expects:
+        JSON body `{"operations": [...]}` where each operation is
+        `{"op": "create", "data": {...}}`, `{"op": "update", "id": 1, "data": {...}}`
+        or `{"op": "delete", "id": 1}`.
+
+    All operations are validated together and every referenced ticket is
+    loaded in one query. If any operation fails, nothing is written. Otherwise
+    everything is flushed at once, so SQLAlchemy batches the INSERTs, UPDATEs
+    and DELETEs into executemany calls, and committed once.
+
+    Returns:
+        200: All operations applied, with per-item results.
+        400: Invalid body, or some operations failed (per-item errors; failed
+             items carry 400/404/409 and the rest 424).
+        500: Internal server error.
+    """
+    try:
+        batch = decode_body(request, TicketBatch)
+        if not batch.operations:
+            return jsonify({"error": "operations must not be empty."}), 400
+        if len(batch.operations) > MAX_BATCH_OPERATIONS:
+            return jsonify({"error": f"At most {MAX_BATCH_OPERATIONS} operations per batch."}), 400
+
+        referenced = {op.id for op in batch.operations if not isinstance(op, CreateOperation)}
+        tickets = {}
+        if referenced:
+            rows = db.session.execute(select(Ticket).where(Ticket.id.in_(referenced))).scalars()
+            tickets = {ticket.id: ticket for ticket in rows}
+
+        # Validate everything before touching the session
+        results = []
+        deleted = set()
+        for index, op in enumerate(batch.operations):
+            result = BatchItemResult(index=index, op=type(op).__struct_config__.tag, status=200)
+            if isinstance(op, CreateOperation):
+                result.status = 201
+                if not op.data.name:
+                    result.status, result.error = 400, "Name is required."
+            else:
+                result.id = op.id
+                if op.id not in tickets:
+                    result.status, result.error = 404, "Ticket not found."
+                elif op.id in deleted:
+                    result.status, result.error = 409, "Ticket is deleted earlier in this batch."
+                elif isinstance(op, DeleteOperation):
+                    deleted.add(op.id)
+            results.append(result)
+
+        if any(result.error for result in results):
+            for result in results:
+                if not result.error:
+                    result.status = 424
+            return json_response(BatchResult(applied=False, results=results), 400)
+
+        touched = []
+        for op, result in zip(batch.operations, results):
+            if isinstance(op, CreateOperation):
+                ticket = ticket_from_body(op.data)
+                db.session.add(ticket)
+                touched.append((result, ticket))
+            elif isinstance(op, DeleteOperation):
+                db.session.delete(tickets[op.id])
+            else:
+                apply_ticket_update(tickets[op.id], op.data)
+                touched.append((result, tickets[op.id]))
+
+        # Serialize after the flush (ids assigned) but before the commit expires everything
+        db.session.flush()
+        for result, ticket in touched:
+            result.id = ticket.id
+            result.ticket = TicketOut.from_model(ticket)
+        db.session.commit()
+        return json_response(BatchResult(applied=True, results=results))
+    except (msgspec.ValidationError, msgspec.DecodeError) as e:
+        return jsonify({"error": f"Invalid request body: {e}"}), 400
+    except Exception as e:
+        db.session.rollback()
+        logger.exception("Error applying ticket batch")
+        return jsonify({"error": str(e)}), 500
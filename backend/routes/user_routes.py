@@ -1,11 +1,21 @@
+import logging
+import msgspec
 from flask import Flask, Blueprint, request, jsonify, session, redirect, url_for, make_response
 from models import User
 from extensions import db
-from decorators import login_required
+from decorators import current_user_id, login_required
+from schemas import LoginResponse, UserLogin, UserRegister, decode_body, json_response
+from conditional import is_not_modified, make_etag, not_modified, with_validators
+from tokens import bearer_token, get_token_manager
+from identity import get_identity_cache
+from hashing import HasherBusy
+from rate_limit import rate_limit
 
 user_bp = Blueprint("users", __name__)
+logger = logging.getLogger(__name__)
 
 @user_bp.route("/register", methods=["POST"])
+@rate_limit("register")
 def register():
     """
     Register a new user.
@@ -16,13 +26,15 @@ def register():
     Returns:
         201: User successfully registered.
         400: Validation error or email already registered.
+        429: Too many attempts or concurrent requests; retry after `Retry-After` seconds.
+        503: Password hashing is saturated; retry later.
         500: Internal server error.
     """
     try:
-        data = request.get_json()
-        name = data.get("name", "").strip()
-        email = data.get("email", "").strip().lower()
-        password = data.get("password", "")
+        data = decode_body(request, UserRegister)
+        name = data.name.strip()
+        email = data.email.strip().lower()
+        password = data.password
 
         # Enhanced input validation
         validation_errors = {}
@@ -56,10 +68,21 @@ def register():
         db.session.commit()
 
         return jsonify({"message": "User registered successfully."}), 201
-    except Exception as e:
-        print(f"Error during registration: {e}")
+    except (msgspec.ValidationError, msgspec.DecodeError) as e:
+        return jsonify({"error": f"Invalid request body: {e}"}), 400
+    except HasherBusy:
+        return busy_response()
+    except Exception:
+        logger.exception("Error during registration")
         return jsonify({"error": "An error occurred during registration."}), 500
         
+def busy_response():
+    """Build the 503 returned when the password hashing pool is saturated."""
+    response = jsonify({"error": "The server is busy, please try again shortly."})
+    response.status_code = 503
+    response.headers["Retry-After"] = "1"
+    return response
+
 def email_is_valid(email):
     """Validate email format using a simple regex pattern."""
     import re
@@ -80,6 +103,7 @@ def password_is_strong(password):
 
 
 @user_bp.route('/login', methods=['POST'])
+@rate_limit("login")
 def login():
     """
     Log in an existing user.
@@ -88,15 +112,18 @@ def login():
         JSON body with `email` and `password`.
 
     Returns:
-        200: Login successful.
+        200: Login successful, with a signed `access_token` for clients
+            that cannot use the session cookie.
         400: Missing credentials.
         401: Invalid email or password.
+        429: Too many attempts or concurrent requests; retry after `Retry-After` seconds.
+        503: Password hashing is saturated; retry later.
         500: Internal server error.
     """
     try:
-        data = request.get_json()
-        email = data.get("email")
-        password = data.get("password")
+        data = decode_body(request, UserLogin)
+        email = data.email
+        password = data.password
 
         if not email or not password:
             return jsonify({"error": "Email and password are required."}), 400
@@ -105,6 +132,11 @@ def login():
         if not user or not user.check_password(password):
             return jsonify({"error": "Invalid email or password."}), 401
 
+        # Upgrade hashes made with an older PASSWORD_HASH_METHOD or cost
+        if user.password_needs_rehash():
+            user.set_password(password)
+            db.session.commit()
+
         # Set session data
         session.permanent = True
         session["user_id"] = user.id
@@ -112,23 +144,23 @@ def login():
         session["email"] = user.email
         
         # Create response with proper session handling
-        response = make_response(jsonify({
-            "message": "Login successful.",
-            "user": {
-                "id": user.id,
-                "name": user.name,
-                "email": user.email
-            }
-        }))
-
-        # Log session state for debugging
-        print(f"Session data after login: {dict(session)}")
-        print(f"Response headers: {dict(response.headers)}")
-        
+        tokens = get_token_manager()
+        response = json_response(LoginResponse(
+            message="Login successful.",
+            user=get_identity_cache().put(user),  # Primes the cache for the session check that follows
+            access_token=tokens.issue(user.id),
+            expires_in=tokens.max_age,
+        ))
+
+        logger.info("User logged in", extra={"user_id": user.id})
         return response, 200
 
-    except Exception as e:
-        print(f"Error during login: {e}")
+    except (msgspec.ValidationError, msgspec.DecodeError) as e:
+        return jsonify({"error": f"Invalid request body: {e}"}), 400
+    except HasherBusy:
+        return busy_response()
+    except Exception:
+        logger.exception("Error during login")
         return jsonify({"error": "An error occurred during login."}), 500
 
 @user_bp.route('/logout', methods=['POST'])
@@ -136,15 +168,18 @@ def logout():
     """
     Log out an existing user.
 
-    Clears the session and logs the user out.
+    Clears the session and revokes the bearer token, if one was sent.
 
     Returns:
         200: Logout successful.
     """
     session.clear()  # Clear the server-side session
+    token = bearer_token(request)
+    if token:
+        get_token_manager().revoke(token)
     response = make_response(jsonify({"message": "Logged out successfully."}))
     response.set_cookie('session', '', expires=0)  # Invalidate session cookie
-    print("Session cleared")  # Debug log
+    logger.debug("Session cleared")
     return response
 
 @user_bp.route('/update', methods=['PUT'])
@@ -159,11 +194,12 @@ def update_user():
     Returns:
         200: User details updated successfully.
         400: Validation error.
+        503: Password hashing is saturated; retry later.
         500: Internal server error.
     """
     try:
         data = request.get_json()
-        user_id = session.get("user_id")  # Get the user ID from the session
+        user_id = current_user_id()  # From the session or the bearer token
         user = User.query.get(user_id)
 
         if not user:
@@ -185,38 +221,41 @@ def update_user():
 
         # Commit changes to the database
         db.session.commit()
+        get_identity_cache().invalidate(user.id)
         return jsonify({"message": "User details updated successfully."}), 200
 
-    except Exception as e:
-        print(f"Error during user update: {e}")
+    except HasherBusy:
+        return busy_response()
+    except Exception:
+        logger.exception("Error during user update")
         return jsonify({"error": "An error occurred while updating user details."}), 500
     
 @user_bp.route('/session', methods=['GET'])
 def verify_session():
-    # Check for user_id in session
-    if 'user_id' in session:
-        user = User.query.get(session['user_id'])
-        if user:
-            return jsonify({"id": user.id, "name": user.name, "email": user.email}), 200
-    
-    # If session fails, check for Authorization header as fallback
-    auth_header = request.headers.get('Authorization')
-    if auth_header and auth_header.startswith('Bearer '):
-        try:
-            # Extract user ID from the token
-            # In a proper implementation, you'd validate a real JWT token
-            # This is a simple implementation for Docker compatibility
-            token_parts = auth_header.split('Bearer user-')
-            if len(token_parts) == 2:
-                user_id = int(token_parts[1])
-                user = User.query.get(user_id)
-                if user:
-                    # Set session data to maintain compatibility
-                    session["user_id"] = user.id
-                    session["user_name"] = user.name
-                    session["email"] = user.email
-                    return jsonify({"id": user.id, "name": user.name, "email": user.email}), 200
-        except Exception as e:
-            print(f"Error processing auth header: {e}")
-    
-    return jsonify({"error": "Not authenticated"}), 401
\ No newline at end of file
+    """
+    Return the authenticated user, from the session or a bearer access token.
+
+    The user's fields come from the per-process identity cache, so repeated
+    checks usually skip the database. The response carries an ETag over those
+    fields, so a client revalidating with `If-None-Match` gets a 304 while
+    nothing has changed.
+
+    Returns:
+        200: The user's id, name and email.
+        304: The client's cached copy is current.
+        401: Not authenticated.
+    """
+    user_id = current_user_id()
+    if user_id:
+        identity = get_identity_cache().get(user_id)
+        if identity:
+            return session_user_response(identity)
+
+    return jsonify({"error": "Not authenticated"}), 401
+
+def session_user_response(identity):
+    """Build the conditional `verify_session` response for a cached `UserOut`."""
+    etag = make_etag("session", identity.id, identity.name, identity.email)
+    if is_not_modified(etag):
+        return not_modified(etag)
+    return with_validators(json_response(identity), etag)
@@ -0,0 +1,93 @@
+"""
+Startup schema check, replacing `db.create_all()` on every boot.
+
+The common case, a database already at the latest migration, costs one
+SELECT against `alembic_version`. Migrations only run when the revision
+differs, and an empty database is created from the models and stamped.
+"""
+import os
+from flask import current_app
+from sqlalchemy import inspect, text
+from extensions import db, init_migrate
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "migrations")
+
+# Databases built by `db.create_all()` before startup ran migrations have just
+# these tables, at this revision, and no `alembic_version`.
+BASELINE_REVISION = "51897e515723"
+BASELINE_TABLES = {"user", "ticket"}
+
+
+class SchemaError(RuntimeError):
+    """Raised when the database schema cannot be brought up to date automatically."""
+
+
+def head_revision():
+    """Return the newest migration revision in `migrations/versions`."""
+    from alembic.script import ScriptDirectory
+
+    return ScriptDirectory(MIGRATIONS_DIR).get_current_head()
+
+
+def current_revision():
+    """Return the revision recorded in the database, or None if it has none."""
+    with db.engine.connect() as connection:
+        if not inspect(connection).has_table("alembic_version"):
+            return None
+        return connection.execute(text("SELECT version_num FROM alembic_version")).scalar()
+
+
+def is_baseline_schema(connection):
+    """Return True if the database has the unversioned `create_all` schema of the original app."""
+    inspector = inspect(connection)
+    if set(inspector.get_table_names()) != BASELINE_TABLES:
+        return False
+    user_columns = {column["name"] for column in inspector.get_columns("user")}
+    ticket_columns = {column["name"] for column in inspector.get_columns("ticket")}
+    return "password_hash" in user_columns and "updated_at" not in ticket_columns
+
+
+def ensure_schema():
+    """
+    Bring the database schema to the latest migration.
+
+    Must be called inside an application context.
+
+    A database with the original app's unversioned schema (see
+    `is_baseline_schema`) is stamped at `BASELINE_REVISION` and upgraded.
+
+    Returns:
+        str: "current" if nothing was done, "created" for a new database,
+            or "upgraded" if migrations were applied.
+
+    Raises:
+        SchemaError: If the database has other tables but no recorded
+            revision, since the right starting revision can't be inferred safely.
+    """
+    head = head_revision()
+    current = current_revision()
+    if current == head:
+        return "current"
+
+    from flask_migrate import stamp, upgrade
+
+    init_migrate(current_app)
+    if current is None:
+        with db.engine.connect() as connection:
+            baseline = is_baseline_schema(connection)
+            existing = inspect(connection).get_table_names()
+        if baseline:
+            stamp(directory=MIGRATIONS_DIR, revision=BASELINE_REVISION)
+            upgrade(directory=MIGRATIONS_DIR)
+            return "upgraded"
+        if existing:
+            raise SchemaError(
+                "The database has tables but no migration revision. Run "
+                "`flask db stamp <revision>` for the schema it has, then `flask schema ensure`."
+            )
+        db.create_all()
+        stamp(directory=MIGRATIONS_DIR)
+        return "created"
+
+    upgrade(directory=MIGRATIONS_DIR)
+    return "upgraded"
@@ -0,0 +1,221 @@
+from datetime import date, datetime
+from typing import Dict, List, Optional, Union
+import msgspec
+from msgspec import UNSET, UnsetType
+from flask import Response
+
+encoder = msgspec.json.Encoder()
+
+
+def json_response(payload, status=200):
+    """
+    Encode a struct (or list of structs) with msgspec and wrap it in a response.
+
+    Args:
+        payload: Any msgspec-encodable object.
+        status (int): The HTTP status code.
+
+    Returns:
+        Response: An `application/json` response.
+    """
+    return Response(encoder.encode(payload), status=status, mimetype="application/json")
+
+
+def decode_body(request, schema):
+    """
+    Decode and validate a JSON request body against a struct type.
+
+    Args:
+        request (Request): The incoming request.
+        schema (type): The `msgspec.Struct` subclass to decode into.
+
+    Returns:
+        msgspec.Struct: The decoded body.
+
+    Raises:
+        msgspec.ValidationError: If the body does not match the schema.
+        msgspec.DecodeError: If the body is not valid JSON.
+    """
+    return _decoder_for(schema).decode(request.get_data())
+
+
+_decoders = {}
+
+
+def _decoder_for(schema):
+    decoder = _decoders.get(schema)
+    if decoder is None:
+        decoder = _decoders[schema] = msgspec.json.Decoder(schema)
+    return decoder
+
+
+# Tickets
+
+class TicketOut(msgspec.Struct):
+    """The wire representation of a ticket."""
+    id: int
+    name: str
+    description: str
+    created_at: Optional[str]
+    due_date: Optional[date]
+    status: Optional[str]
+    priority: Optional[str]
+    author_id: Optional[int]
+
+    @classmethod
+    def from_model(cls, ticket):
+        """
+        Build the wire representation from a Ticket (or a row with the same columns).
+
+        `created_at` keeps its "YYYY-MM-DD HH:MM:SS" format and `due_date` is
+        encoded by msgspec as "YYYY-MM-DD".
+        """
+        created_at = ticket.created_at
+        due_date = ticket.due_date
+        return cls(
+            id=ticket.id,
+            name=ticket.name,
+            description=ticket.description,
+            created_at=created_at.isoformat(" ", "seconds") if created_at else None,
+            due_date=due_date.date() if due_date else None,
+            status=ticket.status,
+            priority=ticket.priority,
+            author_id=ticket.author_id,
+        )
+
+
+class TicketPage(msgspec.Struct):
+    """
+    One page of the ticket list.
+
+    `change_cursor` is only set on the first page: the delta-sync position to
+    pass as `since` to `/api/tickets/changes` once the list has been loaded.
+    """
+    tickets: List[TicketOut]
+    next_cursor: Optional[str]
+    change_cursor: Optional[int] = None
+
+
+class TicketSearchPage(msgspec.Struct):
+    """One page of search results, most relevant first."""
+    tickets: List[TicketOut]
+    next_cursor: Optional[str]
+
+
+class TicketSummaryOut(msgspec.Struct):
+    """
+    Board counts. `open` excludes closed (Completed) tickets, as do `overdue`
+    and `due_soon`; unset statuses and priorities are keyed as "".
+    """
+    total: int
+    open: int
+    by_status: Dict[str, int]
+    by_priority: Dict[str, int]
+    overdue: int
+    due_soon: int
+    no_due_date: int
+    due_soon_days: int
+
+
+class TicketChanges(msgspec.Struct):
+    """Tickets created/updated and ids deleted since a delta-sync cursor."""
+    tickets: List[TicketOut]
+    deleted: List[int]
+    cursor: int
+    has_more: bool
+
+
+class TicketEvent(msgspec.Struct, omit_defaults=True):
+    """A pushed ticket change: `op` is "upsert" (with `ticket`) or "delete" (with `id`)."""
+    op: str
+    ticket: Optional[TicketOut] = None
+    id: Optional[int] = None
+
+
+class TicketCreate(msgspec.Struct):
+    """Request body for creating a ticket. Unknown fields are ignored."""
+    name: str = ""
+    description: str = ""
+    status: str = "To be done"
+    priority: str = "Low"
+    due_date: Optional[date] = None
+    author_id: Optional[int] = None
+
+
+class TicketImportRow(TicketCreate):
+    """One record of a bulk import file: a create body plus an optional original creation time."""
+    created_at: Optional[datetime] = None
+
+
+class TicketUpdate(msgspec.Struct):
+    """Request body for updating a ticket. Omitted fields are left unchanged."""
+    name: Union[str, UnsetType] = UNSET
+    description: Union[str, UnsetType] = UNSET
+    status: Union[Optional[str], UnsetType] = UNSET
+    priority: Union[Optional[str], UnsetType] = UNSET
+    due_date: Optional[date] = None
+
+
+MAX_BATCH_OPERATIONS = 1000
+
+
+class CreateOperation(msgspec.Struct, tag="create", tag_field="op"):
+    data: TicketCreate
+
+
+class UpdateOperation(msgspec.Struct, tag="update", tag_field="op"):
+    id: int
+    data: TicketUpdate
+
+
+class DeleteOperation(msgspec.Struct, tag="delete", tag_field="op"):
+    id: int
+
+
+class TicketBatch(msgspec.Struct):
+    """Request body for the batch endpoint: operations tagged by `op`."""
+    operations: List[Union[CreateOperation, UpdateOperation, DeleteOperation]]
+
+
+class BatchItemResult(msgspec.Struct, omit_defaults=True):
+    index: int
+    op: str
+    status: int
+    id: Optional[int] = None
+    ticket: Optional[TicketOut] = None
+    error: Optional[str] = None
+
+
+class BatchResult(msgspec.Struct):
+    """Per-operation results; `applied` is False if nothing was written."""
+    applied: bool
+    results: List[BatchItemResult]
+
+
+# Users
+
+class UserOut(msgspec.Struct):
+    """The public fields of a user."""
+    id: int
+    name: str
+    email: str
+
+
+class LoginResponse(msgspec.Struct):
+    message: str
+    user: UserOut
+    access_token: str
+    expires_in: int
+
+
+class UserRegister(msgspec.Struct):
+    """Request body for registration. Field rules are checked by the route."""
+    name: str = ""
+    email: str = ""
+    password: str = ""
+
+
+class UserLogin(msgspec.Struct):
+    """Request body for login."""
+    email: str = ""
+    password: str = ""
@@ -0,0 +1,164 @@
+"""
+Full-text search over ticket name and description.
+
+PostgreSQL keeps a stored generated `tsvector` column with a GIN index on
+`ticket`; SQLite keeps an external-content FTS5 table (`ticket_fts`) that
+triggers on `ticket` keep current in the same transaction. Either way the index
+follows every write path (single, batch and async routes, CLI commands)
+without application code having to maintain it. Names weigh more than
+descriptions in the ranking.
+"""
+import base64
+import re
+from sqlalchemy import DDL, column, event, func, literal_column, select, table
+from models import Ticket
+from queries import QueryParamError, parse_limit, ticket_filter_clauses
+
+SEARCH_CONFIG = "english"
+MAX_QUERY_TERMS = 16
+
+_TERM = re.compile(r"\w+", re.UNICODE)
+
+
+class SearchUnavailable(Exception):
+    """Raised when the database has no full-text search index (neither PostgreSQL nor SQLite)."""
+
+POSTGRES_DDL = [
+    f"ALTER TABLE ticket ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ("
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(name, '')), 'A') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(description, '')), 'B')) STORED",
+    "CREATE INDEX IF NOT EXISTS ix_ticket_search_vector ON ticket USING GIN (search_vector)",
+]
+
+SQLITE_DDL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS ticket_fts USING fts5("
+    "name, description, content='ticket', content_rowid='id', tokenize='porter unicode61')",
+    "CREATE TRIGGER IF NOT EXISTS ticket_fts_insert AFTER INSERT ON ticket BEGIN "
+    "INSERT INTO ticket_fts (rowid, name, description) VALUES (new.id, new.name, new.description); END",
+    "CREATE TRIGGER IF NOT EXISTS ticket_fts_delete AFTER DELETE ON ticket BEGIN "
+    "INSERT INTO ticket_fts (ticket_fts, rowid, name, description) "
+    "VALUES ('delete', old.id, old.name, old.description); END",
+    # Only text edits touch the index; status or due date changes don't.
+    "CREATE TRIGGER IF NOT EXISTS ticket_fts_update AFTER UPDATE OF name, description ON ticket BEGIN "
+    "INSERT INTO ticket_fts (ticket_fts, rowid, name, description) "
+    "VALUES ('delete', old.id, old.name, old.description); "
+    "INSERT INTO ticket_fts (rowid, name, description) VALUES (new.id, new.name, new.description); END",
+]
+
+# Fresh databases built with create_all() need the index too.
+for statement in POSTGRES_DDL:
+    event.listen(Ticket.__table__, "after_create", DDL(statement).execute_if(dialect="postgresql"))
+for statement in SQLITE_DDL:
+    event.listen(Ticket.__table__, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+# The FTS table isn't in the metadata, so drop_all() would otherwise leave it stale.
+event.listen(Ticket.__table__, "before_drop", DDL("DROP TABLE IF EXISTS ticket_fts").execute_if(dialect="sqlite"))
+
+ticket_fts = table("ticket_fts", column("rowid"))
+
+
+def search_terms(query):
+    """
+    Split a user query into plain word terms.
+
+    Operators and punctuation are dropped rather than passed through, so no
+    input can produce an FTS syntax error.
+
+    Raises:
+        QueryParamError: If the query has no searchable terms.
+    """
+    terms = _TERM.findall(query)[:MAX_QUERY_TERMS]
+    if not terms:
+        raise QueryParamError("q must contain at least one word.")
+    return terms
+
+
+def encode_search_cursor(offset):
+    """Encode a result offset as an opaque cursor."""
+    return base64.urlsafe_b64encode(str(offset).encode()).decode().rstrip("=")
+
+
+def decode_search_cursor(cursor):
+    """
+    Decode a cursor produced by `encode_search_cursor`.
+
+    Raises:
+        QueryParamError: If the cursor is malformed.
+    """
+    try:
+        offset = int(base64.urlsafe_b64decode((cursor + "=" * (-len(cursor) % 4)).encode()))
+    except ValueError:
+        raise QueryParamError("Invalid cursor.")
+    if offset < 0:
+        raise QueryParamError("Invalid cursor.")
+    return offset
+
+
+def _postgres_match(terms):
+    search_vector = literal_column("ticket.search_vector")
+    tsquery = func.plainto_tsquery(SEARCH_CONFIG, " ".join(terms))
+    rank = func.ts_rank_cd(search_vector, tsquery)
+    return search_vector.op("@@")(tsquery), rank.desc()
+
+
+def _sqlite_match(terms):
+    # Every term must match; each is quoted so FTS5 reads it as a plain string.
+    match = " ".join('"' + term + '"' for term in terms)
+    # bm25() is lower-is-better; weights are per column (name, description).
+    rank = func.bm25(literal_column("ticket_fts"), 4.0, 1.0)
+    return literal_column("ticket_fts").op("MATCH")(match), rank
+
+
+def ticket_search_query(args, dialect_name):
+    """
+    Build the ranked, filtered and paginated ticket search statement.
+
+    Accepts the same filters as the ticket list. Results are ordered by
+    relevance, then id, and fetched one row past the limit so the caller can
+    tell whether another page exists.
+
+    Args:
+        args (MultiDict): The request query arguments (`q`, `limit`,
+            `cursor` and the list filters).
+        dialect_name (str): The database dialect, "postgresql" or "sqlite".
+
+    Returns:
+        tuple: `(statement, limit, offset)`.
+
+    Raises:
+        QueryParamError: If a parameter has an invalid value.
+        SearchUnavailable: For databases without a search index.
+    """
+    q = args.get("q", "").strip()
+    if not q:
+        raise QueryParamError("q is required.")
+    terms = search_terms(q)
+    limit = parse_limit(args)
+    offset = decode_search_cursor(args["cursor"]) if args.get("cursor") else 0
+
+    statement = select(Ticket)
+    if dialect_name == "postgresql":
+        match, order = _postgres_match(terms)
+    elif dialect_name == "sqlite":
+        match, order = _sqlite_match(terms)
+        statement = statement.join(ticket_fts, ticket_fts.c.rowid == Ticket.id)
+    else:
+        raise SearchUnavailable(f"Full-text search is not available on {dialect_name}.")
+
+    statement = (
+        statement
+        .where(match, *ticket_filter_clauses(args))
+        .order_by(order, Ticket.id)
+        .limit(limit + 1)
+        .offset(offset)
+    )
+    return statement, limit, offset
+
+
+def rebuild_search_index(connection):
+    """
+    Rebuild the SQLite FTS index from the ticket table.
+
+    PostgreSQL's generated column can't drift, so this is a no-op there.
+    """
+    if connection.dialect.name == "sqlite":
+        connection.exec_driver_sql("INSERT INTO ticket_fts (ticket_fts) VALUES ('rebuild')")
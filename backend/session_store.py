@@ -0,0 +1,215 @@
+"""
+Tiered server-side session storage.
+
+Sessions are read through a small in-process LRU and fall back to a shared
+store (a SQL table or any cachelib cache), so most requests need no I/O at
+all. Storage is only written when a session changes, or when an unchanged
+session has used up half its lifetime and its expiry needs sliding forward.
+"""
+import itertools
+from datetime import datetime
+from flask_session.base import ServerSideSession, ServerSideSessionInterface
+from flask_session.defaults import Defaults
+from sqlalchemy import delete, select
+from cache import LRUCache
+from extensions import db
+from models import StoredSession
+
+
+class SqlSessionStore:
+    """Shared store backed by the `session_store` table."""
+
+    def __init__(self):
+        self.table = StoredSession.__table__
+
+    def get(self, store_id):
+        """Return `(data, expiry)` for a live session, or None."""
+        with db.engine.connect() as connection:
+            row = connection.execute(
+                select(self.table.c.data, self.table.c.expiry)
+                .where(self.table.c.id == store_id, self.table.c.expiry > datetime.utcnow())
+            ).first()
+        return (row.data, row.expiry) if row else None
+
+    def set(self, store_id, data, expiry):
+        values = {"id": store_id, "data": data, "expiry": expiry}
+        with db.engine.begin() as connection:
+            dialect = connection.dialect.name
+            if dialect in ("postgresql", "sqlite"):
+                if dialect == "postgresql":
+                    from sqlalchemy.dialects.postgresql import insert
+                else:
+                    from sqlalchemy.dialects.sqlite import insert
+                statement = insert(self.table).values(values)
+                connection.execute(statement.on_conflict_do_update(
+                    index_elements=[self.table.c.id],
+                    set_={"data": statement.excluded.data, "expiry": statement.excluded.expiry},
+                ))
+            else:
+                connection.execute(delete(self.table).where(self.table.c.id == store_id))
+                connection.execute(self.table.insert().values(values))
+
+    def delete(self, store_id):
+        with db.engine.begin() as connection:
+            connection.execute(delete(self.table).where(self.table.c.id == store_id))
+
+    def sweep(self, batch_size):
+        """Delete up to `batch_size` expired sessions; return how many were removed."""
+        expired = (
+            select(self.table.c.id)
+            .where(self.table.c.expiry <= datetime.utcnow())
+            .limit(batch_size)
+            .scalar_subquery()
+        )
+        with db.engine.begin() as connection:
+            return connection.execute(delete(self.table).where(self.table.c.id.in_(expired))).rowcount
+
+
+class CacheLibSessionStore:
+    """Shared store backed by any cachelib cache (Redis, Memcached, filesystem...)."""
+
+    def __init__(self, cache):
+        self.cache = cache
+
+    def get(self, store_id):
+        record = self.cache.get(store_id)
+        if record is None or record[1] <= datetime.utcnow():
+            return None
+        return record
+
+    def set(self, store_id, data, expiry):
+        timeout = max(int((expiry - datetime.utcnow()).total_seconds()), 1)
+        self.cache.set(store_id, (data, expiry), timeout=timeout)
+
+    def delete(self, store_id):
+        self.cache.delete(store_id)
+
+    def sweep(self, batch_size):
+        # cachelib backends expire entries themselves
+        return 0
+
+
+class TieredSession(ServerSideSession):
+    expires_at = None
+    refreshed = False
+
+
+class TieredSessionInterface(ServerSideSessionInterface):
+    """
+    Flask-Session interface with an in-process LRU in front of a shared store.
+
+    Args:
+        app (Flask): The Flask application instance.
+        store: A `SqlSessionStore` or `CacheLibSessionStore`.
+        lru_size (int): Sessions kept in the per-process LRU.
+        lru_ttl (float): Seconds a cached session is trusted before re-reading
+            the shared store, which bounds staleness across workers.
+        sweep_every (int): Run one expiry sweep batch every N session writes (0 to disable).
+        sweep_batch_size (int): Expired sessions removed per sweep batch.
+    """
+
+    session_class = TieredSession
+    ttl = True  # expiry is handled here, not by Flask-Session's cleanup hooks
+
+    def __init__(self, app, store, lru_size=10000, lru_ttl=5.0, sweep_every=100, sweep_batch_size=500,
+                 key_prefix=Defaults.SESSION_KEY_PREFIX, permanent=Defaults.SESSION_PERMANENT,
+                 sid_length=Defaults.SESSION_ID_LENGTH,
+                 serialization_format=Defaults.SESSION_SERIALIZATION_FORMAT):
+        self.store = store
+        self.local = LRUCache(maxsize=lru_size, ttl=lru_ttl)
+        self.sweep_every = sweep_every
+        self.sweep_batch_size = sweep_batch_size
+        self._writes = itertools.count(1)
+        super().__init__(app, key_prefix, False, permanent, sid_length, serialization_format)
+
+    def _load(self, store_id):
+        record = self.local.get(store_id)
+        if record is None:
+            stored = self.store.get(store_id)
+            if stored is None:
+                return None
+            record = (self.serializer.decode(stored[0]), stored[1])
+            self.local.set(store_id, record)
+        if record[1] <= datetime.utcnow():
+            self.local.pop(store_id)
+            return None
+        return record
+
+    def open_session(self, app, request):
+        sid = request.cookies.get(app.config["SESSION_COOKIE_NAME"])
+        if sid:
+            record = self._load(self._get_store_id(sid))
+            if record is not None:
+                session = self.session_class(record[0], sid=sid)
+                session.expires_at = record[1]
+                return session
+        return self.session_class(sid=self._generate_sid(self.sid_length), permanent=self.permanent)
+
+    def should_set_storage(self, app, session):
+        if session.modified:
+            return True
+        # Slide the expiry forward at most once per half lifetime, not per request.
+        if session.expires_at is None:
+            return False
+        return session.expires_at - datetime.utcnow() < app.permanent_session_lifetime / 2
+
+    def should_set_cookie(self, app, session):
+        return session.modified or session.refreshed
+
+    def sweep_expired(self, batch_size=None):
+        """Remove one batch of expired sessions from the shared store."""
+        return self.store.sweep(batch_size or self.sweep_batch_size)
+
+    def _retrieve_session_data(self, store_id):
+        record = self._load(store_id)
+        return record[0] if record else None
+
+    def _delete_session(self, store_id):
+        self.local.pop(store_id)
+        self.store.delete(store_id)
+
+    def _upsert_session(self, session_lifetime, session, store_id):
+        expires_at = datetime.utcnow() + session_lifetime
+        self.store.set(store_id, self.serializer.encode(session), expires_at)
+        self.local.set(store_id, (dict(session), expires_at))
+        session.expires_at = expires_at
+        session.refreshed = True
+        if self.sweep_every and next(self._writes) % self.sweep_every == 0:
+            self.sweep_expired()
+
+
+def init_session_store(app):
+    """
+    Install the session interface selected by `SESSION_BACKEND`.
+
+    "sql" and "cachelib" use `TieredSessionInterface`; "filesystem" keeps the
+    plain Flask-Session filesystem store.
+
+    Args:
+        app (Flask): The Flask application instance.
+    """
+    backend = app.config["SESSION_BACKEND"]
+    if backend == "filesystem":
+        from flask_session import Session
+        Session(app)
+        return
+
+    if backend == "sql":
+        store = SqlSessionStore()
+    elif backend == "cachelib":
+        cache = app.config.get("SESSION_CACHELIB")
+        if cache is None:
+            from cachelib.file import FileSystemCache
+            cache = FileSystemCache(app.config["SESSION_FILE_DIR"], threshold=app.config["SESSION_FILE_THRESHOLD"])
+        store = CacheLibSessionStore(cache)
+    else:
+        raise ValueError(f"Unknown SESSION_BACKEND: {backend}")
+
+    app.session_interface = TieredSessionInterface(
+        app,
+        store,
+        lru_size=app.config["SESSION_LRU_SIZE"],
+        lru_ttl=app.config["SESSION_LRU_TTL"],
+        sweep_every=app.config["SESSION_SWEEP_EVERY"],
+        sweep_batch_size=app.config["SESSION_SWEEP_BATCH_SIZE"],
+    )
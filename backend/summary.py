@@ -0,0 +1,229 @@
+"""
+Incrementally maintained ticket counts for board headers and dashboards.
+
+`ticket_summary` holds one row per (status, priority, due day) with the
+number of tickets in that group. Every flush that creates, deletes or moves
+tickets between groups upserts the net deltas on the flush's own
+connection, so the counts commit or roll back with the tickets themselves.
+
+Overdue and due-soon depend on today's date, so they aren't stored; they
+are summed from the per-day rows on read, which touches a few rows per
+(status, priority, day) however many tickets there are.
+"""
+from collections import Counter
+from datetime import date, datetime, timedelta
+from sqlalchemy import and_, case, delete, event, func, insert, inspect, select, update
+from sqlalchemy.orm import Session
+from extensions import db
+from models import Ticket, TicketSummary
+from queries import QueryParamError
+
+NO_DUE_DAY = date(9999, 12, 31)
+CLOSED_STATUSES = ("Completed",)
+DEFAULT_DUE_SOON_DAYS = 7
+MAX_DUE_SOON_DAYS = 365
+
+GROUP_FIELDS = ("status", "priority", "due_date")
+
+
+def summary_key(status, priority, due_date):
+    """Map a ticket's status, priority and due date to its `ticket_summary` key."""
+    if isinstance(due_date, datetime):
+        due_date = due_date.date()
+    return (status or "", priority or "", due_date or NO_DUE_DAY)
+
+
+def apply_summary_deltas(connection, deltas):
+    """
+    Add per-group count changes to `ticket_summary`.
+
+    Groups are upserted in key order, so concurrent writers lock rows in the
+    same order and can't deadlock each other. Dialects without ON CONFLICT
+    get an UPDATE, then an INSERT for groups that had no row; two writers
+    creating the same group at once can then fail on the primary key.
+
+    Args:
+        connection: The connection of the writing transaction.
+        deltas (Counter): Count changes keyed by `summary_key`.
+    """
+    rows = [
+        {"status": status, "priority": priority, "due_day": due_day, "count": count}
+        for (status, priority, due_day), count in sorted(deltas.items())
+        if count
+    ]
+    if not rows:
+        return
+
+    table = TicketSummary.__table__
+    dialect = connection.dialect.name
+    if dialect in ("postgresql", "sqlite"):
+        if dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert as upsert
+        else:
+            from sqlalchemy.dialects.sqlite import insert as upsert
+        statement = upsert(table)
+        statement = statement.on_conflict_do_update(
+            index_elements=[table.c.status, table.c.priority, table.c.due_day],
+            set_={"count": table.c["count"] + statement.excluded["count"]},
+        )
+        connection.execute(statement, rows)
+    else:
+        for row in rows:
+            updated = connection.execute(
+                update(table)
+                .where(
+                    table.c.status == row["status"],
+                    table.c.priority == row["priority"],
+                    table.c.due_day == row["due_day"],
+                )
+                .values(count=table.c["count"] + row["count"])
+            ).rowcount
+            if not updated:
+                connection.execute(insert(table).values(row))
+
+
+@event.listens_for(Session, "before_flush")
+def capture_summary_groups(session, flush_context, instances):
+    """Lock the rows of tickets being deleted or regrouped and read the groups they are leaving."""
+    session.info.pop("summary_old_rows", None)
+    leaving = [obj for obj in session.deleted if isinstance(obj, Ticket)]
+    leaving += [
+        obj for obj in session.dirty
+        if isinstance(obj, Ticket) and any(inspect(obj).attrs[field].history.added for field in GROUP_FIELDS)
+    ]
+    # The identity works even for expired objects, without loading them.
+    ids = [inspect(obj).identity[0] for obj in leaving if inspect(obj).identity]
+    if not ids:
+        return
+
+    rows = session.connection().execute(
+        select(Ticket.id, Ticket.status, Ticket.priority, Ticket.due_date)
+        .where(Ticket.id.in_(ids))
+        .with_for_update()
+    )
+    session.info["summary_old_rows"] = {row.id: tuple(row[1:]) for row in rows}
+
+
+@event.listens_for(Session, "after_flush")
+def apply_summary_changes(session, flush_context):
+    """Apply the flushed tickets' group changes to `ticket_summary`."""
+    old_rows = session.info.pop("summary_old_rows", {})
+    deltas = Counter()
+    for obj in session.new:
+        if isinstance(obj, Ticket):
+            deltas[summary_key(obj.status, obj.priority, obj.due_date)] += 1
+    for obj in list(session.dirty) + list(session.deleted):
+        if not isinstance(obj, Ticket) or not inspect(obj).identity:
+            continue
+        old = old_rows.get(inspect(obj).identity[0])
+        if old is None:
+            continue
+        deltas[summary_key(*old)] -= 1
+        if obj in session.deleted:
+            continue
+        state = inspect(obj)
+        new = [
+            state.attrs[field].history.added[0] if state.attrs[field].history.added else old_value
+            for field, old_value in zip(GROUP_FIELDS, old)
+        ]
+        deltas[summary_key(*new)] += 1
+    apply_summary_deltas(session.connection(), deltas)
+
+
+def rebuild_summary(connection):
+    """
+    Recompute `ticket_summary` from the ticket table, repairing any drift.
+
+    On Postgres the summary is locked for the rebuild, so ticket writes wait
+    for it rather than apply deltas to rows being replaced.
+
+    Args:
+        connection: A connection inside a transaction.
+
+    Returns:
+        tuple: `(groups, corrected)`, the number of groups after the rebuild
+        and how many of them had a different count before it.
+    """
+    table = TicketSummary.__table__
+    if connection.dialect.name == "postgresql":
+        connection.exec_driver_sql("LOCK TABLE ticket_summary IN EXCLUSIVE MODE")
+
+    def counts():
+        rows = connection.execute(select(table.c.status, table.c.priority, table.c.due_day, table.c["count"]))
+        return {(status, priority, due_day): count for status, priority, due_day, count in rows if count}
+
+    before = counts()
+    status = func.coalesce(Ticket.status, "")
+    priority = func.coalesce(Ticket.priority, "")
+    due_day = func.coalesce(func.date(Ticket.due_date), NO_DUE_DAY)
+    connection.execute(delete(table))
+    connection.execute(insert(table).from_select(
+        ["status", "priority", "due_day", "count"],
+        select(status, priority, due_day, func.count()).group_by(status, priority, due_day),
+    ))
+    after = counts()
+    corrected = sum(1 for key in before.keys() | after.keys() if before.get(key) != after.get(key))
+    return len(after), corrected
+
+
+def parse_due_soon_days(args):
+    """Read and validate the `due_soon_days` query parameter."""
+    raw = args.get("due_soon_days")
+    if raw is None:
+        return DEFAULT_DUE_SOON_DAYS
+    try:
+        days = int(raw)
+    except ValueError:
+        raise QueryParamError("due_soon_days must be an integer.")
+    if not 0 <= days <= MAX_DUE_SOON_DAYS:
+        raise QueryParamError(f"due_soon_days must be between 0 and {MAX_DUE_SOON_DAYS}.")
+    return days
+
+
+def summarize_tickets(today, due_soon_days):
+    """
+    Read the board counts from `ticket_summary`.
+
+    Overdue and due-soon only count tickets whose status isn't closed.
+
+    Args:
+        today (date): The reference day for the due buckets.
+        due_soon_days (int): Tickets due from today up to this many days
+            ahead count as due soon.
+
+    Returns:
+        dict: `total`, `open`, `by_status`, `by_priority`, `overdue`,
+        `due_soon` and `no_due_date` counts.
+    """
+    table = TicketSummary
+    is_open = table.status.notin_(CLOSED_STATUSES)
+    due_soon_end = today + timedelta(days=due_soon_days)
+    rows = db.session.execute(
+        select(
+            table.status,
+            table.priority,
+            func.sum(table.count),
+            func.sum(case((and_(is_open, table.due_day < today), table.count), else_=0)),
+            func.sum(case((and_(is_open, table.due_day >= today, table.due_day <= due_soon_end), table.count), else_=0)),
+            func.sum(case((table.due_day == NO_DUE_DAY, table.count), else_=0)),
+        ).group_by(table.status, table.priority)
+    ).all()
+
+    summary = {
+        "total": 0, "open": 0, "by_status": Counter(), "by_priority": Counter(),
+        "overdue": 0, "due_soon": 0, "no_due_date": 0,
+    }
+    for status, priority, count, overdue, due_soon, no_due_date in rows:
+        if not count:
+            continue
+        summary["total"] += count
+        if status not in CLOSED_STATUSES:
+            summary["open"] += count
+        summary["by_status"][status] += count
+        summary["by_priority"][priority] += count
+        summary["overdue"] += overdue
+        summary["due_soon"] += due_soon
+        summary["no_due_date"] += no_due_date
+    summary["by_status"] = dict(summary["by_status"])
+    summary["by_priority"] = dict(summary["by_priority"])
+    return summary
@@ -0,0 +1,77 @@
+"""
+Shared fixtures: a fresh application on a throwaway SQLite database per test,
+and a client logged in as a seeded user.
+"""
+import pytest
+
+EMAIL = "tester@example.com"
+PASSWORD = "Password123"
+
+
+@pytest.fixture
+def app(request, tmp_path, monkeypatch):
+    """The application; parametrize indirectly with True to serve the async ticket views."""
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'test.db'}")
+    monkeypatch.setenv("LOG_LEVEL", "WARNING")
+    monkeypatch.setenv("PASSWORD_HASH_WORKERS", "0")
+    monkeypatch.setenv("PASSWORD_HASH_METHOD", "pbkdf2:sha256:1000")  # Cheap hashes keep logins fast
+    monkeypatch.setenv("ASYNC_TICKETS", "1" if getattr(request, "param", False) else "0")
+    monkeypatch.setenv("RATE_LIMIT_ENABLED", "0")
+    from app import create_app
+    from extensions import db
+
+    app = create_app()
+    app.config["TESTING"] = True
+    with app.app_context():
+        db.create_all()
+    yield app
+    with app.app_context():
+        db.engine.dispose()
+    async_db = app.extensions.get("async_db")
+    if async_db:
+        async_db["loop"].run(async_db["engine"].dispose())
+
+
+@pytest.fixture
+def user_id(app):
+    from extensions import db
+    from models import User
+
+    with app.app_context():
+        user = User(name="Tester", email=EMAIL)
+        user.set_password(PASSWORD)
+        db.session.add(user)
+        db.session.commit()
+        return user.id
+
+
+@pytest.fixture
+def client(app, user_id):
+    client = app.test_client()
+    response = client.post("/api/users/login", json={"email": EMAIL, "password": PASSWORD})
+    assert response.status_code == 200, response.get_json()
+    return client
+
+
+@pytest.fixture
+def create_ticket(client, user_id):
+    """Create a ticket through the API and return its JSON representation."""
+    def create(**fields):
+        body = {"name": "Ticket", "description": "Details", "author_id": user_id, **fields}
+        response = client.post("/api/tickets", json=body)
+        assert response.status_code == 201, response.get_json()
+        return response.get_json()
+    return create
+
+
+@pytest.fixture
+def query_budget():
+    """
+    Assert a maximum query count for a block, e.g.
+
+        def test_list_tickets(client, query_budget):
+            with query_budget(3):
+                client.get("/api/tickets")
+    """
+    from query_budget import count_queries
+    return count_queries
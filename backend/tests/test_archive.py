@@ -0,0 +1,104 @@
+import json
+from datetime import datetime, timedelta
+import pytest
+
+
+def age(app, *ticket_ids):
+    from extensions import db
+    from models import Ticket
+
+    with app.app_context():
+        db.session.execute(
+            Ticket.__table__.update()
+            .where(Ticket.id.in_(ticket_ids))
+            .values(updated_at=datetime.utcnow() - timedelta(days=100))
+        )
+        db.session.commit()
+
+
+@pytest.fixture
+def archivable(app, client, create_ticket):
+    """Three tickets: an old closed one, an old open one, and a recently closed one."""
+    old_closed = create_ticket(name="Old closed")["id"]
+    old_open = create_ticket(name="Old open")["id"]
+    recent_closed = create_ticket(name="Recently closed")["id"]
+    for ticket_id in (old_closed, recent_closed):
+        client.put(f"/api/tickets/{ticket_id}", json={"status": "Completed"})
+    age(app, old_closed, old_open)
+    return old_closed, old_open, recent_closed
+
+
+def archive(app):
+    from archive import archive_tickets
+    with app.app_context():
+        return archive_tickets(timedelta(days=90))
+
+
+def list_ids(client, **params):
+    return [t["id"] for t in client.get("/api/tickets", query_string=params).get_json()["tickets"]]
+
+
+def test_moves_old_closed_tickets(app, client, archivable):
+    from models import TicketArchive
+
+    old_closed, old_open, recent_closed = archivable
+    since = client.get("/api/tickets").get_json()["change_cursor"]
+
+    assert archive(app) == 1
+    assert archive(app) == 0
+    with app.app_context():
+        assert [row.id for row in TicketArchive.query.all()] == [old_closed]
+
+    assert list_ids(client) == [old_open, recent_closed]
+    assert list_ids(client, include_archived=1) == [old_closed, old_open, recent_closed]
+
+    export = client.get("/api/tickets/export", query_string={"format": "ndjson", "include_archived": 1})
+    assert [json.loads(line)["id"] for line in export.get_data(as_text=True).splitlines()] == [
+        old_closed, old_open, recent_closed,
+    ]
+
+    delta = client.get("/api/tickets/changes", query_string={"since": since}).get_json()
+    assert delta["deleted"] == [old_closed]
+
+    summary = client.get("/api/tickets/summary").get_json()
+    assert summary["total"] == 2
+
+
+def test_ids_of_archived_tickets_are_never_reused(app, client, create_ticket):
+    first = create_ticket(name="First")["id"]
+    client.put(f"/api/tickets/{first}", json={"status": "Completed"})
+    age(app, first)
+    assert archive(app) == 1
+
+    # With no live tickets left, SQLite would otherwise hand out the archived id again
+    second = create_ticket(name="Second")["id"]
+    assert second > first
+    client.delete(f"/api/tickets/{second}")
+    third = create_ticket(name="Third")["id"]
+    assert third > second
+    client.put(f"/api/tickets/{third}", json={"status": "Completed"})
+    age(app, third)
+    assert archive(app) == 1
+
+    assert list_ids(client, include_archived=1) == [first, third]
+
+
+def test_archived_tickets_are_read_only(app, client, archivable):
+    old_closed = archivable[0]
+    archive(app)
+
+    assert client.put(f"/api/tickets/{old_closed}", json={"name": "Reopened"}).status_code == 404
+    assert client.delete(f"/api/tickets/{old_closed}").status_code == 404
+
+
+def test_live_subscribers_get_delete_events(app, archivable):
+    from events import broadcaster
+
+    subscription = broadcaster.subscribe()
+    try:
+        archive(app)
+        seq, payload = subscription.get(timeout=1)
+    finally:
+        broadcaster.unsubscribe(subscription)
+    assert json.loads(payload) == {"op": "delete", "id": archivable[0]}
+    assert subscription.get(timeout=0) is None
@@ -0,0 +1,76 @@
+"""The async ticket views (ASYNC_TICKETS=1, aiosqlite) must answer exactly like the sync ones."""
+import pytest
+
+pytestmark = pytest.mark.parametrize("app", [False, True], ids=["sync", "async"], indirect=True)
+
+
+def without_timestamps(ticket):
+    return {key: value for key, value in ticket.items() if key != "created_at"}
+
+
+def test_views_are_installed(app):
+    from routes import async_ticket_routes
+
+    async_db = app.extensions.get("async_db")
+    view = app.view_functions["tickets_blueprint.create_ticket"]
+    assert (view is async_ticket_routes.create_ticket) == (async_db is not None)
+    if async_db is not None:
+        assert async_db["engine"].url.drivername == "sqlite+aiosqlite"
+
+
+def test_list_create_update_delete(client, user_id):
+    first = client.get("/api/tickets")
+    assert first.status_code == 200
+    assert first.get_json()["tickets"] == []
+    etag = first.headers["ETag"]
+    since = first.get_json()["change_cursor"]
+    assert client.get("/api/tickets", headers={"If-None-Match": etag}).status_code == 304
+
+    created = client.post("/api/tickets", json={
+        "name": "Printer", "description": "Jammed", "priority": "High", "due_date": "2030-01-02",
+        "author_id": user_id,
+    })
+    assert created.status_code == 201
+    ticket_id = created.get_json()["id"]
+    assert without_timestamps(created.get_json()) == {
+        "id": ticket_id, "name": "Printer", "description": "Jammed", "due_date": "2030-01-02",
+        "status": "To be done", "priority": "High", "author_id": user_id,
+    }
+    assert client.post("/api/tickets", json={"description": "No name"}).status_code == 400
+
+    listed = client.get("/api/tickets", headers={"If-None-Match": etag})
+    assert listed.status_code == 200
+    assert listed.headers["ETag"] != etag
+    assert listed.get_json()["tickets"] == [created.get_json()]
+    etag = listed.headers["ETag"]
+
+    updated = client.put(f"/api/tickets/{ticket_id}", json={"status": "Completed"})
+    assert updated.status_code == 200
+    assert updated.get_json() == dict(created.get_json(), status="Completed")
+    assert client.put("/api/tickets/9999", json={"status": "Completed"}).status_code == 404
+
+    changes = client.get("/api/tickets/changes", query_string={"since": since}).get_json()
+    assert [t["status"] for t in changes["tickets"]] == ["Completed"]
+    assert changes["cursor"] == since + 2  # One change sequence number per write
+
+    listed = client.get("/api/tickets", headers={"If-None-Match": etag})
+    assert listed.status_code == 200
+    assert listed.get_json()["change_cursor"] == changes["cursor"]
+
+    assert client.delete(f"/api/tickets/{ticket_id}").status_code == 200
+    changes = client.get("/api/tickets/changes", query_string={"since": changes["cursor"]}).get_json()
+    assert changes["deleted"] == [ticket_id]
+    assert client.get("/api/tickets").get_json()["tickets"] == []
+
+
+def test_pages_and_filters(client, create_ticket):
+    ids = [create_ticket(priority="High" if i % 2 else "Low")["id"] for i in range(5)]
+
+    page = client.get("/api/tickets", query_string={"limit": 2, "priority": "Low"}).get_json()
+    assert [t["id"] for t in page["tickets"]] == [ids[0], ids[2]]
+    rest = client.get("/api/tickets", query_string={"limit": 2, "priority": "Low", "cursor": page["next_cursor"]})
+    assert [t["id"] for t in rest.get_json()["tickets"]] == [ids[4]]
+    assert rest.get_json()["next_cursor"] is None
+    assert rest.get_json()["change_cursor"] is None
+
+    assert client.get("/api/tickets", query_string={"cursor": "garbage"}).status_code == 400
@@ -0,0 +1,38 @@
+def test_unchanged_list_is_not_modified(client, create_ticket):
+    create_ticket()
+    first = client.get("/api/tickets")
+    assert first.status_code == 200
+    assert first.headers["ETag"]
+    assert "Last-Modified" not in first.headers
+
+    again = client.get("/api/tickets", headers={"If-None-Match": first.headers["ETag"]})
+    assert again.status_code == 304
+
+
+def test_delete_changes_the_etag(client, create_ticket):
+    ids = [create_ticket()["id"] for _ in range(3)]
+    etag = client.get("/api/tickets").headers["ETag"]
+    assert client.delete(f"/api/tickets/{ids[0]}").status_code == 200
+
+    response = client.get("/api/tickets", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert [t["id"] for t in response.get_json()["tickets"]] == ids[1:]
+
+
+def test_if_modified_since_is_ignored(client, create_ticket):
+    ids = [create_ticket()["id"] for _ in range(3)]
+    client.delete(f"/api/tickets/{ids[0]}")
+    response = client.get("/api/tickets", headers={"If-Modified-Since": "Fri, 01 Jan 2100 00:00:00 GMT"})
+    assert response.status_code == 200
+    assert len(response.get_json()["tickets"]) == 2
+
+
+def test_editing_a_ticket_out_of_the_filter_changes_the_etag(client, create_ticket):
+    older = create_ticket(status="Open")["id"]
+    create_ticket(status="Open")
+    etag = client.get("/api/tickets", query_string={"status": "Open"}).headers["ETag"]
+    client.put(f"/api/tickets/{older}", json={"status": "Completed"})
+
+    response = client.get("/api/tickets", query_string={"status": "Open"}, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert len(response.get_json()["tickets"]) == 1
@@ -0,0 +1,17 @@
+import pytest
+
+
+@pytest.mark.parametrize("profile, journal_mode", [("web", "wal"), ("default", "delete")])
+def test_sqlite_pragmas_follow_the_profile(tmp_path, monkeypatch, profile, journal_mode):
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'profile.db'}")
+    monkeypatch.setenv("LOG_LEVEL", "WARNING")
+    monkeypatch.setenv("PASSWORD_HASH_WORKERS", "0")
+    monkeypatch.setenv("DB_PROFILE", profile)
+    from app import create_app
+    from extensions import db
+
+    app = create_app()
+    with app.app_context():
+        with db.engine.connect() as connection:
+            assert connection.exec_driver_sql("PRAGMA journal_mode").scalar() == journal_mode
+        db.engine.dispose()
@@ -0,0 +1,30 @@
+import pytest
+from werkzeug.security import generate_password_hash
+import hashing
+from hashing import PasswordHasher, method_prefix
+
+
+@pytest.mark.parametrize("method", [
+    "scrypt", "scrypt:16384:8:1", "pbkdf2", "pbkdf2:sha512", "pbkdf2:sha256:1000",
+])
+def test_prefix_matches_werkzeug(method):
+    assert method_prefix(method) == generate_password_hash("secret", method).split("$", 1)[0]
+
+
+@pytest.mark.parametrize("method", ["bcrypt", "scrypt:1:2", "pbkdf2:sha256:1000:1"])
+def test_invalid_method_is_rejected(method):
+    with pytest.raises(ValueError):
+        PasswordHasher(method)
+
+
+def test_needs_rehash_does_not_hash(monkeypatch):
+    hasher = PasswordHasher("pbkdf2:sha256:1000", workers=0)
+    current = hasher.hash("secret")
+    old = generate_password_hash("secret", "pbkdf2:sha256:500")
+
+    def fail(*args):
+        raise AssertionError("needs_rehash must not hash")
+
+    monkeypatch.setattr(hashing, "generate_password_hash", fail)
+    assert not hasher.needs_rehash(current)
+    assert hasher.needs_rehash(old)
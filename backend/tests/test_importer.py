@@ -0,0 +1,104 @@
+import io
+import json
+from datetime import date
+import pytest
+
+
+def write_ndjson(path, records):
+    path.write_text("".join(json.dumps(record) + "\n" for record in records))
+    return str(path)
+
+
+def ticket_names(app):
+    from models import Ticket
+    with app.app_context():
+        return [ticket.name for ticket in Ticket.query.order_by(Ticket.id)]
+
+
+def test_resumes_after_a_failed_batch(app, user_id, tmp_path, monkeypatch):
+    import importer
+    from summary import summarize_tickets
+
+    path = write_ndjson(tmp_path / "tickets.ndjson", [{"name": f"T{i}", "author_id": user_id} for i in range(7)])
+    write_batch = importer.write_batch
+    calls = []
+
+    def failing_write_batch(connection, rows, use_copy):
+        calls.append(len(rows))
+        if len(calls) == 2:
+            raise RuntimeError("Connection lost")
+        write_batch(connection, rows, use_copy)
+
+    monkeypatch.setattr(importer, "write_batch", failing_write_batch)
+    with app.app_context(), pytest.raises(RuntimeError):
+        importer.import_tickets(path, batch_size=3, job_id="job")
+    assert ticket_names(app) == ["T0", "T1", "T2"]
+
+    monkeypatch.setattr(importer, "write_batch", write_batch)
+    with app.app_context():
+        counts = importer.import_tickets(path, batch_size=3, job_id="job")
+    assert counts == {"records": 7, "imported": 7, "rejected": 0}
+    assert ticket_names(app) == [f"T{i}" for i in range(7)]
+
+    with app.app_context():
+        assert summarize_tickets(date.today(), 7)["total"] == 7
+
+
+def test_rejects_are_reported_and_skipped(app, user_id, tmp_path):
+    from importer import import_tickets
+
+    path = tmp_path / "tickets.csv"
+    path.write_text(
+        "name,status,author_id\n"
+        "Good,Open,\n"
+        ",Open,\n"
+        "Unknown author,Open,999\n"
+        f"{'x' * 101},Open,\n"
+        f"Also good,,{user_id}\n"
+    )
+    rejects = io.StringIO()
+    with app.app_context():
+        counts = import_tickets(str(path), batch_size=2, rejects=rejects)
+
+    assert counts == {"records": 5, "imported": 2, "rejected": 3}
+    assert ticket_names(app) == ["Good", "Also good"]
+    lines = [json.loads(line) for line in rejects.getvalue().splitlines()]
+    assert [line["record"] for line in lines] == [2, 3, 4]
+    assert lines[1]["error"] == "Unknown author_id 999."
+    assert lines[1]["raw"]["author_id"] == "999"
+
+
+def test_finished_job_needs_restart(app, user_id, tmp_path):
+    from importer import TicketImportError, import_tickets
+
+    path = write_ndjson(tmp_path / "tickets.ndjson", [{"name": "Once"}])
+    with app.app_context():
+        import_tickets(path)
+        with pytest.raises(TicketImportError):
+            import_tickets(path)
+        assert import_tickets(path, restart=True)["imported"] == 1
+    assert ticket_names(app) == ["Once", "Once"]
+
+
+def test_imported_tickets_reach_delta_sync(client, tmp_path, app):
+    from importer import import_tickets
+
+    since = client.get("/api/tickets").get_json()["change_cursor"]
+    path = write_ndjson(tmp_path / "tickets.ndjson", [{"name": "Imported"}])
+    with app.app_context():
+        import_tickets(path)
+
+    delta = client.get("/api/tickets/changes", query_string={"since": since}).get_json()
+    assert [ticket["name"] for ticket in delta["tickets"]] == ["Imported"]
+
+
+def test_same_name_and_size_is_a_different_job(app, tmp_path):
+    from importer import import_tickets
+
+    first = write_ndjson(tmp_path / "tickets.ndjson", [{"name": "AAAA"}, {"name": "BBBB"}])
+    (tmp_path / "other").mkdir()
+    second = write_ndjson(tmp_path / "other" / "tickets.ndjson", [{"name": "CCCC"}, {"name": "DDDD"}])
+    with app.app_context():
+        import_tickets(first, batch_size=1)
+        assert import_tickets(second, batch_size=1)["imported"] == 2
+    assert ticket_names(app) == ["AAAA", "BBBB", "CCCC", "DDDD"]
@@ -0,0 +1,31 @@
+import pytest
+
+
+def test_endpoint_is_off_by_default(client):
+    assert client.get("/api/metrics").status_code == 404
+
+
+@pytest.fixture
+def metrics_app(monkeypatch, app):
+    monkeypatch.setenv("METRICS_ENDPOINT_ENABLED", "1")
+    monkeypatch.setenv("METRICS_TOKEN", "scrape-secret")
+    from app import create_app
+    return create_app()
+
+
+def test_endpoint_requires_the_token(metrics_app):
+    client = metrics_app.test_client()
+    assert client.get("/api/metrics").status_code == 401
+    assert client.get("/api/metrics", headers={"Authorization": "Bearer wrong"}).status_code == 401
+
+    response = client.get("/api/metrics", headers={"Authorization": "Bearer scrape-secret"})
+    assert response.status_code == 200
+    assert b"http_requests_total" in response.data
+
+
+def test_enabling_the_endpoint_without_a_token_fails(monkeypatch, app):
+    monkeypatch.setenv("METRICS_ENDPOINT_ENABLED", "1")
+    monkeypatch.delenv("METRICS_TOKEN", raising=False)
+    from app import create_app
+    with pytest.raises(ValueError):
+        create_app()
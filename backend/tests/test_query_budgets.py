@@ -0,0 +1,67 @@
+"""
+Query budgets for the hot endpoints. A budget that starts failing usually
+means a lazy load per row (N+1) or an extra round trip crept in; raise one
+only when the new query is deliberate.
+"""
+import pytest
+
+LIST_BUDGET = 3  # Version aggregate, change cursor, one page
+NEXT_PAGE_BUDGET = 2  # No change cursor after the first page
+CREATE_BUDGET = 4  # Change seq, insert, summary upsert, reload for the response
+UPDATE_BUDGET = 6  # Load, change seq, summary lock, update, summary upsert, reload
+DELETE_BUDGET = 6  # Load, change seq, summary lock, tombstone, delete, summary upsert
+CHANGES_BUDGET = 3  # Counter, upserted tickets, tombstones
+
+
+@pytest.fixture
+def tickets(create_ticket):
+    return [create_ticket(name=f"Ticket {i}")["id"] for i in range(60)]
+
+
+@pytest.mark.parametrize("limit", [1, 50])
+def test_list(client, tickets, query_budget, limit):
+    with query_budget(LIST_BUDGET):
+        first = client.get("/api/tickets", query_string={"limit": limit})
+    assert len(first.get_json()["tickets"]) == limit
+
+    with query_budget(NEXT_PAGE_BUDGET):
+        response = client.get("/api/tickets", query_string={"limit": limit, "cursor": first.get_json()["next_cursor"]})
+    assert response.status_code == 200
+
+
+def test_create(client, user_id, query_budget):
+    with query_budget(CREATE_BUDGET):
+        response = client.post("/api/tickets", json={"name": "New", "description": "d", "author_id": user_id})
+    assert response.status_code == 201
+
+
+def test_update(client, tickets, query_budget):
+    with query_budget(UPDATE_BUDGET):
+        response = client.put(f"/api/tickets/{tickets[0]}", json={"status": "Completed", "name": "Done"})
+    assert response.status_code == 200
+
+
+def test_delete(client, tickets, query_budget):
+    with query_budget(DELETE_BUDGET):
+        response = client.delete(f"/api/tickets/{tickets[0]}")
+    assert response.status_code == 200
+
+
+def test_changes(client, tickets, query_budget):
+    client.delete(f"/api/tickets/{tickets[0]}")
+    with query_budget(CHANGES_BUDGET):
+        response = client.get("/api/tickets/changes", query_string={"since": 0, "limit": 200})
+    assert len(response.get_json()["tickets"]) == len(tickets) - 1
+
+
+def test_session_check(app, client, user_id, query_budget):
+    from identity import get_identity_cache
+
+    # Warm: the session and the identity are both cached in process
+    with query_budget(0):
+        assert client.get("/api/users/session").status_code == 200
+
+    with app.app_context():
+        get_identity_cache().invalidate(user_id)
+    with query_budget(1):
+        assert client.get("/api/users/session").status_code == 200
@@ -0,0 +1,67 @@
+"""
+Every hot ticket list query must be answered from an index, not a scan of
+`ticket`. Runs on a temporary SQLite file. Set PLAN_CHECK_DATABASE_URL to a
+PostgreSQL database to check its plans too; the test builds and drops a
+throwaway schema there and leaves the rest of the database alone.
+"""
+import os
+import uuid
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from benchmarks.check_query_plans import HOT_QUERIES, hot_statements, sequential_scans
+
+
+def plan_backends():
+    backends = ["sqlite"]
+    if os.environ.get("PLAN_CHECK_DATABASE_URL"):
+        backends.append("postgresql")
+    return backends
+
+
+@pytest.fixture(scope="module", params=plan_backends())
+def plan_connection(request, tmp_path_factory):
+    schema = None
+    if request.param == "sqlite":
+        database_url = f"sqlite:///{tmp_path_factory.mktemp('plans') / 'plans.db'}"
+    else:
+        url = make_url(os.environ["PLAN_CHECK_DATABASE_URL"])
+        if url.get_backend_name() != "postgresql":
+            pytest.skip("PLAN_CHECK_DATABASE_URL must point at a PostgreSQL database")
+        schema = f"plan_check_{uuid.uuid4().hex[:12]}"
+        admin = create_engine(url)
+        with admin.begin() as connection:
+            connection.exec_driver_sql(f'CREATE SCHEMA "{schema}"')
+        database_url = url.update_query_dict({"options": f"-csearch_path={schema}"}).render_as_string(
+            hide_password=False
+        )
+
+    try:
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            monkeypatch.setenv("DATABASE_URL", database_url)
+            monkeypatch.setenv("LOG_LEVEL", "WARNING")
+            monkeypatch.setenv("PASSWORD_HASH_WORKERS", "0")
+            from app import create_app
+            from extensions import db
+            from benchmarks.seed import seed
+
+            app = create_app()
+            with app.app_context():
+                db.create_all()
+                seed(20, 5000)
+                with db.engine.connect() as connection:
+                    connection.exec_driver_sql("ANALYZE")
+                    yield connection
+                db.engine.dispose()
+    finally:
+        if schema is not None:
+            with admin.begin() as connection:
+                connection.exec_driver_sql(f'DROP SCHEMA "{schema}" CASCADE')
+            admin.dispose()
+
+
+@pytest.mark.parametrize("name", list(HOT_QUERIES))
+def test_hot_list_query_uses_an_index(plan_connection, name):
+    statement = dict(hot_statements())[name]
+    offending, plan = sequential_scans(plan_connection, statement)
+    assert not offending, f"{name} scans ticket:\n{plan}"
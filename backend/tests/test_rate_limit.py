@@ -0,0 +1,64 @@
+import pytest
+from conftest import EMAIL, PASSWORD
+
+
+@pytest.fixture
+def limiter(app):
+    """Turn rate limiting on with small limits for this app."""
+    from rate_limit import init_rate_limiter
+
+    app.config.update(
+        RATE_LIMIT_ENABLED=True,
+        RATE_LIMIT_BACKEND="memory",
+        RATE_LIMIT_LOGIN_IP="3/minute",
+        RATE_LIMIT_LOGIN_EMAIL="1/minute",
+        RATE_LIMIT_REGISTER_IP="",
+        RATE_LIMIT_MAX_CONCURRENT=1,
+    )
+    init_rate_limiter(app)
+    return app.extensions["rate_limiter"]
+
+
+def login(client, email=EMAIL, password=PASSWORD):
+    return client.post("/api/users/login", json={"email": email, "password": password})
+
+
+def test_rejects_with_retry_after(app, user_id, limiter):
+    client = app.test_client()
+    assert login(client).status_code == 200
+
+    response = login(client)
+    assert response.status_code == 429
+    assert 1 <= int(response.headers["Retry-After"]) <= 60
+
+
+def test_rejected_requests_dont_use_up_other_buckets(app, user_id, limiter):
+    client = app.test_client()
+    assert login(client).status_code == 200
+    for _ in range(3):
+        assert login(client).status_code == 429  # The email bucket is empty
+
+    # The IP bucket still has the two tokens the rejected requests didn't take
+    assert login(client, "other@example.com").status_code == 401
+    assert login(client, "third@example.com").status_code == 401
+    assert login(client, "fourth@example.com").status_code == 429
+
+
+def test_concurrency_cap_rejects_without_taking_tokens(app, user_id, limiter):
+    client = app.test_client()
+    assert limiter.acquire()
+    try:
+        assert login(client).status_code == 429
+    finally:
+        limiter.release()
+
+    assert login(client).status_code == 200
+
+
+def test_profile_updates_are_not_limited(client, limiter):
+    assert limiter.acquire()
+    try:
+        response = client.put("/api/users/update", json={"name": "Renamed"})
+    finally:
+        limiter.release()
+    assert response.status_code == 200
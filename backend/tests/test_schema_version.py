@@ -0,0 +1,86 @@
+import pytest
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+# The schema the original app built with `db.create_all()`, before migrations ran at startup
+baseline = sa.MetaData()
+sa.Table(
+    "user", baseline,
+    sa.Column("id", sa.Integer, primary_key=True),
+    sa.Column("name", sa.String(100), nullable=False),
+    sa.Column("email", sa.String(100), unique=True, nullable=False),
+    sa.Column("password_hash", sa.String(255), nullable=False),
+    sa.Column("reset_token", sa.String(100)),
+    sa.Column("reset_token_expiry", sa.DateTime),
+    sa.Column("image", sa.String(100)),
+    sa.Column("created_at", sa.DateTime),
+    sa.Column("active", sa.Boolean),
+)
+sa.Table(
+    "ticket", baseline,
+    sa.Column("id", sa.Integer, primary_key=True),
+    sa.Column("name", sa.String(100), nullable=False),
+    sa.Column("description", sa.Text, nullable=False),
+    sa.Column("created_at", sa.DateTime),
+    sa.Column("due_date", sa.DateTime),
+    sa.Column("status", sa.String(20)),
+    sa.Column("priority", sa.String(10)),
+    sa.Column("author_id", sa.Integer, sa.ForeignKey("user.id")),
+)
+
+
+@pytest.fixture
+def empty_app(tmp_path, monkeypatch):
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'schema.db'}")
+    monkeypatch.setenv("LOG_LEVEL", "WARNING")
+    monkeypatch.setenv("PASSWORD_HASH_WORKERS", "0")
+    from app import create_app
+    from extensions import db
+
+    app = create_app()
+    yield app
+    with app.app_context():
+        db.engine.dispose()
+
+
+def test_new_database_is_created_and_stamped(empty_app):
+    from schema_version import current_revision, ensure_schema, head_revision
+
+    with empty_app.app_context():
+        assert ensure_schema() == "created"
+        assert current_revision() == head_revision()
+        assert ensure_schema() == "current"
+
+
+def test_baseline_database_is_stamped_and_upgraded(empty_app):
+    from extensions import db
+    from schema_version import current_revision, ensure_schema, head_revision
+
+    with empty_app.app_context():
+        baseline.create_all(db.engine)
+        with db.engine.begin() as connection:
+            connection.execute(baseline.tables["user"].insert().values(
+                id=1, name="Existing", email="existing@example.com", password_hash="x",
+            ))
+            connection.execute(baseline.tables["ticket"].insert().values(
+                name="Kept", description="Survives the upgrade", status="Open", author_id=1,
+            ))
+
+        assert ensure_schema() == "upgraded"
+        assert current_revision() == head_revision()
+        assert {"ticket_summary", "ticket_archive", "change_counter"} <= set(inspect(db.engine).get_table_names())
+
+    with empty_app.app_context():
+        from models import Ticket
+        assert [ticket.name for ticket in Ticket.query.all()] == ["Kept"]
+
+
+def test_unknown_unversioned_schema_is_refused(empty_app):
+    from extensions import db
+    from schema_version import SchemaError, ensure_schema
+
+    with empty_app.app_context():
+        with db.engine.begin() as connection:
+            connection.exec_driver_sql("CREATE TABLE something_else (id INTEGER PRIMARY KEY)")
+        with pytest.raises(SchemaError):
+            ensure_schema()
@@ -0,0 +1,74 @@
+def batch(client, *operations):
+    return client.post("/api/tickets/batch", json={"operations": list(operations)})
+
+
+def ticket_ids(client):
+    return [t["id"] for t in client.get("/api/tickets").get_json()["tickets"]]
+
+
+def test_applies_every_operation(client, create_ticket, user_id):
+    updated = create_ticket(name="Old")["id"]
+    deleted = create_ticket()["id"]
+
+    response = batch(
+        client,
+        {"op": "create", "data": {"name": "New", "author_id": user_id}},
+        {"op": "update", "id": updated, "data": {"name": "Renamed"}},
+        {"op": "delete", "id": deleted},
+    )
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body["applied"] is True
+    assert [r["status"] for r in body["results"]] == [201, 200, 200]
+    created = body["results"][0]["id"]
+    assert body["results"][0]["ticket"]["name"] == "New"
+    assert body["results"][1]["ticket"]["name"] == "Renamed"
+    assert ticket_ids(client) == [updated, created]
+
+
+def test_unknown_ticket_rolls_back_the_whole_batch(client, create_ticket):
+    existing = create_ticket(name="Keep")["id"]
+
+    response = batch(
+        client,
+        {"op": "create", "data": {"name": "Not saved"}},
+        {"op": "update", "id": existing, "data": {"name": "Not renamed"}},
+        {"op": "delete", "id": 9999},
+    )
+    assert response.status_code == 400
+    body = response.get_json()
+    assert body["applied"] is False
+    assert [r["status"] for r in body["results"]] == [424, 424, 404]
+    assert body["results"][2]["error"] == "Ticket not found."
+
+    tickets = client.get("/api/tickets").get_json()["tickets"]
+    assert [(t["id"], t["name"]) for t in tickets] == [(existing, "Keep")]
+
+
+def test_operation_on_a_ticket_deleted_earlier_conflicts(client, create_ticket):
+    ticket_id = create_ticket()["id"]
+
+    response = batch(
+        client,
+        {"op": "delete", "id": ticket_id},
+        {"op": "update", "id": ticket_id, "data": {"name": "Too late"}},
+    )
+    assert response.status_code == 400
+    assert [r["status"] for r in response.get_json()["results"]] == [424, 409]
+    assert ticket_ids(client) == [ticket_id]
+
+
+def test_invalid_create_is_rejected(client):
+    response = batch(client, {"op": "create", "data": {"name": ""}})
+    assert response.status_code == 400
+    assert response.get_json()["results"][0]["status"] == 400
+    assert ticket_ids(client) == []
+
+
+def test_malformed_body(client):
+    from schemas import MAX_BATCH_OPERATIONS
+
+    assert batch(client).status_code == 400
+    assert batch(client, {"op": "rename", "id": 1}).status_code == 400
+    too_many = [{"op": "create", "data": {"name": "x"}}] * (MAX_BATCH_OPERATIONS + 1)
+    assert batch(client, *too_many).status_code == 400
@@ -0,0 +1,71 @@
+from datetime import timedelta
+
+
+def changes(client, since, **params):
+    response = client.get("/api/tickets/changes", query_string={"since": since, **params})
+    assert response.status_code == 200, response.get_json()
+    return response.get_json()
+
+
+def test_change_cursor_picks_up_creates_updates_and_deletes(client, create_ticket):
+    kept = create_ticket()["id"]
+    removed = create_ticket()["id"]
+    since = client.get("/api/tickets").get_json()["change_cursor"]
+
+    assert changes(client, since) == {"tickets": [], "deleted": [], "cursor": since, "has_more": False}
+
+    created = create_ticket(name="New")["id"]
+    client.put(f"/api/tickets/{kept}", json={"status": "Completed"})
+    client.delete(f"/api/tickets/{removed}")
+
+    delta = changes(client, since)
+    assert {t["id"]: t["status"] for t in delta["tickets"]} == {created: "To be done", kept: "Completed"}
+    assert delta["deleted"] == [removed]
+    assert delta["cursor"] > since
+    assert not delta["has_more"]
+
+    assert changes(client, delta["cursor"])["tickets"] == []
+
+
+def test_created_then_deleted_ticket_is_only_reported_deleted(client, create_ticket):
+    since = client.get("/api/tickets").get_json()["change_cursor"]
+    ticket_id = create_ticket()["id"]
+    client.delete(f"/api/tickets/{ticket_id}")
+
+    delta = changes(client, since)
+    assert delta["tickets"] == []
+    assert delta["deleted"] == [ticket_id]
+
+
+def test_changes_are_paged(client, create_ticket):
+    ids = [create_ticket()["id"] for _ in range(5)]
+    first = changes(client, 0, limit=2)
+    assert [t["id"] for t in first["tickets"]] == ids[:2]
+    assert first["has_more"]
+
+    rest = changes(client, first["cursor"], limit=10)
+    assert [t["id"] for t in rest["tickets"]] == ids[2:]
+    assert not rest["has_more"]
+
+
+def test_cursor_before_compaction_expires(app, client, create_ticket):
+    ticket_id = create_ticket()["id"]
+    since = client.get("/api/tickets").get_json()["change_cursor"]
+    client.delete(f"/api/tickets/{ticket_id}")
+
+    from changes import compact_tombstones
+    with app.app_context():
+        assert compact_tombstones(timedelta(0)) == 1
+
+    response = client.get("/api/tickets/changes", query_string={"since": since})
+    assert response.status_code == 410
+    assert response.get_json()["resync"] is True
+
+    # A fresh cursor from the list works again
+    fresh = client.get("/api/tickets").get_json()["change_cursor"]
+    assert changes(client, fresh)["deleted"] == []
+
+
+def test_invalid_since_is_rejected(client):
+    assert client.get("/api/tickets/changes", query_string={"since": "x"}).status_code == 400
+    assert client.get("/api/tickets/changes", query_string={"since": -1}).status_code == 400
@@ -0,0 +1,84 @@
+def fetch_all(client, **params):
+    """Follow `next_cursor` through every page and return the tickets in order."""
+    tickets, cursor = [], None
+    while True:
+        response = client.get("/api/tickets", query_string={**params, "cursor": cursor})
+        assert response.status_code == 200
+        page = response.get_json()
+        tickets += page["tickets"]
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return tickets
+
+
+def test_requires_login(app):
+    assert app.test_client().get("/api/tickets").status_code == 401
+
+
+def test_pages_follow_creation_order_without_gaps(client, create_ticket):
+    created = [create_ticket(name=f"Ticket {i}")["id"] for i in range(7)]
+
+    first = client.get("/api/tickets", query_string={"limit": 3}).get_json()
+    assert [t["id"] for t in first["tickets"]] == created[:3]
+    assert first["next_cursor"] is not None
+    assert first["change_cursor"] is not None
+
+    second = client.get("/api/tickets", query_string={"limit": 3, "cursor": first["next_cursor"]}).get_json()
+    assert [t["id"] for t in second["tickets"]] == created[3:6]
+    assert second["change_cursor"] is None
+
+    assert [t["id"] for t in fetch_all(client, limit=3)] == created
+
+
+def test_last_page_has_no_cursor(client, create_ticket):
+    create_ticket()
+    page = client.get("/api/tickets", query_string={"limit": 1}).get_json()
+    assert len(page["tickets"]) == 1
+    assert page["next_cursor"] is None
+
+
+def test_cursor_is_stable_across_inserts(client, create_ticket):
+    created = [create_ticket()["id"] for _ in range(4)]
+    first = client.get("/api/tickets", query_string={"limit": 2}).get_json()
+    newer = create_ticket()["id"]
+    rest = client.get("/api/tickets", query_string={"limit": 10, "cursor": first["next_cursor"]}).get_json()
+    assert [t["id"] for t in rest["tickets"]] == created[2:] + [newer]
+
+
+def test_filters(client, create_ticket):
+    high_open = create_ticket(status="Open", priority="High", due_date="2024-01-10")["id"]
+    low_open = create_ticket(status="Open", priority="Low", due_date="2024-01-20")["id"]
+    high_done = create_ticket(status="Completed", priority="High")["id"]
+
+    def ids(**params):
+        return [t["id"] for t in fetch_all(client, **params)]
+
+    assert ids(status="Open") == [high_open, low_open]
+    assert ids(priority="High") == [high_open, high_done]
+    assert ids(status="Open", priority="High") == [high_open]
+    assert ids(status=["Open", "Completed"], priority="High") == [high_open, high_done]
+    assert ids(due_after="2024-01-11") == [low_open]
+    assert ids(due_before="2024-01-10") == [high_open]
+    assert ids(author_id=999) == []
+
+
+def test_invalid_parameters_are_rejected(client):
+    for params in (
+        {"cursor": "not-a-cursor"},
+        {"limit": "ten"},
+        {"limit": 0},
+        {"author_id": "me"},
+        {"due_after": "10/01/2024"},
+    ):
+        response = client.get("/api/tickets", query_string=params)
+        assert response.status_code == 400, params
+        assert "error" in response.get_json()
+
+
+def test_limit_is_capped(client, create_ticket):
+    from queries import MAX_PAGE_SIZE
+
+    for _ in range(3):
+        create_ticket()
+    page = client.get("/api/tickets", query_string={"limit": MAX_PAGE_SIZE * 10}).get_json()
+    assert len(page["tickets"]) == 3
@@ -0,0 +1,29 @@
+def search(client, **params):
+    return client.get("/api/tickets/search", query_string=params)
+
+
+def test_ranks_name_matches_first(client, create_ticket):
+    in_description = create_ticket(name="Login page", description="The export crashes")["id"]
+    in_name = create_ticket(name="Export crash", description="Happens on large boards")["id"]
+    create_ticket(name="Unrelated", description="Nothing to see")
+
+    response = search(client, q="crashing export")
+    assert response.status_code == 200
+    assert [t["id"] for t in response.get_json()["tickets"]] == [in_name, in_description]
+
+
+def test_requires_a_query(client):
+    response = search(client, q="  ")
+    assert response.status_code == 400
+
+
+def test_unsupported_database_is_not_an_error(client, monkeypatch):
+    import search as search_module
+    from routes import ticket_routes
+
+    monkeypatch.setattr(
+        ticket_routes, "ticket_search_query", lambda args, dialect_name: search_module.ticket_search_query(args, "mysql")
+    )
+    response = search(client, q="export")
+    assert response.status_code == 501
+    assert response.get_json() == {"error": "Full-text search is not available on mysql."}
@@ -0,0 +1,70 @@
+from collections import Counter
+from datetime import date, timedelta
+
+
+def summary(client, **params):
+    response = client.get("/api/tickets/summary", query_string=params)
+    assert response.status_code == 200, response.get_json()
+    return response.get_json()
+
+
+def test_counts_follow_creates_updates_and_deletes(client, create_ticket):
+    today = date.today()
+    overdue = create_ticket(priority="High", due_date=(today - timedelta(days=2)).isoformat())["id"]
+    due_soon = create_ticket(priority="Low", due_date=(today + timedelta(days=3)).isoformat())["id"]
+    create_ticket(priority="Low")
+
+    counts = summary(client)
+    assert counts["total"] == 3
+    assert counts["open"] == 3
+    assert counts["by_status"] == {"To be done": 3}
+    assert counts["by_priority"] == {"High": 1, "Low": 2}
+    assert (counts["overdue"], counts["due_soon"], counts["no_due_date"]) == (1, 1, 1)
+
+    client.put(f"/api/tickets/{overdue}", json={"status": "Completed"})
+    counts = summary(client)
+    assert counts["total"] == 3
+    assert counts["open"] == 2
+    assert counts["by_status"] == {"To be done": 2, "Completed": 1}
+    assert counts["overdue"] == 0  # Closed tickets aren't overdue
+
+    later = (today + timedelta(days=30)).isoformat()
+    client.put(f"/api/tickets/{due_soon}", json={"priority": "High", "due_date": later})
+    counts = summary(client)
+    assert counts["by_priority"] == {"High": 2, "Low": 1}
+    assert (counts["due_soon"], counts["no_due_date"]) == (0, 1)
+
+    client.delete(f"/api/tickets/{due_soon}")
+    counts = summary(client)
+    assert counts["total"] == 2
+    assert counts["by_priority"] == {"High": 1, "Low": 1}
+
+
+def test_rebuild_finds_no_drift(app, client, create_ticket):
+    from extensions import db
+    from summary import rebuild_summary
+
+    first = create_ticket(priority="High")["id"]
+    create_ticket(status="In progress")
+    client.put(f"/api/tickets/{first}", json={"status": "Completed"})
+
+    with app.app_context(), db.engine.begin() as connection:
+        assert rebuild_summary(connection) == (2, 0)
+
+
+def test_update_then_insert_fallback(app, monkeypatch):
+    from extensions import db
+    from models import TicketSummary
+    from summary import apply_summary_deltas, summary_key
+
+    existing = summary_key("Open", "Low", None)
+    new = summary_key("Open", "High", date(2030, 1, 1))
+    with app.app_context(), db.engine.begin() as connection:
+        apply_summary_deltas(connection, Counter({existing: 2}))
+        # Dialects without ON CONFLICT take the UPDATE-then-INSERT path
+        monkeypatch.setattr(connection.dialect, "name", "mysql")
+        apply_summary_deltas(connection, Counter({existing: -1, new: 3}))
+        monkeypatch.undo()
+        rows = connection.execute(TicketSummary.__table__.select()).all()
+
+    assert {(row.status, row.priority, row.due_day): row.count for row in rows} == {existing: 1, new: 3}
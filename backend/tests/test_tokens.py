@@ -0,0 +1,57 @@
+import time
+from tokens import TokenManager
+from conftest import EMAIL, PASSWORD
+
+
+def login_token(app):
+    response = app.test_client().post("/api/users/login", json={"email": EMAIL, "password": PASSWORD})
+    assert response.status_code == 200
+    return response.get_json()["access_token"]
+
+
+def test_bearer_token_authenticates_without_a_cookie(app, user_id):
+    token = login_token(app)
+    bearer = {"Authorization": f"Bearer {token}"}
+
+    assert app.test_client().get("/api/tickets", headers=bearer).status_code == 200
+    assert app.test_client().get("/api/users/session", headers=bearer).get_json()["id"] == user_id
+    assert app.test_client().get("/api/tickets", headers={"Authorization": "Bearer forged"}).status_code == 401
+
+
+def test_logout_revokes_the_token(app, user_id):
+    bearer = {"Authorization": f"Bearer {login_token(app)}"}
+    assert app.test_client().post("/api/users/logout", headers=bearer).status_code == 200
+    assert app.test_client().get("/api/tickets", headers=bearer).status_code == 401
+
+
+def test_token_expires(monkeypatch):
+    tokens = TokenManager(["key"], max_age=60)
+    token = tokens.issue(7)
+    assert tokens.verify(token) == 7
+
+    issued = time.time()
+    monkeypatch.setattr(time, "time", lambda: issued + 61)
+    assert tokens.verify(token) is None
+
+
+def test_key_rotation():
+    old = TokenManager(["old-key"], max_age=60)
+    rotated = TokenManager(["old-key", "new-key"], max_age=60)
+    new_only = TokenManager(["new-key"], max_age=60)
+
+    old_token = old.issue(1)
+    assert rotated.verify(old_token) == 1
+    assert new_only.verify(old_token) is None
+
+    # Tokens are signed with the newest key, so they survive dropping the old one
+    assert new_only.verify(rotated.issue(2)) == 2
+    assert old.verify(rotated.issue(2)) is None
+
+
+def test_revocation_is_per_token():
+    tokens = TokenManager(["key"], max_age=60)
+    revoked, kept = tokens.issue(1), tokens.issue(1)
+    tokens.revoke(revoked)
+    tokens.revoke("not-a-token")
+    assert tokens.verify(revoked) is None
+    assert tokens.verify(kept) == 1
@@ -0,0 +1,98 @@
+import secrets
+import threading
+import time
+from flask import current_app
+from itsdangerous import BadSignature, URLSafeTimedSerializer
+
+
+class Denylist:
+    """
+    In-memory set of revoked token ids, each kept only until its token would expire anyway.
+
+    Revocations are per process; with several workers, pair short token
+    lifetimes with this list rather than relying on it alone.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def add(self, token_id, expires_at):
+        now = time.time()
+        with self._lock:
+            self._entries[token_id] = expires_at
+            expired = [key for key, expiry in self._entries.items() if expiry <= now]
+            for key in expired:
+                del self._entries[key]
+
+    def __contains__(self, token_id):
+        return token_id in self._entries
+
+
+class TokenManager:
+    """
+    Issues and verifies HMAC-signed, expiring access tokens.
+
+    Verification is a signature and timestamp check with no storage access.
+    `secret_keys` is ordered oldest to newest: tokens are signed with the
+    newest key and accepted under any of them, so keys can be rotated by
+    appending a new one and dropping the oldest after `max_age` seconds.
+
+    Args:
+        secret_keys (list): Signing keys, newest last.
+        max_age (int): Token lifetime in seconds.
+    """
+
+    def __init__(self, secret_keys, max_age):
+        self.serializer = URLSafeTimedSerializer(secret_keys, salt="access-token")
+        self.max_age = max_age
+        self.denylist = Denylist()
+
+    def issue(self, user_id):
+        """Return a new signed token for `user_id`."""
+        return self.serializer.dumps({"sub": user_id, "jti": secrets.token_urlsafe(8)})
+
+    def _load(self, token):
+        try:
+            return self.serializer.loads(token, max_age=self.max_age, return_timestamp=True)
+        except (BadSignature, TypeError, ValueError):
+            return None, None
+
+    def verify(self, token):
+        """
+        Return the user id a token was issued for, or None if it is invalid,
+        expired or revoked.
+        """
+        claims, _ = self._load(token)
+        if not claims or claims.get("jti") in self.denylist:
+            return None
+        return claims.get("sub")
+
+    def revoke(self, token):
+        """Deny a token until it expires. Invalid tokens are ignored."""
+        claims, issued_at = self._load(token)
+        if claims:
+            self.denylist.add(claims["jti"], issued_at.timestamp() + self.max_age)
+
+
+def init_tokens(app):
+    """
+    Configure the access token manager from `TOKEN_SECRET_KEYS` and `TOKEN_MAX_AGE`.
+
+    Args:
+        app (Flask): The Flask application instance.
+    """
+    keys = app.config.get("TOKEN_SECRET_KEYS") or [app.config["SECRET_KEY"]]
+    app.extensions["tokens"] = TokenManager(keys, app.config["TOKEN_MAX_AGE"])
+
+
+def get_token_manager():
+    return current_app.extensions["tokens"]
+
+
+def bearer_token(request):
+    """Return the token from an `Authorization: Bearer` header, or None."""
+    auth_header = request.headers.get("Authorization", "")
+    if auth_header.startswith("Bearer "):
+        return auth_header[len("Bearer "):].strip() or None
+    return None
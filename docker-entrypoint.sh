@@ -8,19 +8,11 @@ while ! pg_isready -h db -p 5432 -U postgres; do
 done
 echo "PostgreSQL started"
 
-# Install latest requirements (for development convenience)
-pip install -r requirements.txt
+# Requirements are installed into the image at build time (see Dockerfile.backend);
+# rebuild the image after changing requirements.txt.
 
-# Create fresh database schema (Skip migrations for first run)
-echo "Creating database schema..."
-python -c "
-from app import create_app
-from extensions import db
-app = create_app()
-with app.app_context():
-    db.create_all()
-    print('Database tables created successfully!')
-"
+# Create or migrate the schema only when it is behind the latest revision
+flask --app app:create_app schema ensure
 
 # Start application
-python app.py
\ No newline at end of file
+exec python app.py
@@ -41,11 +41,13 @@ export const AuthProvider = ({ children }) => {
       // Get the user from localStorage for auth header fallback
       const storedUser = localStorage.getItem('dash_user');
       let authHeader = '';
+      let accessToken = null;
       if (storedUser) {
         try {
           const user = JSON.parse(storedUser);
-          // Simple token using user ID - in a real app, use a proper JWT
-          authHeader = `Bearer user-${user.id}`;
+          // Signed access token issued by the login endpoint
+          accessToken = user.access_token || null;
+          if (accessToken) authHeader = `Bearer ${accessToken}`;
         } catch (err) {
           console.error("Failed to parse stored user:", err);
         }
@@ -65,7 +67,7 @@ export const AuthProvider = ({ children }) => {
           const data = await response.json();
           console.log("Session validation response:", data);
           if (data?.id && data?.name && data?.email) {
-            persistUser(data);
+            persistUser({ ...data, access_token: accessToken });
             return true;
           } else {
             clearUser();
@@ -74,30 +76,6 @@ export const AuthProvider = ({ children }) => {
           clearUser();
         }
       } else {
-        // Try one more time with auth header if we didn't use it and have stored user
-        if (!authHeader && storedUser) {
-          try {
-            const user = JSON.parse(storedUser);
-            const retryHeader = `Bearer user-${user.id}`;
-            const retryResponse = await fetch(`${API_BASE_URL}/users/session`, {
-              credentials: "include",
-              headers: {
-                "Origin": window.location.origin,
-                'Authorization': retryHeader
-              }
-            });
-            
-            if (retryResponse.ok) {
-              const data = await retryResponse.json();
-              if (data?.id && data?.name && data?.email) {
-                persistUser(data);
-                return true;
-              }
-            }
-          } catch (err) {
-            console.error("Error during session retry:", err);
-          }
-        }
         clearUser();
       }
       return false;
@@ -140,8 +118,8 @@ export const AuthProvider = ({ children }) => {
           return false;
         }
 
-        // Set user data first
-        persistUser(userData);
+        // Set user data first, keeping the access token for the Authorization header
+        persistUser({ ...userData, access_token: data.access_token });
         
         // Navigate after successful login
         const from = location.state?.from?.pathname || "/";
@@ -175,9 +153,11 @@ export const AuthProvider = ({ children }) => {
       setLoading(true);
       console.log("Logging out...");
       
+      // Send the access token so the server revokes it
       await fetch(`${API_BASE_URL}/users/logout`, {
         method: "POST",
         credentials: "include",
+        headers: user?.access_token ? { 'Authorization': `Bearer ${user.access_token}` } : {},
       });
       
       clearUser();
@@ -10,7 +10,7 @@ const TaskContext = createContext();
  * Centralizes task management to prevent duplicate API calls.
  */
 export const TaskProvider = ({ children }) => {
-  const { tasks, fetchTasks, saveTask, loading, error } = useTasks();
+  const { tasks, fetchTasks, syncTasks, applyTicketEvent, saveTask, loading, error } = useTasks();
   const [currentTicket, setCurrentTicket] = useState(null);
   
   return (
@@ -18,6 +18,8 @@ export const TaskProvider = ({ children }) => {
       value={{
         tasks,
         fetchTasks,
+        syncTasks,
+        applyTicketEvent,
         saveTask,
         currentTicket,
         setCurrentTicket,
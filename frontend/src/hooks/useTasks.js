@@ -1,12 +1,14 @@
 import { useState, useEffect, useCallback, useRef } from "react";
 
 const API_BASE_URL = 'http://127.0.0.1:5001/api';
+const PAGE_SIZE = 200;
 
 const useTasks = () => {
   const [tasks, setTasks] = useState([]);
   const [loading, setLoading] = useState(false);
   const [error, setError] = useState(null);
   const fetchInProgressRef = useRef(false);
+  const changeCursorRef = useRef(null);
 
   // Fetch tasks from the API
   const fetchTasks = useCallback(async () => {
@@ -27,28 +29,41 @@ const useTasks = () => {
       if (storedUser) {
         try {
           const user = JSON.parse(storedUser);
-          // Simple "token" using user ID - in a real app, use a proper JWT
-          authHeader = `Bearer user-${user.id}`;
+          // Signed access token issued by the login endpoint
+          if (user.access_token) authHeader = `Bearer ${user.access_token}`;
         } catch (err) {
           console.error("Failed to parse stored user:", err);
         }
       }
 
-      const response = await fetch(`${API_BASE_URL}/tickets`, {
-        method: "GET",
-        credentials: "include",
-        headers: {
-          ...(authHeader ? { 'Authorization': authHeader } : {})
+      // Page through the list using the server's keyset cursor
+      const allTasks = [];
+      let cursor = null;
+      do {
+        const params = new URLSearchParams({ limit: PAGE_SIZE });
+        if (cursor) params.set("cursor", cursor);
+
+        const response = await fetch(`${API_BASE_URL}/tickets?${params}`, {
+          method: "GET",
+          credentials: "include",
+          headers: {
+            ...(authHeader ? { 'Authorization': authHeader } : {})
+          }
+        });
+
+        if (!response.ok) {
+          console.error("Failed to fetch tasks. Status:", response.status);
+          setError(`Failed to fetch tasks: ${response.status}`);
+          return;
         }
-      });
-  
-      if (response.ok) {
+
         const data = await response.json();
-        setTasks(data);
-      } else {
-        console.error("Failed to fetch tasks. Status:", response.status);
-        setError(`Failed to fetch tasks: ${response.status}`);
-      }
+        allTasks.push(...data.tickets);
+        if (!cursor) changeCursorRef.current = data.change_cursor;
+        cursor = data.next_cursor;
+      } while (cursor);
+
+      setTasks(allTasks);
     } catch (error) {
       console.error("Error fetching tasks:", error);
       setError("Error fetching tasks. Please try again.");
@@ -58,6 +73,79 @@ const useTasks = () => {
     }
   }, []);
 
+  // Apply only the changes since the last fetch/sync, falling back to a full fetch
+  const syncTasks = useCallback(async () => {
+    if (changeCursorRef.current === null) {
+      return fetchTasks();
+    }
+
+    try {
+      const storedUser = localStorage.getItem('dash_user');
+      let authHeader = '';
+      if (storedUser) {
+        try {
+          const user = JSON.parse(storedUser);
+          if (user.access_token) authHeader = `Bearer ${user.access_token}`;
+        } catch (err) {
+          console.error("Failed to parse stored user:", err);
+        }
+      }
+
+      let hasMore = true;
+      while (hasMore) {
+        const response = await fetch(
+          `${API_BASE_URL}/tickets/changes?since=${changeCursorRef.current}&limit=${PAGE_SIZE}`,
+          {
+            credentials: "include",
+            headers: {
+              ...(authHeader ? { 'Authorization': authHeader } : {})
+            }
+          }
+        );
+
+        if (response.status === 410) {
+          // Our cursor predates the retained deletion history
+          changeCursorRef.current = null;
+          return fetchTasks();
+        }
+        if (!response.ok) {
+          console.error("Failed to sync tasks. Status:", response.status);
+          return fetchTasks();
+        }
+
+        const data = await response.json();
+        const changed = new Map(data.tickets.map((ticket) => [ticket.id, ticket]));
+        const deleted = new Set(data.deleted);
+        setTasks((current) => {
+          const kept = current.filter((task) => !deleted.has(task.id) && !changed.has(task.id));
+          return [...kept, ...changed.values()]
+            .sort((a, b) => (a.created_at || "").localeCompare(b.created_at || "") || a.id - b.id);
+        });
+        changeCursorRef.current = data.cursor;
+        hasMore = data.has_more;
+      }
+    } catch (error) {
+      console.error("Error syncing tasks:", error);
+      return fetchTasks();
+    }
+  }, [fetchTasks]);
+
+  // Apply one pushed change from the /tickets/events stream
+  const applyTicketEvent = useCallback((seq, change) => {
+    setTasks((current) => {
+      if (change.op === "delete") {
+        return current.filter((task) => task.id !== change.id);
+      }
+      const exists = current.some((task) => task.id === change.ticket.id);
+      return exists
+        ? current.map((task) => (task.id === change.ticket.id ? change.ticket : task))
+        : [...current, change.ticket];
+    });
+    if (changeCursorRef.current !== null && seq > changeCursorRef.current) {
+      changeCursorRef.current = seq;
+    }
+  }, []);
+
   // Save a task (create or update)
   const saveTask = async (taskData) => {
     try {
@@ -80,7 +168,7 @@ const useTasks = () => {
       if (storedUser) {
         try {
           const user = JSON.parse(storedUser);
-          authHeader = `Bearer user-${user.id}`;
+          if (user.access_token) authHeader = `Bearer ${user.access_token}`;
         } catch (err) {
           console.error("Failed to parse stored user:", err);
         }
@@ -97,7 +185,7 @@ const useTasks = () => {
       });
 
       if (response.ok) {
-        await fetchTasks(); // Refresh tasks after saving
+        await syncTasks(); // Pull in just the changes after saving
         return true;
       } else {
         setError(`Error saving task: ${response.statusText}`);
@@ -115,6 +203,8 @@ const useTasks = () => {
   return { 
     tasks, 
     fetchTasks, 
+    syncTasks,
+    applyTicketEvent,
     saveTask,
     loading,
     error
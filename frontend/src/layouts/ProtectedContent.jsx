@@ -22,6 +22,7 @@ import CreateButton from '../components/Buttons/CreateButton';
 import { useModalContext } from '../contexts/ModalProvider';
 import { useTheme } from '../contexts/ThemeProvider';
 import LoadingState from '../components/LoadingState';
+import { API_BASE_URL } from '../utils/config';
 import RefreshIcon from '@mui/icons-material/Refresh';
 import NoteAddIcon from '@mui/icons-material/NoteAdd';
 
@@ -32,7 +33,7 @@ import NoteAddIcon from '@mui/icons-material/NoteAdd';
  * Handles task management operations and routing between authenticated views.
  */
 const ProtectedContent = () => {
-  const { fetchTasks, tasks, saveTask, loading, error } = useTaskContext();
+  const { fetchTasks, syncTasks, applyTicketEvent, tasks, saveTask, loading, error } = useTaskContext();
   const { user, logout } = useAuth();
   const navigate = useNavigate();
   const { mode, toggleTheme } = useTheme();
@@ -51,6 +52,19 @@ const ProtectedContent = () => {
     }
   }, []);
 
+  // Receive ticket changes pushed by the server instead of refetching.
+  // EventSource reconnects on its own and resumes via Last-Event-ID.
+  useEffect(() => {
+    if (!user) return undefined;
+
+    const source = new EventSource(`${API_BASE_URL}/tickets/events`, { withCredentials: true });
+    source.addEventListener("ticket", (event) => {
+      applyTicketEvent(Number(event.lastEventId), JSON.parse(event.data));
+    });
+    source.addEventListener("resync", () => fetchTasks());
+    return () => source.close();
+  }, [user, applyTicketEvent, fetchTasks]);
+
   // Handle user logout
   const handleLogout = () => {
     logout();
@@ -102,7 +116,7 @@ const ProtectedContent = () => {
           method: "DELETE",
           credentials: "include",
         });
-        fetchTasks();
+        syncTasks();
         deleteModal.closeModal();
         showNotification("Task deleted successfully", "success");
       }